@@ -0,0 +1,116 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Time set and dict operations on large collections of `DataCoordinate`
+and `DatasetRef` objects.
+
+The operations are the ones graph-building code runs on data IDs and refs:
+building sets and dicts, membership tests with equal but distinct objects,
+repeated lookups with the same objects, and set intersection.  The same
+operations on plain tuples of the same values are timed as a lower bound.
+No registry is needed; the data IDs use the default dimension universe.
+
+To compare implementations, run the script at each revision of interest
+(e.g. before and after a change to ``DataCoordinate.__hash__``) with the
+same ``--size``; the reported times are the best of ``--repeat`` runs.
+"""
+
+import argparse
+import timeit
+
+from lsst.daf.butler import DataCoordinate, DatasetRef, DatasetType, DimensionUniverse
+
+
+def makeDataIds(graph, size):
+    """Return ``size`` new exposure+detector data IDs."""
+    return [DataCoordinate.fromRequiredValues(graph, ("HSC", exposure, detector))
+            for exposure in range(size // 100) for detector in range(100)]
+
+
+def makeRefs(datasetType, dataIds):
+    """Return a resolved ref for each data ID."""
+    return [DatasetRef(datasetType, dataId, id=i, run="bench", conform=False)
+            for i, dataId in enumerate(dataIds)]
+
+
+def bench(name, setup, size, repeat):
+    """Time each operation for one kind of object and print the results."""
+    first, second = setup()
+    firstSet = set(first)
+    firstDict = {x: None for x in first}
+
+    def fresh(op):
+        # Each run gets objects that have never been hashed.
+        def run():
+            a, b = setup()
+            start = timeit.default_timer()
+            op(a, b)
+            return timeit.default_timer() - start
+        return min(run() for _ in range(repeat))
+
+    def warm(stmt):
+        return min(timeit.repeat(stmt, number=1, repeat=repeat))
+
+    results = {
+        "build set": fresh(lambda a, b: set(a)),
+        "build dict": fresh(lambda a, b: {x: None for x in a}),
+        "membership": fresh(lambda a, b: sum(x in firstSet for x in b)),
+        "intersection": fresh(lambda a, b: set(a) & set(b)),
+        "repeated lookup": warm(lambda: [firstDict[x] for x in second]),
+        "repeated intersection": warm(lambda: firstSet.intersection(second)),
+    }
+    for operation, seconds in results.items():
+        print(f"{name:<16}{operation:<24}{seconds * 1e3:>10.2f} ms{seconds / size * 1e9:>10.0f} ns/item")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=100000,
+                        help="Number of data IDs or refs in each collection (a multiple of 100).")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times to run each operation.")
+    args = parser.parse_args()
+
+    universe = DimensionUniverse()
+    graph = universe.extract(["exposure", "detector"])
+    datasetType = DatasetType("raw", graph, "Exposure", universe=universe)
+
+    def dataIds():
+        # Two independent lists of equal objects, so lookups can't take the
+        # identity fast path.
+        return makeDataIds(graph, args.size), makeDataIds(graph, args.size)
+
+    def refs():
+        return (makeRefs(datasetType, makeDataIds(graph, args.size)),
+                makeRefs(datasetType, makeDataIds(graph, args.size)))
+
+    def tuples():
+        # Build new tuple objects each time, as for the data IDs.
+        return ([("HSC", exposure, detector)
+                 for exposure in range(args.size // 100) for detector in range(100)],
+                [("HSC", exposure, detector)
+                 for exposure in range(args.size // 100) for detector in range(100)])
+
+    for name, setup in (("DataCoordinate", dataIds), ("DatasetRef", refs), ("tuple", tuples)):
+        bench(name, setup, args.size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Time the per-ref configuration lookups that a file datastore makes
+when it reads or writes a dataset.
+
+The formatter factory, file templates, constraints and composites map are
+built from the default ``datastores/fileDatastore.yaml`` configuration, as
+`FileDatastore` does.  For each ref the script looks up its formatter
+class, its file template, whether it is accepted and whether it should be
+disassembled.  The refs cover several dataset types and instruments.
+
+Two timings are reported: with the lookup caches in place, and with all of
+them cleared before each ref, which is the cost of a lookup that has not
+been seen before (and approximately the cost without caching).
+"""
+
+import argparse
+import timeit
+
+from lsst.daf.butler import (
+    CompositesMap,
+    Config,
+    Constraints,
+    DatasetRef,
+    DatasetType,
+    DimensionUniverse,
+    FileTemplates,
+    FormatterFactory,
+    StorageClassConfig,
+    StorageClassFactory,
+)
+from lsst.daf.butler.core.datasets.ref import _lookupNamesWithInstrument
+
+# Storage classes whose default formatters are in this package, so that
+# looking them up does not need other packages to be installed.
+STORAGE_CLASSES = ("StructuredDataDict", "NumpyArray", "SkyMap", "ExposureSummaryStats")
+
+
+class LookupSystems:
+    """The configuration lookup systems of a default file datastore."""
+
+    def __init__(self, universe):
+        config = Config("resource://lsst.daf.butler/configs/datastores/fileDatastore.yaml")["datastore"]
+        self.formatterFactory = FormatterFactory()
+        self.formatterFactory.registerFormatters(config["formatters"], universe=universe)
+        self.templates = FileTemplates(config["templates"], universe=universe)
+        self.constraints = Constraints(config.get("constraints"), universe=universe)
+        self.composites = CompositesMap(config["composites"], universe=universe)
+
+    def lookup(self, ref):
+        """Make all the lookups for one ref."""
+        self.formatterFactory.getFormatterClassWithMatch(ref)
+        self.templates.getTemplateWithMatch(ref)
+        self.constraints.isAcceptable(ref)
+        self.composites.shouldBeDisassembled(ref)
+
+    def clearCaches(self):
+        """Clear all the lookup caches."""
+        _lookupNamesWithInstrument.cache_clear()
+        self.formatterFactory._mappingFactory._matchCache.clear()
+        self.templates._matchCache.clear()
+        self.constraints._cache.clear()
+        self.composites._matchCache.clear()
+
+
+def makeRefs(universe, nInstruments, nPerType):
+    """Return refs for several dataset types and instruments."""
+    dimensions = universe.extract(["visit", "detector"])
+    refs = []
+    for storageClassName in STORAGE_CLASSES:
+        datasetType = DatasetType(f"bench_{storageClassName}", dimensions, storageClassName,
+                                  universe=universe)
+        for instrument in range(nInstruments):
+            for i in range(nPerType):
+                dataId = {"instrument": f"Cam{instrument}", "visit": i // 100, "detector": i % 100}
+                refs.append(DatasetRef(datasetType, dataId, id=len(refs), run="bench", conform=False))
+    return refs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--instruments", type=int, default=3, help="Number of instruments.")
+    parser.add_argument("--refs", type=int, default=1000,
+                        help="Number of refs for each dataset type and instrument.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times to run each timing.")
+    args = parser.parse_args()
+
+    universe = DimensionUniverse()
+    StorageClassFactory().addFromConfig(StorageClassConfig())
+    systems = LookupSystems(universe)
+    refs = makeRefs(universe, args.instruments, args.refs)
+
+    def cached():
+        for ref in refs:
+            systems.lookup(ref)
+
+    def uncached():
+        for ref in refs:
+            systems.clearCaches()
+            systems.lookup(ref)
+
+    def clearOnly():
+        for ref in refs:
+            systems.clearCaches()
+
+    # Fill the caches before timing the cached lookups.
+    cached()
+    results = {name: min(timeit.repeat(func, number=1, repeat=args.repeat))
+               for name, func in (("cached", cached), ("uncached", uncached), ("clear only", clearOnly))}
+    # Don't count the time spent clearing the caches.
+    results["uncached"] -= results.pop("clear only")
+    for name, seconds in results.items():
+        print(f"{name:<10}{seconds / len(refs) * 1e6:>10.2f} us/ref")
+    print(f"speedup   {results['uncached'] / results['cached']:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
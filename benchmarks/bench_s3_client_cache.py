@@ -0,0 +1,130 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Time `ButlerS3URI` operations with and without the S3 client cache.
+
+By default the operations run against moto's in-process S3 mock, so they
+measure the cost of creating a client (credential resolution and botocore
+service model loading) but not of connection setup.  To include the TLS
+handshake and network round trips, pass ``--endpoint`` (or ``--aws``) and
+the name of an existing, writeable ``--bucket``; the AWS credentials are
+then taken from the environment as usual.
+
+For each operation the script reports the mean time per call with the
+client cache in place, and with a new client created for every call, as
+`getS3Client` did before clients were cached.
+"""
+
+import argparse
+import contextlib
+import os
+import timeit
+import unittest.mock
+import uuid
+
+from lsst.daf.butler import ButlerURI
+from lsst.daf.butler.core._butlerUri import s3utils
+
+
+class _NoCache(dict):
+    """A client cache that never keeps anything."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+@contextlib.contextmanager
+def mockS3(bucket):
+    """Run the benchmark against moto, with an empty bucket."""
+    from moto import mock_s3
+
+    with mock_s3():
+        usingDummyCredentials = s3utils.setAwsEnvCredentials()
+        try:
+            s3utils.getS3Client().create_bucket(Bucket=bucket)
+            yield
+        finally:
+            if usingDummyCredentials:
+                s3utils.unsetAwsEnvCredentials()
+
+
+def makeOperations(bucket, prefix, nObjects):
+    """Return a `dict` mapping an operation name to a function that runs it
+    once on each of ``nObjects`` objects.
+    """
+    uris = [ButlerURI(f"s3://{bucket}/{prefix}/object{i}.dat") for i in range(nObjects)]
+    data = os.urandom(1024)
+
+    def write():
+        for uri in uris:
+            uri.write(data)
+
+    def exists():
+        for uri in uris:
+            uri.exists()
+
+    def read():
+        for uri in uris:
+            uri.read()
+
+    def getClient():
+        for _ in uris:
+            s3utils.getS3Client()
+
+    return {"getS3Client": getClient, "write": write, "exists": exists, "read": read}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--objects", type=int, default=100, help="Number of objects to use.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of times to run each timing.")
+    parser.add_argument("--endpoint", default=None, help="S3 endpoint URL to use instead of moto.")
+    parser.add_argument("--aws", action="store_true", help="Use the default AWS endpoint instead of moto.")
+    parser.add_argument("--bucket", default="bench-s3-client-cache",
+                        help="Bucket to use; must exist unless moto is used.")
+    args = parser.parse_args()
+
+    if args.endpoint:
+        os.environ["S3_ENDPOINT_URL"] = args.endpoint
+    useMoto = not (args.endpoint or args.aws)
+    prefix = f"bench_s3_client_cache/{uuid.uuid4().hex}"
+    with (mockS3(args.bucket) if useMoto else contextlib.nullcontext()):
+        operations = makeOperations(args.bucket, prefix, args.objects)
+        results = {}
+        for name, func in operations.items():
+            with unittest.mock.patch.object(s3utils, "_clientCache", _NoCache()):
+                uncached = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            func()
+            cached = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            results[name] = (cached, uncached)
+        if not useMoto:
+            client = s3utils.getS3Client()
+            for i in range(args.objects):
+                client.delete_object(Bucket=args.bucket, Key=f"{prefix}/object{i}.dat")
+
+    print(f"{'operation':<14}{'cached':>12}{'uncached':>12}{'speedup':>10}")
+    for name, (cached, uncached) in results.items():
+        print(f"{name:<14}{cached / args.objects * 1e3:>9.3f} ms{uncached / args.objects * 1e3:>9.3f} ms"
+              f"{uncached / cached:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
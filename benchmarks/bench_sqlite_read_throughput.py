@@ -0,0 +1,150 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Measure read throughput of a SQLite registry database from several
+processes at once, for each of the ``engine_options`` profiles.
+
+Each worker process opens its own read-only `SqliteDatabase` and runs
+small primary-key lookups, some of them inside read-only transactions, for
+a fixed time.  The total number of queries per second over all workers is
+reported for each profile.  Run with ``--help`` for the options; in
+particular, use ``--dir`` to put the database on the file system of
+interest (e.g. a network mount), since the results depend strongly on it.
+WAL profiles are skipped with ``--no-wal``, which should be used on
+network file systems.
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+import sqlalchemy
+
+from lsst.daf.butler import ddl
+from lsst.daf.butler.registry.databases.sqlite import SqliteDatabase
+
+PROFILES = {
+    "default": {},
+    "pool": {"poolSize": 5},
+    "pool+pragmas": {"poolSize": 5,
+                     "pragmas": {"mmap_size": 268435456, "cache_size": -65536, "temp_store": "MEMORY"}},
+    "pool+pragmas+wal": {"poolSize": 5,
+                         "pragmas": {"mmap_size": 268435456, "cache_size": -65536, "temp_store": "MEMORY",
+                                     "journal_mode": "WAL", "synchronous": "NORMAL"}},
+}
+
+TABLE_SPEC = ddl.TableSpec(
+    fields=[
+        ddl.FieldSpec("id", dtype=sqlalchemy.BigInteger, primaryKey=True),
+        ddl.FieldSpec("name", dtype=sqlalchemy.String, length=64, nullable=False),
+        ddl.FieldSpec("value", dtype=sqlalchemy.Float, nullable=False),
+    ]
+)
+
+
+def makeDatabase(filename, nRows, engineOptions):
+    """Create a new database file with ``nRows`` rows in the benchmark
+    table.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(filename + suffix):
+            os.remove(filename + suffix)
+    db = SqliteDatabase.fromEngine(SqliteDatabase.makeEngine(filename=filename, **engineOptions), origin=0)
+    with db.declareStaticTables(create=True) as context:
+        table = context.addTable("bench", TABLE_SPEC)
+    db.insert(table, *[{"id": i, "name": f"row{i}", "value": float(i)} for i in range(nRows)])
+
+
+def worker(filename, nRows, engineOptions, duration, start, queue):
+    """Run lookups for ``duration`` seconds, after ``start``, and put the
+    number of queries run on ``queue``.
+    """
+    db = SqliteDatabase.fromEngine(
+        SqliteDatabase.makeEngine(filename=filename, writeable=False, **engineOptions),
+        origin=0, writeable=False,
+    )
+    with db.declareStaticTables(create=False) as context:
+        table = context.addTable("bench", TABLE_SPEC)
+    sql = table.select().where(table.columns.id == sqlalchemy.sql.bindparam("id"))
+    rng = random.Random(os.getpid())
+    while time.time() < start:
+        time.sleep(0.001)
+    end = start + duration
+    count = 0
+    iteration = 0
+    while time.time() < end:
+        # Alternate between plain queries and short read-only transactions
+        # that run a few queries each, as registry lookups do.
+        iteration += 1
+        if iteration % 2:
+            with db.transaction():
+                for _ in range(4):
+                    db.query(sql, id=rng.randrange(nRows)).fetchall()
+            count += 4
+        else:
+            db.query(sql, id=rng.randrange(nRows)).fetchall()
+            count += 1
+    queue.put(count)
+
+
+def run(filename, nRows, profile, nProcesses, duration):
+    """Return the total queries per second over ``nProcesses`` workers."""
+    engineOptions = PROFILES[profile]
+    # The writeable connection sets the (persistent) journal mode.
+    makeDatabase(filename, nRows, engineOptions)
+    queue = multiprocessing.Queue()
+    start = time.time() + 1.0
+    processes = [multiprocessing.Process(target=worker,
+                                         args=(filename, nRows, engineOptions, duration, start, queue))
+                 for _ in range(nProcesses)]
+    for process in processes:
+        process.start()
+    total = sum(queue.get() for _ in processes)
+    for process in processes:
+        process.join()
+    return total / duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dir", default=None,
+                        help="Directory for the database file (default: a temporary directory).")
+    parser.add_argument("--rows", type=int, default=100000, help="Number of rows in the table.")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 4, 8],
+                        help="Numbers of concurrent reader processes to try.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to run each measurement.")
+    parser.add_argument("--no-wal", action="store_true", help="Skip profiles that enable WAL.")
+    args = parser.parse_args()
+
+    profiles = [p for p in PROFILES if not (args.no_wal and "wal" in p)]
+    with tempfile.TemporaryDirectory(dir=args.dir) as root:
+        filename = os.path.join(root, "bench.sqlite3")
+        print(f"{'profile':<20}" + "".join(f"{n:>10d}p" for n in args.processes) + "  (queries/s)")
+        for profile in profiles:
+            rates = [run(filename, args.rows, profile, n, args.duration) for n in args.processes]
+            print(f"{profile:<20}" + "".join(f"{rate:>11.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,5 +11,6 @@ from .registry import Registry, RegistryConfig, CollectionType, CollectionSearch
 from ._butlerConfig import *
 from ._deferredDatasetHandle import *
 from ._butler import *
-from .transfers import YamlRepoExportBackend, YamlRepoImportBackend
+from .transfers import (JsonLinesRepoExportBackend, JsonLinesRepoImportBackend, YamlRepoExportBackend,
+                        YamlRepoImportBackend)
 from .version import *
@@ -847,6 +847,65 @@ class Butler:
 
         return ref
 
+    @transactional
+    def putMany(self, items: Iterable[Tuple[Any, DatasetRef]], *,
+                run: Optional[str] = None) -> List[DatasetRef]:
+        """Store and register multiple datasets.
+
+        This is equivalent to calling `put` for each dataset, but registry
+        and datastore records are inserted with one bulk operation per
+        dataset type instead of one per dataset.
+
+        Parameters
+        ----------
+        items : iterable of `tuple` [`object`, `DatasetRef`]
+            Pairs of the dataset to store and an unresolved `DatasetRef`
+            identifying it.
+        run : `str`, optional
+            The name of the run the datasets should be added to, overriding
+            ``self.run``.
+
+        Returns
+        -------
+        refs : `list` [`DatasetRef`]
+            Resolved references to the stored datasets, in the same order as
+            ``items``.
+
+        Raises
+        ------
+        TypeError
+            Raised if the butler is read-only or if no run has been provided.
+        ValueError
+            Raised if any of the given `DatasetRef` instances is already
+            resolved.
+        """
+        log.debug("Butler putMany, run=%s", run)
+        if not self.isWriteable():
+            raise TypeError("Butler is read-only.")
+        items = list(items)
+
+        # Group the datasets by dataset type (remembering their positions) so
+        # each type can be inserted into the registry with a single call.
+        indicesByType: Dict[DatasetType, List[int]] = defaultdict(list)
+        for index, (_, refIn) in enumerate(items):
+            if refIn.id is not None:
+                raise ValueError(f"DatasetRef {refIn} must not be in registry, must have None id")
+            datasetType, _ = self._standardizeArgs(refIn)
+            indicesByType[datasetType].append(index)
+
+        # Add Registry Dataset entries.
+        refsByIndex: Dict[int, DatasetRef] = {}
+        for datasetType, indices in indicesByType.items():
+            refs = self.registry.insertDatasets(datasetType, run=run,
+                                                dataIds=[items[i][1].dataId for i in indices])
+            refsByIndex.update(zip(indices, refs))
+        resolved = [refsByIndex[i] for i in range(len(items))]
+
+        # Add Datastore entries.
+        self.datastore.putMany((obj, ref) for (obj, _), ref in zip(items, resolved))
+
+        return resolved
+
     def getDirect(self, ref: DatasetRef, *, parameters: Optional[Dict[str, Any]] = None) -> Any:
         """Retrieve a stored dataset.
 
@@ -1002,6 +1061,65 @@ class Butler:
         ref = self._findDatasetRef(datasetRefOrType, dataId, collections=collections, **kwds)
         return self.getDirect(ref, parameters=parameters)
 
+    def getMany(self, refs: Iterable[DatasetRef], *,
+                parameters: Optional[Dict[str, Any]] = None,
+                collections: Any = None) -> List[Any]:
+        """Retrieve multiple stored datasets.
+
+        Parameters
+        ----------
+        refs : iterable of `DatasetRef`
+            References to the datasets to retrieve.  Resolved references are
+            read directly, as in `getDirect`; unresolved references are first
+            looked up in the registry, as in `get`.
+        parameters : `dict`, optional
+            Additional StorageClass-defined options to control reading,
+            typically used to efficiently read only a subset of the datasets.
+            The same parameters are applied to every dataset.
+        collections : Any, optional
+            Collections to be searched for unresolved references, overriding
+            ``self.collections``.  Can be any of the types supported by the
+            ``collections`` argument to butler construction.
+
+        Returns
+        -------
+        objs : `list` [`object`]
+            The datasets, in the same order as ``refs``.
+
+        Raises
+        ------
+        LookupError
+            Raised if no matching dataset exists in the `Registry` for one of
+            the unresolved references.
+        FileNotFoundError
+            Raised if one of the datasets can not be retrieved from the
+            datastore.
+
+        Notes
+        -----
+        Unresolved references to calibration datasets are looked up using
+        only the dimensions of their dataset type, so they can not be used to
+        search `~CollectionType.CALIBRATION` collections; use `get` with a
+        temporal data ID for those.
+        """
+        resolved = list(refs)
+        # Look up unresolved references with one registry query per dataset
+        # type, instead of one per reference.
+        unresolvedByType: Dict[DatasetType, List[int]] = defaultdict(list)
+        for i, ref in enumerate(resolved):
+            if ref.id is None:
+                unresolvedByType[ref.datasetType].append(i)
+        for datasetType, indices in unresolvedByType.items():
+            found = self.registry.findDatasets(datasetType, [resolved[i].dataId for i in indices],
+                                               collections=collections)
+            for i in indices:
+                ref = found.get(resolved[i].dataId)
+                if ref is None:
+                    raise LookupError(f"Dataset {datasetType.name} with data ID {resolved[i].dataId} "
+                                      f"could not be found in collections {collections}.")
+                resolved[i] = ref
+        return self.datastore.getMany(resolved, parameters=parameters)
+
     def getURIs(self, datasetRefOrType: Union[DatasetRef, DatasetType, str],
                 dataId: Optional[DataId] = None, *,
                 predict: bool = False,
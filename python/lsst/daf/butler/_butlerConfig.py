@@ -27,8 +27,15 @@ from __future__ import annotations
 __all__ = ("ButlerConfig",)
 
 import copy
+import hashlib
+import logging
+import os
 import os.path
+import pickle
+import sys
+import tempfile
 from typing import (
+    Dict,
     Optional,
     Sequence,
     Union,
@@ -40,12 +47,152 @@ from .core import (
     DatastoreConfig,
     StorageClassConfig,
 )
+from .core.config import CONFIG_PATH, recordConfigFiles
 from .registry import RegistryConfig
 from .transfers import RepoTransferFormatConfig
+from .version import __version__
 
 CONFIG_COMPONENT_CLASSES = (RegistryConfig, StorageClassConfig,
                             DatastoreConfig, RepoTransferFormatConfig)
 
+CONFIG_CACHE_DIR = "DAF_BUTLER_CONFIG_CACHE_DIR"
+"""Environment variable naming a directory in which to cache the fully
+merged configurations made by `ButlerConfig`."""
+
+_CONFIG_CACHE_VERSION = 1
+"""Version of the format of the cached configurations; increment when it
+changes."""
+
+log = logging.getLogger(__name__)
+
+
+def _configCacheFile(other: Optional[Union[str, ButlerURI]],
+                     searchPaths: Optional[Sequence[Union[str, ButlerURI]]]) -> Optional[str]:
+    """Return the name of the file caching the configuration built from
+    the given arguments.
+
+    Parameters
+    ----------
+    other : `str`, `ButlerURI`, or `None`
+        Location of the butler configuration.
+    searchPaths : `list` or `tuple`, optional
+        Additional paths to search for defaults.
+
+    Returns
+    -------
+    cacheFile : `str` or `None`
+        Path of the cache file, or `None` if caching is not enabled.
+    """
+    cacheDir = os.environ.get(CONFIG_CACHE_DIR)
+    if not cacheDir:
+        return None
+    key = repr((
+        _CONFIG_CACHE_VERSION,
+        __version__,
+        sys.version_info[:2],
+        ButlerURI(other).geturl() if other is not None else None,
+        [str(path) for path in searchPaths] if searchPaths else [],
+        os.environ.get(CONFIG_PATH),
+    ))
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return os.path.join(os.path.expanduser(cacheDir), f"butlerConfig-{digest}.pickle")
+
+
+def _configFileSignature(uri: str) -> Optional[Union[str, tuple]]:
+    """Return a value that changes whenever a configuration file changes.
+
+    Parameters
+    ----------
+    uri : `str`
+        Location of the file.
+
+    Returns
+    -------
+    signature : `tuple`, `str`, or `None`
+        Modification time and size of local files, a digest of the contents
+        of other files, or `None` if the file does not exist.
+    """
+    location = ButlerURI(uri)
+    if location.isLocal:
+        try:
+            stat = os.stat(location.ospath)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    if not location.exists():
+        return None
+    return hashlib.sha256(location.read()).hexdigest()
+
+
+def _readCachedConfig(cacheFile: str) -> Optional[ButlerConfig]:
+    """Read a cached configuration, if it is still valid.
+
+    Parameters
+    ----------
+    cacheFile : `str`
+        Path of the cache file.
+
+    Returns
+    -------
+    config : `ButlerConfig` or `None`
+        The cached configuration, or `None` if there is none or if any of the
+        files it was made from have changed.
+    """
+    try:
+        with open(cacheFile, "rb") as fd:
+            version, signatures, config = pickle.load(fd)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.debug("Ignoring unreadable configuration cache file %s: %s", cacheFile, e)
+        return None
+    if version != _CONFIG_CACHE_VERSION:
+        return None
+    for uri, signature in signatures.items():
+        if _configFileSignature(uri) != signature:
+            log.debug("Cached configuration %s is stale, %s has changed", cacheFile, uri)
+            return None
+    return config
+
+
+def _writeCachedConfig(cacheFile: str, config: ButlerConfig, files: Dict[str, bool]) -> None:
+    """Write a configuration to the cache.
+
+    Parameters
+    ----------
+    cacheFile : `str`
+        Path of the cache file.
+    config : `ButlerConfig`
+        Configuration to cache.
+    files : `dict` [ `str`, `bool` ]
+        URIs of the files the configuration was made from, and of the files
+        looked for but not found, as recorded by
+        `~lsst.daf.butler.core.config.recordConfigFiles`.
+    """
+    signatures = {}
+    for uri, exists in files.items():
+        signature = _configFileSignature(uri) if exists else None
+        if exists and signature is None:
+            # Removed while we were reading it, do not cache.
+            return
+        signatures[uri] = signature
+    cacheDir = os.path.dirname(cacheFile)
+    try:
+        os.makedirs(cacheDir, exist_ok=True)
+        # Write to a temporary file and rename it so that concurrent readers
+        # never see a partial file.
+        fd, tmpFile = tempfile.mkstemp(dir=cacheDir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                pickle.dump((_CONFIG_CACHE_VERSION, signatures, config), stream,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpFile, cacheFile)
+        except BaseException:
+            os.remove(tmpFile)
+            raise
+    except Exception as e:
+        log.debug("Unable to write configuration cache file %s: %s", cacheFile, e)
+
 
 class ButlerConfig(Config):
     """Contains the configuration for a `Butler`
@@ -69,6 +216,15 @@ class ButlerConfig(Config):
         than those read from the environment in
         `ConfigSubset.defaultSearchPaths()`.  They are only read if ``other``
         refers to a configuration file or directory.
+
+    Notes
+    -----
+    If the environment variable ``$DAF_BUTLER_CONFIG_CACHE_DIR`` is set, the
+    merged configuration is saved in that directory, and later constructed
+    from the saved copy instead of by reading all the configuration files
+    again, as long as none of the files it was made from have changed (and
+    no new files have appeared in the search paths).  This only applies if
+    ``other`` is a path or URI, or `None`.
     """
 
     def __init__(self, other: Optional[Union[str, ButlerURI, Config]] = None,
@@ -84,6 +240,37 @@ class ButlerConfig(Config):
             self.configDir = copy.copy(other.configDir)
             return
 
+        # Create an empty config for us to populate
+        super().__init__()
+
+        cacheFile = None
+        if other is None or isinstance(other, (str, ButlerURI)):
+            cacheFile = _configCacheFile(other, searchPaths)
+        if cacheFile is None:
+            self._mergeDefaults(other, searchPaths)
+            return
+        cached = _readCachedConfig(cacheFile)
+        if cached is not None:
+            log.debug("Using cached configuration %s", cacheFile)
+            self._data = cached._data
+            self.configFile = cached.configFile
+            self.configDir = cached.configDir
+            return
+        with recordConfigFiles() as files:
+            self._mergeDefaults(other, searchPaths)
+        _writeCachedConfig(cacheFile, self, files)
+
+    def _mergeDefaults(self, other: Optional[Union[str, ButlerURI, Config]],
+                       searchPaths: Optional[Sequence[Union[str, ButlerURI]]]) -> None:
+        """Read the supplied configuration and merge it with the defaults.
+
+        Parameters
+        ----------
+        other : `str`, `ButlerURI`, `Config`, or `None`
+            Butler configuration, as given to the constructor.
+        searchPaths : `list` or `tuple`, optional
+            Additional paths to search for defaults.
+        """
         if isinstance(other, str):
             # This will only allow supported schemes
             uri = ButlerURI(other)
@@ -102,9 +289,6 @@ class ButlerConfig(Config):
                     uri = ButlerURI(other, forceDirectory=True).join("butler.yaml")
                 other = uri
 
-        # Create an empty config for us to populate
-        super().__init__()
-
         # Read the supplied config so that we can work out which other
         # defaults to use.
         butlerConfig = Config(other)
@@ -25,6 +25,7 @@ __all__ = ("associate",
            "create",
            "config_dump",
            "config_validate",
+           "materialize_dimension_overlaps",
            "prune_collection",
            "prune_datasets",
            "query_collections",
@@ -42,6 +43,7 @@ from .commands import (associate,
                        create,
                        config_dump,
                        config_validate,
+                       materialize_dimension_overlaps,
                        prune_collection,
                        prune_datasets,
                        query_collections,
@@ -85,11 +85,14 @@ def associate(**kwargs):
               help="Name for the file that contains database information associated with the exported "
                    "datasets.  If this is not an absolute path, does not exist in the current working "
                    "directory, and --dir is provided, it is assumed to be in that directory.  Defaults "
-                   "to \"export.yaml\".",
+                   "to \"export.{format}\".",
               type=click.File("r"))
 @click.option("--skip-dimensions", "-s", type=str, multiple=True, callback=split_commas,
               metavar=typeStrAcceptsMultiple,
               help="Dimensions that should be skipped during import")
+@click.option("--format", default="yaml",
+              help=unwrap("""Format of the export file.  "jsonl" files are read incrementally, so memory use
+                          does not grow with the size of the export."""))
 @options_file_option()
 def butler_import(*args, **kwargs):
     """Import data into a butler repository."""
@@ -366,6 +369,18 @@ def query_dataset_types(*args, **kwargs):
         print("No results. Try --help for more information.")
 
 
+@click.command(cls=ButlerCommand)
+@repo_argument(required=True)
+def materialize_dimension_overlaps(*args, **kwargs):
+    """Backfill spatial overlaps between dimension records in a repository.
+
+    This only needs to be run once, on repositories whose dimension records
+    were inserted before such overlaps were materialized automatically.
+    """
+    count = script.materializeDimensionOverlaps(*args, **kwargs)
+    print(f"Materialized overlaps for {count} new combinations of dimension elements and governor values.")
+
+
 @click.command(cls=ButlerCommand)
 @repo_argument(required=True)
 @click.argument('dataset-type-name', nargs=1)
@@ -22,11 +22,13 @@
 from __future__ import annotations
 
 import contextlib
+import io
 import urllib.parse
 import posixpath
 import copy
 import logging
 import re
+import tempfile
 
 from pathlib import Path, PurePath, PurePosixPath
 
@@ -35,6 +37,7 @@ __all__ = ('ButlerURI',)
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
     Iterator,
     Optional,
     Tuple,
@@ -57,6 +60,66 @@ ESCAPES_RE = re.compile(r"%[A-F0-9]{2}")
 ESCAPED_HASH = urllib.parse.quote("#")
 
 
+class _RangedRawIO(io.RawIOBase):
+    """Seekable raw reader that fetches only the byte ranges of a resource
+    that are actually read.
+
+    Parameters
+    ----------
+    uri : `ButlerURI`
+        Resource to read.
+    """
+
+    def __init__(self, uri: ButlerURI):
+        super().__init__()
+        self._uri = uri
+        self._size = uri.size()
+        self._position = 0
+        # Whole contents of the resource, if it was returned in full instead
+        # of the range that was asked for.
+        self._whole: Optional[bytes] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        size = min(len(buffer), self._size - self._position)
+        if size <= 0:
+            return 0
+        if self._whole is None:
+            offset, data = self._uri._fetch_range(self._position, size)
+            if offset != self._position or len(data) > size:
+                # The range was ignored and we were given everything, so use
+                # it for all later reads instead of transferring it again.
+                self._whole = data
+        if self._whole is not None:
+            data = self._whole[self._position:self._position + size]
+        n = len(data)
+        buffer[:n] = data
+        self._position += n
+        return n
+
+
 class ButlerURI:
     """Convenience wrapper around URI parsers.
 
@@ -114,6 +177,14 @@ class ButlerURI:
     isLocal = False
     """If `True` this URI refers to a local file."""
 
+    bufferSize: int = 8 * 1024 * 1024
+    """Default size in bytes of the chunks in which `open` and downloads
+    stream the contents of a resource."""
+
+    rangedBufferSize: int = 1024 * 1024
+    """Default minimum size in bytes of the ranges requested by a reader
+    returned by `open_ranged`."""
+
     # This is not an ABC with abstract methods because the __new__ being
     # a factory confuses mypy such that it assumes that every constructor
     # returns a ButlerURI and then determines that all the abstract methods
@@ -639,6 +710,147 @@ class ButlerURI:
         """
         raise NotImplementedError()
 
+    @contextlib.contextmanager
+    def open(self, mode: str = "rb", *, bufferSize: Optional[int] = None) -> Iterator[BinaryIO]:
+        """Open the resource for streaming binary I/O.
+
+        Parameters
+        ----------
+        mode : `str`, optional
+            ``"rb"`` to read the resource, or ``"wb"`` to replace its
+            contents.
+        bufferSize : `int`, optional
+            Size in bytes of the chunks in which the resource is read or
+            written.  Defaults to `bufferSize`.
+
+        Yields
+        ------
+        stream : file-like
+            Buffered binary file-like object.  When writing, the resource is
+            only updated if the context exits without raising.
+
+        Raises
+        ------
+        ValueError
+            Raised if ``mode`` is not supported.
+
+        Notes
+        -----
+        The default implementation reads from the file provided by
+        `as_local` and writes to a temporary local file that is then
+        transferred to the resource.  Subclasses stream directly to and from
+        the resource where they can.
+        """
+        self._checkOpenMode(mode)
+        bufferSize = bufferSize if bufferSize is not None else self.bufferSize
+        if mode == "rb":
+            with self.as_local() as local_uri:
+                with open(local_uri.ospath, "rb", buffering=bufferSize) as stream:
+                    yield stream  # type: ignore
+        else:
+            with tempfile.NamedTemporaryFile(suffix=self.getExtension()) as tmpFile:
+                with open(tmpFile.name, "wb", buffering=bufferSize) as stream:
+                    yield stream  # type: ignore
+                self.transfer_from(ButlerURI(tmpFile.name), transfer="copy", overwrite=True)
+
+    def read_range(self, start: int, size: int) -> bytes:
+        """Read a range of bytes from the resource.
+
+        Parameters
+        ----------
+        start : `int`
+            Offset of the first byte to read.
+        size : `int`
+            Number of bytes to read.
+
+        Returns
+        -------
+        data : `bytes`
+            The requested bytes.  Fewer than ``size`` bytes are returned if
+            the range extends beyond the end of the resource.
+
+        Notes
+        -----
+        The default implementation streams the resource from the start;
+        subclasses should transfer only the requested range where they can.
+        """
+        if size <= 0:
+            return b""
+        with self.open("rb") as stream:
+            stream.seek(start)
+            return stream.read(size)
+
+    def _fetch_range(self, start: int, size: int) -> Tuple[int, bytes]:
+        """Read a range of bytes for `open_ranged`, allowing more to be
+        returned.
+
+        Parameters
+        ----------
+        start : `int`
+            Offset of the first byte to read.
+        size : `int`
+            Number of bytes to read.
+
+        Returns
+        -------
+        offset : `int`
+            Offset of the first returned byte in the resource.  Usually
+            ``start``, but may be ``0`` if the whole resource was returned.
+        data : `bytes`
+            Bytes read.
+
+        Notes
+        -----
+        The default implementation calls `read_range`.  Subclasses whose
+        servers may ignore a request for a range should override this to
+        return everything they were sent, so it is not transferred again.
+        """
+        return start, self.read_range(start, size)
+
+    @contextlib.contextmanager
+    def open_ranged(self, *, bufferSize: Optional[int] = None) -> Iterator[BinaryIO]:
+        """Open the resource for random-access reading, transferring only
+        the ranges of bytes that are actually read.
+
+        Parameters
+        ----------
+        bufferSize : `int`, optional
+            Minimum size in bytes of each range to transfer.  Defaults to
+            `rangedBufferSize`.
+
+        Yields
+        ------
+        stream : file-like
+            Seekable, buffered binary file-like object.
+
+        Notes
+        -----
+        This is intended for readers that understand the layout of a file
+        and only need parts of it, such as a subset of the columns of a
+        table.  Each read that misses the buffer is a separate
+        `read_range` call.
+        """
+        bufferSize = bufferSize if bufferSize is not None else self.rangedBufferSize
+        with io.BufferedReader(_RangedRawIO(self), buffer_size=bufferSize) as stream:
+            yield stream  # type: ignore
+
+    @staticmethod
+    def _checkOpenMode(mode: str) -> None:
+        """Check that a mode is supported by `open`.
+
+        Parameters
+        ----------
+        mode : `str`
+            Mode to check.
+
+        Raises
+        ------
+        ValueError
+            Raised if ``mode`` is not supported.
+        """
+        if mode not in ("rb", "wb"):
+            raise ValueError(f"Unsupported mode {mode!r}; only 'rb' and 'wb' are supported.")
+
     def mkdir(self) -> None:
         """For a dir-like URI, create the directory resource if it does not
         already exist.
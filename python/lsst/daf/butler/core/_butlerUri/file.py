@@ -21,9 +21,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
 import os.path
 import shutil
+import tempfile
 import urllib.parse
 import posixpath
 import copy
@@ -34,6 +36,8 @@ __all__ = ('ButlerFileURI',)
 from typing import (
     TYPE_CHECKING,
     cast,
+    BinaryIO,
+    Iterator,
     Optional,
     Tuple,
     Union,
@@ -190,6 +194,47 @@ class ButlerFileURI(ButlerURI):
         with open(self.ospath, mode) as f:
             f.write(data)
 
+    @contextlib.contextmanager
+    def open(self, mode: str = "rb", *, bufferSize: Optional[int] = None) -> Iterator[BinaryIO]:
+        # Docstring inherited from ButlerURI.open.
+        self._checkOpenMode(mode)
+        bufferSize = bufferSize if bufferSize is not None else self.bufferSize
+        if mode == "rb":
+            with open(self.ospath, "rb", buffering=bufferSize) as stream:
+                yield stream  # type: ignore
+            return
+        # Write to a temporary file next to the destination, and only
+        # rename it into place once it is complete.
+        dir = os.path.dirname(self.ospath)
+        if not os.path.exists(dir):
+            safeMakeDir(dir)
+        fd, tmpPath = tempfile.mkstemp(dir=dir, prefix=".", suffix=self.getExtension())
+        try:
+            with os.fdopen(fd, "wb", buffering=bufferSize) as stream:
+                yield stream  # type: ignore
+            os.replace(tmpPath, self.ospath)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmpPath)
+            raise
+
+    def read_range(self, start: int, size: int) -> bytes:
+        # Docstring inherited from ButlerURI.read_range.
+        if size <= 0:
+            return b""
+        with open(self.ospath, "rb", buffering=0) as fh:
+            if hasattr(os, "pread"):
+                return os.pread(fh.fileno(), size, start)
+            fh.seek(start)
+            return fh.read(size)
+
+    @contextlib.contextmanager
+    def open_ranged(self, *, bufferSize: Optional[int] = None) -> Iterator[BinaryIO]:
+        # Docstring inherited from ButlerURI.open_ranged.
+        # Local files are seekable already.
+        with self.open("rb", bufferSize=bufferSize) as stream:
+            yield stream
+
     def mkdir(self) -> None:
         if not os.path.exists(self.ospath):
             safeMakeDir(self.ospath)
@@ -21,6 +21,8 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import os
 import os.path
 import requests
@@ -34,6 +36,8 @@ from requests.packages.urllib3.util.retry import Retry
 
 from typing import (
     TYPE_CHECKING,
+    BinaryIO,
+    Iterator,
     Optional,
     Tuple,
     Union,
@@ -408,7 +412,7 @@ class ButlerHttpURI(ButlerURI):
         if r.status_code != 200:
             raise FileNotFoundError(f"Unable to download resource {self}; status code: {r.status_code}")
         with tempfile.NamedTemporaryFile(suffix=self.getExtension(), delete=False) as tmpFile:
-            for chunk in r.iter_content():
+            for chunk in r.iter_content(chunk_size=self.bufferSize):
                 tmpFile.write(chunk)
         return tmpFile.name, True
 
@@ -431,6 +435,29 @@ class ButlerHttpURI(ButlerURI):
         else:
             return next(r.iter_content(chunk_size=size))
 
+    def read_range(self, start: int, size: int) -> bytes:
+        # Docstring inherited from ButlerURI.read_range.
+        offset, data = self._fetch_range(start, size)
+        return data[start - offset:start - offset + size]
+
+    def _fetch_range(self, start: int, size: int) -> Tuple[int, bytes]:
+        # Docstring inherited from ButlerURI._fetch_range.
+        if size <= 0:
+            return start, b""
+        log.debug("Reading bytes %d-%d from remote resource: %s", start, start + size - 1, self.geturl())
+        r = self.session.get(self.geturl(), headers={"Range": f"bytes={start}-{start + size - 1}"},
+                             timeout=TIMEOUT)
+        if r.status_code == 206:
+            return start, r.content
+        elif r.status_code == 200:
+            # The server ignored the range and returned everything.
+            log.debug("Server ignored range request for %s; returning whole resource.", self.geturl())
+            return 0, r.content
+        elif r.status_code == 416:
+            # The range starts beyond the end of the resource.
+            return start, b""
+        raise FileNotFoundError(f"Unable to read resource {self}; status code: {r.status_code}")
+
     def write(self, data: bytes, overwrite: bool = True) -> None:
         """Write the supplied bytes to the new resource.
 
@@ -452,6 +479,35 @@ class ButlerHttpURI(ButlerURI):
         if r.status_code not in [201, 202, 204]:
             raise ValueError(f"Can not write file {self}, status code: {r.status_code}")
 
+    @contextlib.contextmanager
+    def open(self, mode: str = "rb", *, bufferSize: Optional[int] = None) -> Iterator[BinaryIO]:
+        # Docstring inherited from ButlerURI.open.
+        self._checkOpenMode(mode)
+        bufferSize = bufferSize if bufferSize is not None else self.bufferSize
+        if mode == "rb":
+            log.debug("Streaming from remote resource: %s", self.geturl())
+            r = self.session.get(self.geturl(), stream=True, timeout=TIMEOUT)
+            if r.status_code != 200:
+                raise FileNotFoundError(f"Unable to read resource {self}; status code: {r.status_code}")
+            try:
+                # Undo any transfer encoding as the body is read.
+                r.raw.decode_content = True
+                with io.BufferedReader(r.raw, buffer_size=bufferSize) as stream:
+                    yield stream  # type: ignore
+            finally:
+                r.close()
+        else:
+            # Only spill to disk if the contents do not fit in one chunk;
+            # the upload then streams from the spooled file.
+            with tempfile.SpooledTemporaryFile(max_size=bufferSize, suffix=self.getExtension()) as spool:
+                yield spool  # type: ignore
+                spool.seek(0)
+                log.debug("Streaming to remote resource: %s", self.geturl())
+                dest_url = finalurl(self._emptyPut())
+                r = self.session.put(dest_url, data=spool, timeout=TIMEOUT)
+                if r.status_code not in [201, 202, 204]:
+                    raise ValueError(f"Can not write file {self}, status code: {r.status_code}")
+
     def transfer_from(self, src: ButlerURI, transfer: str = "copy",
                       overwrite: bool = False,
                       transaction: Optional[Union[DatastoreTransaction, NoTransaction]] = None) -> None:
@@ -21,6 +21,8 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import logging
 import tempfile
 
@@ -30,7 +32,9 @@ from typing import (
     TYPE_CHECKING,
     Optional,
     Any,
+    BinaryIO,
     Callable,
+    Iterator,
     Tuple,
     Union,
 )
@@ -87,6 +91,35 @@ max_retry_time = 60
 log = logging.getLogger(__name__)
 
 
+class _StreamingBodyIO(io.RawIOBase):
+    """Adapt the streaming body of an S3 response to the raw I/O interface,
+    so that it can be wrapped in an `io.BufferedReader`.
+
+    Parameters
+    ----------
+    body : `botocore.response.StreamingBody`
+        Body of the ``get_object`` response.
+    """
+
+    def __init__(self, body: Any):
+        super().__init__()
+        self._body = body
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._body.read(len(buffer))
+        n = len(data)
+        buffer[:n] = data
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._body.close()
+        super().close()
+
+
 class ButlerS3URI(ButlerURI):
     """S3 URI"""
 
@@ -144,6 +177,66 @@ class ButlerS3URI(ButlerURI):
         self.client.put_object(Bucket=self.netloc, Key=self.relativeToPathRoot,
                                Body=data)
 
+    @backoff.on_exception(backoff.expo, all_retryable_errors, max_time=max_retry_time)
+    def read_range(self, start: int, size: int) -> bytes:
+        # Docstring inherited from ButlerURI.read_range.
+        if size <= 0:
+            return b""
+        try:
+            response = self.client.get_object(Bucket=self.netloc,
+                                              Key=self.relativeToPathRoot,
+                                              Range=f"bytes={start}-{start + size - 1}")
+        except (self.client.exceptions.NoSuchKey, self.client.exceptions.NoSuchBucket) as err:
+            raise FileNotFoundError(f"No such resource: {self}") from err
+        except ClientError as err:
+            if err.response["ResponseMetadata"]["HTTPStatusCode"] == 416:
+                # The range starts beyond the end of the object.
+                return b""
+            raise
+        body = response["Body"].read()
+        response["Body"].close()
+        return body
+
+    def _transferConfig(self, bufferSize: Optional[int] = None) -> Any:
+        """Return the configuration for managed (multipart) transfers.
+
+        Parameters
+        ----------
+        bufferSize : `int`, optional
+            Size in bytes of the parts to transfer.  Defaults to
+            `bufferSize`.
+
+        Returns
+        -------
+        config : `boto3.s3.transfer.TransferConfig`
+            Configuration for ``upload_fileobj`` and ``download_fileobj``.
+        """
+        from boto3.s3.transfer import TransferConfig
+        bufferSize = bufferSize if bufferSize is not None else self.bufferSize
+        return TransferConfig(multipart_threshold=bufferSize, multipart_chunksize=bufferSize,
+                              io_chunksize=min(bufferSize, 1024 * 1024))
+
+    @contextlib.contextmanager
+    def open(self, mode: str = "rb", *, bufferSize: Optional[int] = None) -> Iterator[BinaryIO]:
+        # Docstring inherited from ButlerURI.open.
+        self._checkOpenMode(mode)
+        bufferSize = bufferSize if bufferSize is not None else self.bufferSize
+        if mode == "rb":
+            try:
+                response = self.client.get_object(Bucket=self.netloc, Key=self.relativeToPathRoot)
+            except (self.client.exceptions.NoSuchKey, self.client.exceptions.NoSuchBucket) as err:
+                raise FileNotFoundError(f"No such resource: {self}") from err
+            with io.BufferedReader(_StreamingBodyIO(response["Body"]), buffer_size=bufferSize) as stream:
+                yield stream  # type: ignore
+        else:
+            # Only spill to disk if the object does not fit in a single part;
+            # larger objects are then uploaded in parts, concurrently.
+            with tempfile.SpooledTemporaryFile(max_size=bufferSize, suffix=self.getExtension()) as spool:
+                yield spool  # type: ignore
+                spool.seek(0)
+                self.client.upload_fileobj(spool, self.netloc, self.relativeToPathRoot,
+                                           Config=self._transferConfig(bufferSize))
+
     @backoff.on_exception(backoff.expo, all_retryable_errors, max_time=max_retry_time)
     def mkdir(self) -> None:
         if not bucketExists(self.netloc):
@@ -168,7 +261,8 @@ class ButlerS3URI(ButlerURI):
             Always returns `True`. This is always a temporary file.
         """
         with tempfile.NamedTemporaryFile(suffix=self.getExtension(), delete=False) as tmpFile:
-            self.client.download_fileobj(self.netloc, self.relativeToPathRoot, tmpFile)
+            self.client.download_fileobj(self.netloc, self.relativeToPathRoot, tmpFile,
+                                         Config=self._transferConfig())
         return tmpFile.name, True
 
     @backoff.on_exception(backoff.expo, all_retryable_errors, max_time=max_retry_time)
@@ -215,11 +309,10 @@ class ButlerS3URI(ButlerURI):
             # Use local file and upload it
             with src.as_local() as local_uri:
 
-                # resource.meta.upload_file seems like the right thing
-                # but we have a low level client
+                # Managed transfers upload large files in parts, concurrently
                 with open(local_uri.ospath, "rb") as fh:
-                    self.client.put_object(Bucket=self.netloc,
-                                           Key=self.relativeToPathRoot, Body=fh)
+                    self.client.upload_fileobj(fh, self.netloc, self.relativeToPathRoot,
+                                               Config=self._transferConfig())
 
         # This was an explicit move requested from a remote resource
         # try to remove that resource
@@ -25,8 +25,11 @@ __all__ = ("getS3Client", "s3CheckFileExists", "bucketExists", "setAwsEnvCredent
            "unsetAwsEnvCredentials")
 
 import os
+import threading
 
 from typing import (
+    Any,
+    Dict,
     Optional,
     Tuple,
     Union,
@@ -46,8 +49,43 @@ from ..location import Location
 from ._butlerUri import ButlerURI
 
 
+_CLIENT_ENV_VARS = ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN", "AWS_PROFILE",
+                    "AWS_SHARED_CREDENTIALS_FILE", "AWS_CONFIG_FILE", "AWS_DEFAULT_REGION")
+"""Environment variables that affect how a client is configured or
+authenticated, and hence which cached client can be reused.
+"""
+
+_DEFAULT_MAX_POOL_CONNECTIONS = 32
+"""Default maximum number of connections each client keeps open, unless
+overridden by the S3_MAX_POOL_CONNECTIONS environment variable.
+"""
+
+_clientCache: Dict[Tuple[Any, ...], Any] = {}
+_clientCacheLock = threading.Lock()
+_clientCachePid = os.getpid()
+
+
+def _clearS3ClientCache() -> None:
+    """Forget all cached clients, without closing their connections.
+
+    Notes
+    -----
+    Called in a child process after a fork, since the connections of the
+    parent's clients must not be shared with it.
+    """
+    global _clientCachePid, _clientCacheLock
+    _clientCache.clear()
+    # The lock may have been held by another thread at the time of the fork.
+    _clientCacheLock = threading.Lock()
+    _clientCachePid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_clearS3ClientCache)
+
+
 def getS3Client() -> boto3.client:
-    """Create a S3 client with AWS (default) or the specified endpoint
+    """Return a S3 client with AWS (default) or the specified endpoint
 
     Returns
     -------
@@ -57,7 +95,14 @@ def getS3Client() -> boto3.client:
     Notes
     -----
     The endpoint URL is from the environment variable S3_ENDPOINT_URL.
-    If none is specified, the default AWS one is used.
+    If none is specified, the default AWS one is used.  The maximum number of
+    connections the client keeps open for reuse is from the environment
+    variable S3_MAX_POOL_CONNECTIONS.
+
+    Clients are thread-safe, and are cached for the lifetime of the process
+    so that their connections are reused.  A new client is created if the
+    endpoint, connection limit or AWS credential environment variables
+    change, and in a child process after a fork.
     """
     if boto3 is None:
         raise ModuleNotFoundError("Could not find boto3. "
@@ -69,16 +114,32 @@ def getS3Client() -> boto3.client:
     endpoint = os.environ.get("S3_ENDPOINT_URL", None)
     if not endpoint:
         endpoint = None  # Handle ""
-
-    config = botocore.config.Config(
-        read_timeout=180,
-        retries={
-            'mode': 'adaptive',
-            'max_attempts': 10
-        }
-    )
-
-    return boto3.client("s3", endpoint_url=endpoint, config=config)
+    maxPoolConnections = int(os.environ.get("S3_MAX_POOL_CONNECTIONS") or _DEFAULT_MAX_POOL_CONNECTIONS)
+
+    key = (endpoint, maxPoolConnections) + tuple(os.environ.get(name) for name in _CLIENT_ENV_VARS)
+    if _clientCachePid != os.getpid():
+        # Forked without os.register_at_fork support.
+        _clearS3ClientCache()
+    client = _clientCache.get(key)
+    if client is not None:
+        return client
+    with _clientCacheLock:
+        client = _clientCache.get(key)
+        if client is None:
+            config = botocore.config.Config(
+                read_timeout=180,
+                max_pool_connections=maxPoolConnections,
+                retries={
+                    'mode': 'adaptive',
+                    'max_attempts': 10
+                }
+            )
+            # The default boto3 session is not thread-safe, so each client
+            # is created from a session of its own.
+            session = boto3.session.Session()
+            client = session.client("s3", endpoint_url=endpoint, config=config)
+            _clientCache[key] = client
+    return client
 
 
 def s3CheckFileExists(path: Union[Location, ButlerURI, str], bucket: Optional[str] = None,
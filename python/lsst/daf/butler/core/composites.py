@@ -30,6 +30,9 @@ import logging
 
 from typing import (
     TYPE_CHECKING,
+    Dict,
+    Optional,
+    Tuple,
     Union,
 )
 
@@ -96,6 +99,10 @@ class CompositesMap:
         # the values
         self._lut = processLookupConfigs(disassemblyMap, universe=universe)
 
+        # Matching lookup table key (`None` if the default applies) for each
+        # tuple of lookup names seen so far.
+        self._matchCache: Dict[Tuple[LookupKey, ...], Optional[LookupKey]] = {}
+
     def shouldBeDisassembled(self, entity: Union[DatasetRef, DatasetType, StorageClass]) -> bool:
         """Given some choices, indicate whether the entity should be
         disassembled.
@@ -131,11 +138,15 @@ class CompositesMap:
         matchName: Union[LookupKey, str] = "{} (via default)".format(entity)
         disassemble = self.config["default"]
 
-        for key in entity._lookupNames():
-            if key in self._lut:
-                disassemble = self._lut[key]
-                matchName = key
-                break
+        names = entity._lookupNames()
+        try:
+            match = self._matchCache[names]
+        except KeyError:
+            match = next((key for key in names if key in self._lut), None)
+            self._matchCache[names] = match
+        if match is not None:
+            disassemble = self._lut[match]
+            matchName = match
 
         if not isinstance(disassemble, bool):
             raise TypeError(
@@ -26,6 +26,7 @@ from __future__ import annotations
 __all__ = ("Config", "ConfigSubset")
 
 import collections
+import contextlib
 import copy
 import json
 import logging
@@ -33,10 +34,11 @@ import pprint
 import os
 import yaml
 import sys
+import threading
 from pathlib import Path
 from yaml.representer import Representer
 import io
-from typing import Any, Dict, List, Sequence, Optional, ClassVar, IO, Tuple, Union
+from typing import Any, Dict, Iterator, List, Sequence, Optional, ClassVar, IO, Tuple, Union
 
 from lsst.utils import doImport
 from ._butlerUri import ButlerURI
@@ -50,6 +52,56 @@ log = logging.getLogger(__name__)
 # PATH-like environment variable to use for defaults.
 CONFIG_PATH = "DAF_BUTLER_CONFIG_PATH"
 
+
+class _ConfigFileRecord(threading.local):
+    """Per-thread record of the configuration files read, or looked for,
+    while a configuration is being assembled.
+    """
+
+    files: Optional[Dict[str, bool]] = None
+
+
+_configFileRecord = _ConfigFileRecord()
+
+
+def _recordConfigFile(uri: ButlerURI, exists: bool = True) -> None:
+    """Note that a configuration file has been read or looked for.
+
+    Parameters
+    ----------
+    uri : `ButlerURI`
+        Location of the file.
+    exists : `bool`, optional
+        Whether the file was found.
+    """
+    if _configFileRecord.files is not None:
+        _configFileRecord.files[uri.geturl()] = exists
+
+
+@contextlib.contextmanager
+def recordConfigFiles() -> Iterator[Dict[str, bool]]:
+    """Record the configuration files used within this context.
+
+    Yields
+    ------
+    files : `dict` [ `str`, `bool` ]
+        Filled with the URIs of all configuration files that were read by
+        this thread while the context was active (mapped to `True`), and of
+        files that were looked for in search paths but not found (mapped to
+        `False`).  Together these are everything the resulting configuration
+        depends on.
+    """
+    outer = _configFileRecord.files
+    files: Dict[str, bool] = {}
+    _configFileRecord.files = files
+    try:
+        yield files
+    finally:
+        _configFileRecord.files = outer
+        if outer is not None:
+            outer.update(files)
+
+
 try:
     yamlLoader = yaml.CSafeLoader
 except AttributeError:
@@ -125,6 +177,7 @@ class Loader(yamlLoader):
 
         # Read all the data from the resource
         data = fileuri.read()
+        _recordConfigFile(fileuri)
 
         # Store the bytes into a BytesIO so we can attach a .name
         stream = io.BytesIO(data)
@@ -299,6 +352,8 @@ class Config(collections.abc.MutableMapping):
         """
         uri = ButlerURI(path)
         ext = uri.getExtension()
+        if ext in (".yaml", ".json"):
+            _recordConfigFile(uri)
         if ext == ".yaml":
             log.debug("Opening YAML config file: %s", uri.geturl())
             content = uri.read()
@@ -410,7 +465,9 @@ class Config(collections.abc.MutableMapping):
                             if isinstance(dir, ButlerURI):
                                 specific = dir.join(fileName.path)
                                 # Remote resource check might be expensive
-                                if specific.exists():
+                                exists = specific.exists()
+                                _recordConfigFile(specific, exists)
+                                if exists:
                                     found = specific
                             else:
                                 log.warning("Do not understand search path entry '%s' of type %s",
@@ -1199,7 +1256,9 @@ class ConfigSubset(Config):
                 if isinstance(pathDir, (str, ButlerURI)):
                     pathDir = ButlerURI(pathDir, forceDirectory=True)
                     file = pathDir.join(configFile)
-                    if file.exists():
+                    exists = file.exists()
+                    _recordConfigFile(file, exists)
+                    if exists:
                         self.filesRead.append(file)
                         self._updateWithOtherConfigFile(file)
                 else:
@@ -28,8 +28,10 @@ __all__ = ("Constraints", "ConstraintsValidationError", "ConstraintsConfig")
 
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Optional,
     Set,
+    Tuple,
     Union,
 )
 
@@ -78,6 +80,8 @@ class Constraints:
         # Default is to accept all and reject nothing
         self._accept = set()
         self._reject = set()
+        # Answers for each tuple of lookup names seen so far.
+        self._cache: Dict[Tuple[LookupKey, ...], bool] = {}
 
         if config is not None:
             self.config = ConstraintsConfig(config)
@@ -115,9 +119,28 @@ class Constraints:
         allowed : `bool`
             `True` if the entity is allowed.
         """
-        # Get the names to use for lookup
-        names = set(entity._lookupNames())
+        lookupNames = entity._lookupNames()
+        try:
+            return self._cache[lookupNames]
+        except KeyError:
+            pass
+        result = self._isAcceptable(set(lookupNames))
+        self._cache[lookupNames] = result
+        return result
+
+    def _isAcceptable(self, names: Set[LookupKey]) -> bool:
+        """Implementation of `isAcceptable` that does no caching.
 
+        Parameters
+        ----------
+        names : `set` of `LookupKey`
+            The lookup names of the entity being tested.
+
+        Returns
+        -------
+        allowed : `bool`
+            `True` if an entity with these lookup names is allowed.
+        """
         # Test if this entity is explicitly mentioned for accept/reject
         isExplicitlyAccepted = bool(names & self._accept)
 
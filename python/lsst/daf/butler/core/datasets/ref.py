@@ -22,6 +22,7 @@ from __future__ import annotations
 
 __all__ = ["AmbiguousDatasetError", "DatasetRef"]
 
+import functools
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -43,6 +44,30 @@ if TYPE_CHECKING:
     from ...registry import Registry
 
 
+@functools.lru_cache(maxsize=1024)
+def _lookupNamesWithInstrument(datasetType: DatasetType, instrument: Any) -> Tuple[LookupKey, ...]:
+    """Compute (and cache) the lookup names for a dataset type and
+    instrument.
+
+    Parameters
+    ----------
+    datasetType : `DatasetType`
+        Dataset type whose lookup names form the base of the result.
+    instrument : `str` or `None`
+        Value of the ``instrument`` data ID key, or `None` if the data ID
+        does not have one.
+
+    Returns
+    -------
+    names : `tuple` of `LookupKey`
+        Lookup names in priority order; see `DatasetRef._lookupNames`.
+    """
+    names: Tuple[LookupKey, ...] = datasetType._lookupNames()
+    if instrument is not None:
+        names = tuple(n.clone(dataId={"instrument": instrument}) for n in names) + names
+    return names
+
+
 class AmbiguousDatasetError(Exception):
     """Exception raised when a `DatasetRef` is not resolved (has no ID or run),
     but the requested operation requires one of them.
@@ -82,7 +107,7 @@ class DatasetRef:
         provided but ``run`` is not.
     """
 
-    __slots__ = ("id", "datasetType", "dataId", "run",)
+    __slots__ = ("id", "datasetType", "dataId", "run", "_hash")
 
     def __init__(
         self,
@@ -108,13 +133,23 @@ class DatasetRef:
             self.run = None
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         try:
-            return (self.datasetType, self.dataId, self.id) == (other.datasetType, other.dataId, other.id)
+            # Compare the cheapest and most discriminating attribute first.
+            return (self.id == other.id and self.datasetType == other.datasetType
+                    and self.dataId == other.dataId)
         except AttributeError:
             return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((self.datasetType, self.dataId, self.id))
+        # The hash is computed on first use and then kept; this is allowed
+        # by @immutable because the attribute is only ever set once.
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.datasetType, self.dataId, self.id))
+            return self._hash
 
     @property
     def dimensions(self) -> DimensionGraph:
@@ -364,18 +399,18 @@ class DatasetRef:
             value of ``instrument``.
         """
         # Special case the instrument Dimension since we allow configs
-        # to include the instrument name in the hierarchy.
-        names: Tuple[LookupKey, ...] = self.datasetType._lookupNames()
-
+        # to include the instrument name in the hierarchy.  The result
+        # depends only on the dataset type (including its storage class)
+        # and the instrument, so it is cached on those and shared by all
+        # of the configuration lookup systems that call this.
+        instrument = None
         # mypy doesn't think this could return True, because even though
         # __contains__ can take an object of any type, it seems hard-coded to
         # assume it will  return False if the type doesn't match the key type
         # of the Mapping.
         if "instrument" in self.dataId:  # type: ignore
-            names = tuple(n.clone(dataId={"instrument": self.dataId["instrument"]})
-                          for n in names) + names
-
-        return names
+            instrument = self.dataId["instrument"]
+        return _lookupNamesWithInstrument(self.datasetType, instrument)
 
     @staticmethod
     def groupByType(refs: Iterable[DatasetRef]) -> NamedKeyDict[DatasetType, List[DatasetRef]]:
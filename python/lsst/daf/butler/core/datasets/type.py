@@ -198,6 +198,8 @@ class DatasetType:
         return f"DatasetType({self.name!r}, {self.dimensions}, {self._storageClassName}{extra})"
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
         if self._name != other._name:
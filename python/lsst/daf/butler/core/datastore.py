@@ -351,6 +351,34 @@ class Datastore(metaclass=ABCMeta):
         """
         raise NotImplementedError("Must be implemented by subclass")
 
+    def mexists(self, datasetRefs: Iterable[DatasetRef],
+                checkArtifacts: bool = True) -> Dict[DatasetRef, bool]:
+        """Check which of multiple datasets exist in the datastore.
+
+        Parameters
+        ----------
+        datasetRefs : iterable of `DatasetRef`
+            References to the datasets to check.
+        checkArtifacts : `bool`, optional
+            If `False`, trust the datastore's internal records of which
+            datasets it holds rather than checking that each artifact
+            actually exists in storage.  Datastores that keep no such
+            records always check their storage.
+
+        Returns
+        -------
+        existence : `dict` [`DatasetRef`, `bool`]
+            Mapping from each given reference to whether the dataset exists
+            in the datastore.
+
+        Notes
+        -----
+        The default implementation simply calls `exists` for each dataset;
+        subclasses are encouraged to reimplement this method when they can
+        amortize per-dataset lookups over the whole batch.
+        """
+        return {ref: self.exists(ref) for ref in datasetRefs}
+
     @abstractmethod
     def get(self, datasetRef: DatasetRef, parameters: Mapping[str, Any] = None) -> Any:
         """Load an `InMemoryDataset` from the store.
@@ -383,6 +411,53 @@ class Datastore(metaclass=ABCMeta):
         """
         raise NotImplementedError("Must be implemented by subclass")
 
+    def getMany(self, datasetRefs: Iterable[DatasetRef],
+                parameters: Optional[Mapping[str, Any]] = None) -> List[Any]:
+        """Load multiple `InMemoryDataset` objects from the store.
+
+        Parameters
+        ----------
+        datasetRefs : iterable of `DatasetRef`
+            References to the required Datasets.
+        parameters : `dict`, optional
+            `StorageClass`-specific parameters that specify a slice of the
+            Datasets to be loaded.  The same parameters are applied to all
+            datasets.
+
+        Returns
+        -------
+        inMemoryDatasets : `list` [`object`]
+            Requested Datasets or slices thereof, in the same order as
+            ``datasetRefs``.
+
+        Notes
+        -----
+        The default implementation simply calls `get` for each dataset;
+        subclasses are encouraged to reimplement this method when they can
+        amortize per-dataset lookups over the whole batch.
+        """
+        return [self.get(ref, parameters=parameters) for ref in datasetRefs]
+
+    def putMany(self, items: Iterable[Tuple[Any, DatasetRef]]) -> None:
+        """Write multiple `InMemoryDataset` objects to the store.
+
+        Parameters
+        ----------
+        items : iterable of `tuple` [`object`, `DatasetRef`]
+            Pairs of the Dataset to store and the reference associated with
+            it.
+
+        Notes
+        -----
+        All datasets are written within a single transaction.  The default
+        implementation simply calls `put` for each dataset; subclasses are
+        encouraged to reimplement this method when they can record all
+        datasets at once.
+        """
+        with self.transaction():
+            for inMemoryDataset, ref in items:
+                self.put(inMemoryDataset, ref)
+
     def _overrideTransferMode(self, *datasets: FileDataset, transfer: Optional[str] = None) -> Optional[str]:
         """Allow ingest transfer mode to be defaulted based on datasets.
 
@@ -593,6 +668,38 @@ class Datastore(metaclass=ABCMeta):
         """
         raise NotImplementedError()
 
+    def getManyURIs(self, datasetRefs: Iterable[DatasetRef], predict: bool = False
+                    ) -> Dict[DatasetRef, Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]]:
+        """Return URIs associated with multiple datasets.
+
+        Parameters
+        ----------
+        datasetRefs : iterable of `DatasetRef`
+            References to the required datasets.
+        predict : `bool`, optional
+            If the datastore does not know about a dataset, should it
+            return a predicted URI or not?
+
+        Returns
+        -------
+        uris : `dict` [`DatasetRef`, `tuple`]
+            Mapping from each given reference to the primary and component
+            URIs of the dataset, as returned by `getURIs`.
+
+        Raises
+        ------
+        FileNotFoundError
+            Raised if any of the datasets does not exist in the datastore
+            and ``predict`` is `False`.
+
+        Notes
+        -----
+        The default implementation simply calls `getURIs` for each dataset;
+        subclasses are encouraged to reimplement this method when they can
+        amortize per-dataset lookups over the whole batch.
+        """
+        return {ref: self.getURIs(ref, predict=predict) for ref in datasetRefs}
+
     @abstractmethod
     def getURI(self, datasetRef: DatasetRef, predict: bool = False) -> ButlerURI:
         """URI to the Dataset.
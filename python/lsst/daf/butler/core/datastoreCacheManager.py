@@ -0,0 +1,302 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Local cache of artifacts read from remote datastores."""
+
+from __future__ import annotations
+
+__all__ = ("DatastoreCacheManager",)
+
+import contextlib
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+    Mapping,
+    Optional,
+)
+
+from ._butlerUri import ButlerURI
+from .utils import safeMakeDir
+
+if TYPE_CHECKING:
+    from .datasets import DatasetRef
+    from .storedFileInfo import StoredFileInfo
+
+log = logging.getLogger(__name__)
+
+
+class DatastoreCacheManager:
+    """A persistent, size-bounded cache of remote datastore artifacts in a
+    local directory.
+
+    Parameters
+    ----------
+    config : `~collections.abc.Mapping`, optional
+        Cache configuration.  Recognized keys are ``root`` (the local
+        directory to use; caching is disabled if this is not set) and
+        ``max_size`` (the maximum total size of the cached files in bytes;
+        no limit if not set).
+
+    Notes
+    -----
+    Cached files are named after the dataset ID, component and checksum (or
+    size, if no checksum was recorded) of the artifact, so a stale copy is
+    never returned for a dataset that has been replaced.
+
+    Files are added to the cache by renaming a complete file into place, and
+    are handed to readers as private hard links, so the same directory can
+    safely be shared by many processes on one node: a file evicted by one
+    process while another is reading it remains readable until the reader
+    is done with it.  The least-recently used files are evicted first.
+
+    A cached file whose size does not match the datastore record is removed
+    and downloaded again.  Private links and partial downloads left behind by
+    processes that did not exit cleanly are removed when a manager is
+    created, once they are older than `staleAge`.
+    """
+
+    staleAge: float = 24 * 3600
+    """Age in seconds after which a temporary file in the cache directory is
+    assumed to have been abandoned (`float`).
+    """
+
+    def __init__(self, config: Optional[Mapping[str, Any]] = None):
+        config = config if config is not None else {}
+        root = config.get("root")
+        self.root: Optional[str] = os.path.abspath(os.path.expanduser(root)) if root else None
+        self.maxSize: Optional[int] = config.get("max_size")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Guards the counters, which are updated from the threads that
+        # FileDatastore uses to read the artifacts of a composite.
+        self._lock = threading.Lock()
+        if self.root is not None:
+            safeMakeDir(self.root)
+            self._removeStaleFiles()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled (`bool`)."""
+        return self.root is not None
+
+    def shouldBeCached(self, uri: ButlerURI) -> bool:
+        """Return whether the given artifact should be read through the cache.
+
+        Parameters
+        ----------
+        uri : `ButlerURI`
+            Location of the artifact.
+
+        Returns
+        -------
+        cache : `bool`
+            `True` if caching is enabled and the artifact is not already a
+            local file.
+        """
+        return self.enabled and not uri.isLocal
+
+    def _cacheName(self, ref: DatasetRef, info: StoredFileInfo, extension: str) -> str:
+        """Return the name of the cached file for an artifact."""
+        component = info.component if info.component is not None else ""
+        version = info.checksum if info.checksum is not None else f"size{info.file_size}"
+        return f"{ref.getCheckedId()}_{component}_{version}{extension}"
+
+    @contextlib.contextmanager
+    def get(self, uri: ButlerURI, ref: DatasetRef, info: StoredFileInfo) -> Iterator[ButlerURI]:
+        """Provide a local copy of an artifact, downloading it into the cache
+        if it is not already present.
+
+        Parameters
+        ----------
+        uri : `ButlerURI`
+            Location of the (remote) artifact.
+        ref : `DatasetRef`
+            Resolved reference to the dataset the artifact belongs to.
+        info : `StoredFileInfo`
+            Datastore record for the artifact.
+
+        Yields
+        ------
+        local : `ButlerURI`
+            A local file with the contents of the artifact.  It will not be
+            removed by other users of the cache while the context is active,
+            and should not be modified.
+        """
+        assert self.root is not None, "Caching must be enabled to get a file from the cache."
+        extension = uri.getExtension()
+        cached = os.path.join(self.root, self._cacheName(ref, info, extension))
+        private = os.path.join(self.root, f".reading-{uuid.uuid4().hex}{extension}")
+        try:
+            found = self._link(cached, private)
+            size = os.path.getsize(private) if found else None
+            if found and info.file_size >= 0 and size != info.file_size:
+                # Truncated or otherwise corrupted; purge it so it is fetched
+                # again rather than failing every later read.
+                log.warning("Removing cached file %s, whose size (%d) does not match the size "
+                            "recorded for %s (%d).", cached, size, uri, info.file_size)
+                os.remove(private)
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(cached)
+                found = False
+            if found:
+                with self._lock:
+                    self.hits += 1
+                log.debug("Cache hit for %s at %s", uri, cached)
+                # Record the access for least-recently-used eviction.
+                with contextlib.suppress(FileNotFoundError):
+                    os.utime(cached)
+            else:
+                with self._lock:
+                    self.misses += 1
+                log.debug("Cache miss for %s; downloading to %s", uri, cached)
+                with uri.as_local() as local_uri:
+                    self._insert(local_uri, cached)
+                if not self._link(cached, private):
+                    # Evicted by another process already; this can only
+                    # happen if the cache is far too small to be useful.
+                    raise RuntimeError(f"File {cached} was evicted from the cache before it could be read.")
+                self._evict()
+            yield ButlerURI(private)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(private)
+
+    @staticmethod
+    def _link(cached: str, private: str) -> bool:
+        """Make a private link to (or copy of) a cached file.
+
+        Parameters
+        ----------
+        cached : `str`
+            Path of the file in the cache.
+        private : `str`
+            Path of the link to create.
+
+        Returns
+        -------
+        found : `bool`
+            `False` if the cached file does not exist.
+        """
+        try:
+            os.link(cached, private)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # Hard links are not supported by all file systems.
+            try:
+                shutil.copyfile(cached, private)
+            except FileNotFoundError:
+                return False
+        return True
+
+    def _insert(self, local_uri: ButlerURI, cached: str) -> None:
+        """Atomically add a local file to the cache.
+
+        Parameters
+        ----------
+        local_uri : `ButlerURI`
+            Local copy of the artifact, as provided by `ButlerURI.as_local`.
+            Temporary files are moved rather than copied.
+        cached : `str`
+            Path of the file in the cache.
+        """
+        assert self.root is not None
+        staging = os.path.join(self.root, f".staging-{uuid.uuid4().hex}")
+        try:
+            if local_uri.isTemporary:
+                shutil.move(local_uri.ospath, staging)
+            else:
+                shutil.copyfile(local_uri.ospath, staging)
+            # Another process may have inserted the same file in the meantime;
+            # that is harmless, since the contents are the same.
+            os.replace(staging, cached)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(staging)
+            raise
+
+    def _removeStaleFiles(self) -> None:
+        """Remove temporary files older than `staleAge` from the cache
+        directory.
+
+        Notes
+        -----
+        Ages are taken from the inode change time, which is updated whenever
+        a file is created, renamed or linked, so a file that is in use by a
+        reader is never considered stale.
+        """
+        assert self.root is not None
+        cutoff = time.time() - self.staleAge
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if not entry.name.startswith((".reading-", ".staging-")):
+                    continue
+                try:
+                    if entry.stat().st_ctime < cutoff:
+                        os.remove(entry.path)
+                        log.debug("Removed stale temporary file %s from cache", entry.path)
+                except FileNotFoundError:
+                    # Removed by another process.
+                    pass
+
+    def _evict(self) -> None:
+        """Remove least-recently used files until the cache is within its
+        size limit.
+        """
+        if self.maxSize is None:
+            return
+        assert self.root is not None
+        entries = []
+        total = 0
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.maxSize:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.maxSize:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Already evicted by another process.
+                pass
+            else:
+                with self._lock:
+                    self.evictions += 1
+                log.debug("Evicted %s from cache", path)
+            total -= size
@@ -39,3 +39,4 @@ from ._config import *
 from ._universe import *
 from ._coordinate import *
 from ._dataCoordinateIterable import *
+from ._dataCoordinateBatch import *
@@ -766,8 +766,35 @@ class _BasicTupleDataCoordinate(DataCoordinate):
     def __init__(self, graph: DimensionGraph, values: Tuple[DataIdValue, ...]):
         self._graph = graph
         self._values = values
+        self._hash: Optional[int] = None
 
-    __slots__ = ("_graph", "_values")
+    __slots__ = ("_graph", "_values", "_hash")
+
+    def __hash__(self) -> int:
+        # Docstring inherited from DataCoordinate.
+        # Same value as DataCoordinate.__hash__, because values for required
+        # dimensions come first, in the same order as graph.required.
+        if self._hash is None:
+            self._hash = hash((self._graph,) + self._values[:len(self._graph.required)])
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        # Docstring inherited from DataCoordinate.
+        if not isinstance(other, _BasicTupleDataCoordinate):
+            return super().__eq__(other)
+        if self is other:
+            return True
+        if self._graph is not other._graph and self._graph != other._graph:
+            return False
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        n = len(self._graph.required)
+        return self._values[:n] == other._values[:n]
+
+    def __reduce__(self) -> tuple:
+        # The cached hash must not be pickled, since hashes of strings differ
+        # between processes.
+        return (_BasicTupleDataCoordinate, (self._graph, self._values))
 
     @property
     def graph(self) -> DimensionGraph:
@@ -885,6 +912,10 @@ class _ExpandedTupleDataCoordinate(_BasicTupleDataCoordinate):
 
     __slots__ = ("_records",)
 
+    def __reduce__(self) -> tuple:
+        # Docstring inherited from _BasicTupleDataCoordinate.
+        return (_ExpandedTupleDataCoordinate, (self._graph, self._values, self._records))
+
     def subset(self, graph: DimensionGraph) -> DataCoordinate:
         # Docstring inherited from DataCoordinate.
         if self._graph == graph:
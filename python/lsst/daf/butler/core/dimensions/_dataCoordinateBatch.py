@@ -0,0 +1,461 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+__all__ = (
+    "DataCoordinateBatch",
+)
+
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    overload,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ._coordinate import DataCoordinate, DataIdValue
+from ._dataCoordinateIterable import DataCoordinateIterable
+from ._elements import Dimension
+from ._graph import DimensionGraph
+
+
+def _dtypeFor(dimension: Dimension) -> Any:
+    """Return the NumPy dtype to use for the values of a dimension.
+    """
+    pytype = dimension.primaryKey.getPythonType()
+    if pytype is int:
+        return np.int64
+    elif pytype is str:
+        return str
+    return object
+
+
+def _toPython(value: Any) -> DataIdValue:
+    """Convert a NumPy scalar to the equivalent Python object.
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _factorize(columns: Sequence[np.ndarray]) -> np.ndarray:
+    """Return integer codes that are equal for equal rows.
+
+    Parameters
+    ----------
+    columns : `Sequence` [ `numpy.ndarray` ]
+        At least one array, all with the same length.
+
+    Returns
+    -------
+    codes : `numpy.ndarray`
+        Integer array with the same length as the columns; two elements are
+        equal if and only if the corresponding rows have equal values in all
+        columns.
+    """
+    codes = [np.unique(column, return_inverse=True)[1].reshape(-1) for column in columns]
+    if len(codes) == 1:
+        return codes[0]
+    # Rows of per-column codes are all integers, so they can be compared
+    # even if the columns themselves have different types.
+    _, rowCodes = np.unique(np.stack(codes, axis=1), axis=0, return_inverse=True)
+    return rowCodes.reshape(-1)
+
+
+class DataCoordinateBatch(DataCoordinateIterable, Sequence[DataCoordinate]):
+    """A sequence of data IDs that stores the values for each dimension in a
+    NumPy array.
+
+    Parameters
+    ----------
+    columns : `Mapping` [ `str`, `numpy.ndarray` ]
+        One-dimensional arrays of data ID values keyed by dimension name, all
+        with the same length.  Must include all required dimensions of
+        ``graph``, and either all or none of its implied dimensions; other
+        keys are ignored.
+    graph : `DimensionGraph`
+        Dimensions identified by all data IDs in the batch.
+    size : `int`, optional
+        Number of data IDs in the batch.  Only needed if ``graph`` is empty,
+        and checked against the lengths of the arrays otherwise.
+
+    Raises
+    ------
+    ValueError
+        Raised if columns are missing or have inconsistent lengths.
+
+    Notes
+    -----
+    A batch takes much less memory than the equivalent number of
+    `DataCoordinate` instances, and can be filled directly from query result
+    rows with `fromRows`.  Individual `DataCoordinate` objects are only
+    created when elements are accessed.  Operations that work on whole
+    columns (`subset`, `unique`, `sorted`, `join`) return new batches that
+    share no state with ``self``, other than read-only arrays.
+
+    Data IDs in a batch never have records attached; `hasRecords` always
+    returns `False`.
+
+    This class requires NumPy.
+    """
+    def __init__(self, columns: Mapping[str, np.ndarray], graph: DimensionGraph, *,
+                 size: Optional[int] = None):
+        if np is None:
+            raise ImportError("DataCoordinateBatch requires NumPy.")
+        names: Iterable[str] = graph.required.names
+        if all(name in columns for name in graph.implied.names):
+            names = graph._dataCoordinateIndices.keys()
+        arrays: List[np.ndarray] = []
+        for name in names:
+            try:
+                array = np.asarray(columns[name])
+            except KeyError:
+                raise ValueError(f"No values given for required dimension {name}.") from None
+            if array.ndim != 1:
+                raise ValueError(f"Values for dimension {name} must be a one-dimensional array.")
+            if size is None:
+                size = len(array)
+            elif len(array) != size:
+                raise ValueError(f"Expected {size} values for dimension {name}, got {len(array)}.")
+            # Arrays may be shared between batches, so protect them.
+            array = array.view()
+            array.flags.writeable = False
+            arrays.append(array)
+        if size is None:
+            raise ValueError("Size must be given for a batch of empty data IDs.")
+        self._graph = graph
+        self._columns: Tuple[np.ndarray, ...] = tuple(arrays)
+        self._size = size
+
+    __slots__ = ("_graph", "_columns", "_size")
+
+    @staticmethod
+    def fromRows(rows: Iterable[Sequence[DataIdValue]], graph: DimensionGraph, *,
+                 full: bool = True) -> DataCoordinateBatch:
+        """Construct a batch from rows of data ID values.
+
+        Parameters
+        ----------
+        rows : `Iterable` [ `Sequence` ]
+            Rows of data ID values, ordered with all required dimensions
+            first, in the order of ``graph.required``, followed by all implied
+            dimensions (if ``full`` is `True`) in the order of
+            ``graph.implied``.  Any other values at the end of a row are
+            ignored, so query result rows can be passed directly if their
+            columns are in the right order.
+        graph : `DimensionGraph`
+            Dimensions identified by the data IDs.
+        full : `bool`, optional
+            Whether rows include values for implied dimensions.
+
+        Returns
+        -------
+        batch : `DataCoordinateBatch`
+            New batch.
+        """
+        dimensions = list(graph.required)
+        if full:
+            dimensions.extend(graph.implied)
+        if not dimensions:
+            return DataCoordinateBatch({}, graph, size=sum(1 for _ in rows))
+        values = list(zip(*rows))
+        if not values:
+            values = [()] * len(dimensions)
+        columns = {
+            dimension.name: np.array(columnValues, dtype=_dtypeFor(dimension))
+            for dimension, columnValues in zip(dimensions, values)
+        }
+        return DataCoordinateBatch(columns, graph)
+
+    @staticmethod
+    def fromDataIds(dataIds: Iterable[DataCoordinate], graph: DimensionGraph) -> DataCoordinateBatch:
+        """Construct a batch from `DataCoordinate` instances.
+
+        Parameters
+        ----------
+        dataIds : `Iterable` [ `DataCoordinate` ]
+            Data IDs, with dimensions equal to ``graph``.
+        graph : `DimensionGraph`
+            Dimensions identified by the data IDs.
+
+        Returns
+        -------
+        batch : `DataCoordinateBatch`
+            New batch, with values for implied dimensions if all given data
+            IDs have them.
+        """
+        dataIds = list(dataIds)
+        full = all(dataId.hasFull() for dataId in dataIds)
+        names = graph._dataCoordinateIndices.keys() if full else graph.required.names
+        return DataCoordinateBatch.fromRows(
+            (tuple(dataId[name] for name in names) for dataId in dataIds),
+            graph,
+            full=full,
+        )
+
+    def __str__(self) -> str:
+        return str(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"DataCoordinateBatch({self.columns()!r}, {self._graph!r}, size={self._size})"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[DataCoordinate]:
+        factory = DataCoordinate.fromFullValues if self.hasFull() else DataCoordinate.fromRequiredValues
+        if not self._columns:
+            for _ in range(self._size):
+                yield factory(self._graph, ())
+            return
+        # Convert values to Python objects a chunk at a time, which is much
+        # faster than converting them one at a time.
+        chunkSize = 10000
+        for start in range(0, self._size, chunkSize):
+            chunk = [column[start:start + chunkSize].tolist() for column in self._columns]
+            for values in zip(*chunk):
+                yield factory(self._graph, values)
+
+    @overload
+    def __getitem__(self, index: int) -> DataCoordinate:
+        pass
+
+    @overload  # noqa: F811 (FIXME: remove for py 3.8+)
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> DataCoordinateBatch:  # noqa: F811
+        pass
+
+    def __getitem__(self, index: Any) -> Any:  # noqa: F811
+        if isinstance(index, (int, np.integer)):
+            if index < -self._size or index >= self._size:
+                raise IndexError(f"Index {index} out of range for batch of size {self._size}.")
+            values = tuple(_toPython(column[index]) for column in self._columns)
+            if self.hasFull():
+                return DataCoordinate.fromFullValues(self._graph, values)
+            return DataCoordinate.fromRequiredValues(self._graph, values)
+        size = len(range(self._size)[index]) if isinstance(index, slice) else None
+        if size is None:
+            index = np.asarray(index)
+            size = int(index.sum()) if index.dtype == bool else len(index)
+        return DataCoordinateBatch(self._selectColumns(self._names(), index), self._graph, size=size)
+
+    @property
+    def graph(self) -> DimensionGraph:
+        # Docstring inherited from DataCoordinateIterable.
+        return self._graph
+
+    def hasFull(self) -> bool:
+        # Docstring inherited from DataCoordinateIterable.
+        return len(self._columns) == len(self._graph._dataCoordinateIndices)
+
+    def hasRecords(self) -> bool:
+        # Docstring inherited from DataCoordinateIterable.
+        return False
+
+    def _names(self) -> List[str]:
+        """Return the names of the dimensions with values, in the order of
+        ``self._columns``.
+        """
+        return list(self._graph._dataCoordinateIndices.keys())[:len(self._columns)]
+
+    def _selectColumns(self, names: Iterable[str], index: Any = None) -> Mapping[str, np.ndarray]:
+        """Return a mapping of the given columns, optionally indexed.
+        """
+        indices = self._graph._dataCoordinateIndices
+        if index is None:
+            return {name: self._columns[indices[name]] for name in names}
+        return {name: self._columns[indices[name]][index] for name in names}
+
+    def column(self, dimension: Union[Dimension, str]) -> np.ndarray:
+        """Return the values of a dimension.
+
+        Parameters
+        ----------
+        dimension : `Dimension` or `str`
+            Dimension (or its name).
+
+        Returns
+        -------
+        values : `numpy.ndarray`
+            Read-only array of values for all data IDs in the batch.
+
+        Raises
+        ------
+        KeyError
+            Raised if this batch has no values for the dimension.
+        """
+        name = dimension.name if isinstance(dimension, Dimension) else dimension
+        index = self._graph._dataCoordinateIndices[name]
+        if index >= len(self._columns):
+            raise KeyError(name)
+        return self._columns[index]
+
+    def columns(self) -> Mapping[str, np.ndarray]:
+        """Return the values of all dimensions in the batch.
+
+        Returns
+        -------
+        columns : `dict` [ `str`, `numpy.ndarray` ]
+            Read-only arrays of values keyed by dimension name.
+        """
+        return self._selectColumns(self._names())
+
+    def _requiredValues(self) -> List[Tuple[DataIdValue, ...]]:
+        # Docstring inherited from DataCoordinateIterable.
+        if not self._graph.required:
+            return [()]*self._size
+        return list(zip(*[column.tolist() for column in self._columns[:len(self._graph.required)]]))
+
+    def subset(self, graph: DimensionGraph) -> DataCoordinateBatch:
+        """Return a batch whose data IDs identify a subset of the dimensions
+        that this one's do.
+
+        Parameters
+        ----------
+        graph : `DimensionGraph`
+            Dimensions to be identified by the data IDs in the returned
+            batch.  Must be a subset of ``self.graph``.
+
+        Returns
+        -------
+        batch : `DataCoordinateBatch`
+            A batch with ``batch.graph == graph``.  Will be ``self`` if
+            ``graph == self.graph``.  Elements are equivalent to those that
+            would be created by calling `DataCoordinate.subset` on all
+            elements in ``self``, in the same order and with no
+            deduplication.
+
+        Raises
+        ------
+        ValueError
+            Raised if ``graph`` is not a subset of ``self.graph``.
+        """
+        if graph == self._graph:
+            return self
+        if not graph.issubset(self._graph):
+            raise ValueError(f"{graph} is not a subset of {self._graph}.")
+        if self.hasFull() or graph.dimensions.names <= self._graph.required.names:
+            names: Iterable[str] = graph._dataCoordinateIndices.keys()
+        else:
+            names = graph.required.names
+        return DataCoordinateBatch(self._selectColumns(names), graph, size=self._size)
+
+    def unique(self) -> DataCoordinateBatch:
+        """Return a batch with duplicate data IDs removed.
+
+        Returns
+        -------
+        batch : `DataCoordinateBatch`
+            A batch with the first occurrence of each distinct data ID in
+            ``self``, in the same order.
+        """
+        if self._size <= 1:
+            return self
+        if not self._graph.required:
+            return self[:1]
+        codes = _factorize(self._columns[:len(self._graph.required)])
+        _, index = np.unique(codes, return_index=True)
+        if len(index) == self._size:
+            return self
+        index.sort()
+        return self[index]
+
+    def sorted(self) -> DataCoordinateBatch:
+        """Return a batch with the data IDs in sorted order.
+
+        Returns
+        -------
+        batch : `DataCoordinateBatch`
+            A batch with the same data IDs as ``self``, in the order defined
+            by `DataCoordinate.__lt__` (i.e. by the values of the required
+            dimensions, in the order of ``graph.required``).  The sort is
+            stable.
+        """
+        if self._size <= 1 or not self._graph.required:
+            return self
+        # lexsort uses the last key as the primary one.
+        order = np.lexsort(self._columns[len(self._graph.required) - 1::-1])
+        return self[order]
+
+    def join(self, other: DataCoordinateBatch) -> DataCoordinateBatch:
+        """Join this batch to another on their common dimensions.
+
+        Parameters
+        ----------
+        other : `DataCoordinateBatch`
+            Batch to join to.
+
+        Returns
+        -------
+        batch : `DataCoordinateBatch`
+            A batch with ``batch.graph == self.graph.union(other.graph)``,
+            with one data ID for each pair of data IDs in ``self`` and
+            ``other`` that have the same values for all dimensions for which
+            both have values (or every pair, if there are no such dimensions).
+            Data IDs are ordered first by their position in ``self`` and then
+            by their position in ``other``.
+
+        Raises
+        ------
+        ValueError
+            Raised if the batches together do not have values for all
+            required dimensions of the joined graph.
+        """
+        graph = self._graph.union(other._graph)
+        selfNames = self._names()
+        otherNames = set(other._names())
+        common = [name for name in selfNames if name in otherNames]
+        n = self._size
+        if common:
+            codes = _factorize([np.concatenate([self.column(name), other.column(name)])
+                                for name in common])
+            selfCodes = codes[:n]
+            otherCodes = codes[n:]
+            # Sort other's rows by code, then find the range of matching rows
+            # in it for each of self's rows.
+            otherOrder = np.argsort(otherCodes, kind="stable")
+            otherSorted = otherCodes[otherOrder]
+            starts = np.searchsorted(otherSorted, selfCodes, side="left")
+            counts = np.searchsorted(otherSorted, selfCodes, side="right") - starts
+            total = int(counts.sum())
+            selfIndex = np.repeat(np.arange(n), counts)
+            # For each output row, position within its group of matches, plus
+            # the start of that group in otherSorted.
+            groupStarts = np.cumsum(counts) - counts
+            offsets = np.arange(total) - np.repeat(groupStarts, counts) + np.repeat(starts, counts)
+            otherIndex = otherOrder[offsets]
+        else:
+            total = n * other._size
+            selfIndex = np.repeat(np.arange(n), other._size)
+            otherIndex = np.tile(np.arange(other._size), n)
+        columns = self._selectColumns(selfNames, selfIndex)
+        columns.update(other._selectColumns([name for name in other._names() if name not in columns],
+                                            otherIndex))
+        return DataCoordinateBatch(columns, graph, size=total)
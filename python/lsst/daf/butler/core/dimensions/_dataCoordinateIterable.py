@@ -28,6 +28,7 @@ __all__ = (
 )
 
 from abc import abstractmethod
+from contextlib import contextmanager
 from typing import (
     AbstractSet,
     Any,
@@ -40,15 +41,28 @@ from typing import (
     Optional,
     overload,
     Sequence,
+    Tuple,
+    TYPE_CHECKING,
 )
 
 import sqlalchemy
 
+from .. import ddl
 from ..simpleQuery import SimpleQuery
-from ._coordinate import DataCoordinate
+from ._coordinate import DataCoordinate, DataIdValue
 from ._graph import DimensionGraph
+from ._schema import addDimensionForeignKey
 from ._universe import DimensionUniverse
 
+if TYPE_CHECKING:
+    from ...registry.interfaces import Database
+
+
+# Minimum number of data IDs for which DataCoordinateIterable.
+# constrainInSession uploads them to a temporary table instead of adding them
+# to the WHERE clause.
+_TEMPORARY_TABLE_THRESHOLD = 1000
+
 
 class DataCoordinateIterable(Iterable[DataCoordinate]):
     """An abstract base class for homogeneous iterables of data IDs.
@@ -166,16 +180,110 @@ class DataCoordinateIterable(Iterable[DataCoordinate]):
             A callable that accepts `str` dimension names and returns
             SQLAlchemy objects representing a column for that dimension's
             primary key value in the query.
+
+        Notes
+        -----
+        The default implementation adds an ``IN`` expression to the WHERE
+        clause, using row values (tuples) if there is more than one required
+        dimension.  For very large iterables, `constrainInSession` may be
+        much more efficient.
         """
-        toOrTogether: List[sqlalchemy.sql.ColumnElement] = []
-        for dataId in self:
-            toOrTogether.append(
-                sqlalchemy.sql.and_(*[
-                    columns(dimension.name) == dataId[dimension.name]
-                    for dimension in self.graph.required
-                ])
-            )
-        query.where.append(sqlalchemy.sql.or_(*toOrTogether))
+        self._constrainWhere(query, columns, self._requiredValues())
+
+    @contextmanager
+    def constrainInSession(self, query: SimpleQuery, columns: Callable[[str], sqlalchemy.sql.ColumnElement],
+                           db: Database) -> Iterator[None]:
+        """Constrain a SQL query to include or relate to only data IDs in
+        this iterable, using a temporary table if there are many of them.
+
+        Parameters
+        ----------
+        query : `SimpleQuery`
+            Struct that represents the SQL query to constrain, either by
+            appending to its WHERE clause, joining a new table or subquery,
+            or both.
+        columns : `Callable`
+            A callable that accepts `str` dimension names and returns
+            SQLAlchemy objects representing a column for that dimension's
+            primary key value in the query.
+        db : `Database`
+            Database the query will be executed against.
+
+        Returns
+        -------
+        context : `typing.ContextManager` [ `None` ]
+            A context manager that constrains the query in ``__enter__``.  The
+            query must be executed before ``__exit__``, which drops any
+            temporary table created to hold the data IDs.
+
+        Notes
+        -----
+        This behaves like `constrain` unless there are at least
+        ``_TEMPORARY_TABLE_THRESHOLD`` data IDs; larger iterables are inserted
+        into a temporary table that is joined to the query, which avoids the
+        cost of compiling (and parsing) very large SQL expressions as well as
+        database limits on their size.
+        """
+        values = self._requiredValues()
+        if len(values) < _TEMPORARY_TABLE_THRESHOLD:
+            self._constrainWhere(query, columns, values)
+            yield
+            return
+        names = self.graph.required.names
+        spec = ddl.TableSpec(fields=())
+        for dimension in self.graph.required:
+            addDimensionForeignKey(spec, dimension, primaryKey=True, constraint=False)
+        with db.session() as session:
+            table = session.makeTemporaryTable(spec)
+            try:
+                db.insert(table, *[dict(zip(names, row)) for row in dict.fromkeys(values)])
+                query.join(
+                    table,
+                    onclause=sqlalchemy.sql.and_(*[columns(name) == table.columns[name] for name in names])
+                )
+                yield
+            finally:
+                session.dropTemporaryTable(table)
+
+    def _requiredValues(self) -> List[Tuple[DataIdValue, ...]]:
+        """Return the values of the required dimensions of all data IDs in
+        this iterable.
+
+        Returns
+        -------
+        values : `list` [ `tuple` ]
+            Tuples of required dimension values, in the order of
+            ``self.graph.required``.
+        """
+        names = self.graph.required.names
+        return [tuple(dataId[name] for name in names) for dataId in self]
+
+    def _constrainWhere(self, query: SimpleQuery, columns: Callable[[str], sqlalchemy.sql.ColumnElement],
+                        values: List[Tuple[DataIdValue, ...]]) -> None:
+        """Add a WHERE clause term that constrains a query to the given data
+        ID values.
+
+        Parameters
+        ----------
+        query : `SimpleQuery`
+            Struct that represents the SQL query to constrain.
+        columns : `Callable`
+            A callable that accepts `str` dimension names and returns
+            SQLAlchemy objects representing a column for that dimension's
+            primary key value in the query.
+        values : `list` [ `tuple` ]
+            Tuples of required dimension values, as returned by
+            `_requiredValues`.
+        """
+        names = list(self.graph.required.names)
+        if not names:
+            return
+        if not values:
+            query.where.append(sqlalchemy.sql.false())
+        elif len(names) == 1:
+            query.where.append(columns(names[0]).in_([row[0] for row in values]))
+        else:
+            query.where.append(sqlalchemy.sql.tuple_(*[columns(name) for name in names]).in_(values))
 
     @abstractmethod
     def subset(self, graph: DimensionGraph) -> DataCoordinateIterable:
@@ -174,6 +174,9 @@ class DimensionGraph:
         self._dataCoordinateIndices: Dict[str, int] = {
             name: i for i, name in enumerate(itertools.chain(self.required.names, self.implied.names))
         }
+        # Graphs are hashed (directly or via DataCoordinate) very often, and
+        # they are immutable.
+        self._hash = hash(tuple(self.dimensions.names))
 
     def __getnewargs__(self) -> tuple:
         return (self.universe, None, tuple(self.dimensions.names), False)
@@ -309,13 +312,16 @@ class DimensionGraph:
         """Test whether ``self`` and ``other`` have exactly the same dimensions
         and elements.
         """
+        if self is other:
+            # Graphs are cached by their universe, so this is the common case.
+            return True
         if isinstance(other, DimensionGraph):
             return self.dimensions == other.dimensions
         else:
             return False
 
     def __hash__(self) -> int:
-        return hash(tuple(self.dimensions.names))
+        return self._hash
 
     def __le__(self, other: DimensionGraph) -> bool:
         """Test whether ``self`` is a subset of ``other``.
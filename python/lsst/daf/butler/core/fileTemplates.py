@@ -33,6 +33,7 @@ from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Dict,
     Iterable,
     Mapping,
     Optional,
@@ -105,6 +106,9 @@ class FileTemplates:
                  universe: DimensionUniverse):
         self.config = FileTemplatesConfig(config)
         self._templates = {}
+        # Matching template key (`None` for the default) for each tuple of
+        # lookup names seen so far.
+        self._matchCache: Dict[Tuple[LookupKey, ...], Optional[LookupKey]] = {}
 
         contents = processLookupConfigs(self.config, universe=universe)
 
@@ -251,13 +255,17 @@ class FileTemplates:
         names = entity._lookupNames()
 
         # Get a location from the templates
-        template = self.default
-        source = self.defaultKey
-        for name in names:
-            if name in self.templates:
-                template = self.templates[name]
-                source = name
-                break
+        try:
+            match = self._matchCache[names]
+        except KeyError:
+            match = next((name for name in names if name in self._templates), None)
+            self._matchCache[names] = match
+        if match is None:
+            template = self.default
+            source = self.defaultKey
+        else:
+            template = self._templates[match]
+            source = match
 
         if template is None:
             raise KeyError(f"Unable to determine file template from supplied argument [{entity}]")
@@ -31,6 +31,7 @@ import copy
 from typing import (
     AbstractSet,
     Any,
+    BinaryIO,
     ClassVar,
     Dict,
     Iterator,
@@ -283,6 +284,77 @@ class Formatter(metaclass=ABCMeta):
         """
         raise NotImplementedError("Type does not support writing to bytes.")
 
+    @classmethod
+    def can_read_stream(cls) -> bool:
+        """Indicate if this formatter can read from a file-like stream.
+
+        Returns
+        -------
+        can : `bool`
+            `True` if the `fromStream` method is implemented.
+        """
+        return False
+
+    @classmethod
+    def can_write_stream(cls) -> bool:
+        """Indicate if this formatter can write to a file-like stream.
+
+        Returns
+        -------
+        can : `bool`
+            `True` if the `toStream` method is implemented.
+        """
+        return False
+
+    @classmethod
+    def can_read_ranges(cls) -> bool:
+        """Indicate if this formatter reads only the parts of a stream it
+        needs.
+
+        Returns
+        -------
+        can : `bool`
+            `True` if `fromStream` accepts a seekable stream (such as one
+            returned by `ButlerURI.open_ranged`) and, given read parameters
+            or a component, reads only the parts of it that are needed.
+            Formatters that need to seek should return `False` from
+            `can_read_stream`, so that full reads do not give them a
+            forward-only stream.
+        """
+        return False
+
+    def fromStream(self, stream: BinaryIO, component: Optional[str] = None) -> Any:
+        """Read a Dataset or its component from a binary file-like stream.
+
+        Parameters
+        ----------
+        stream : file-like
+            Binary stream to read, such as one returned by `ButlerURI.open`.
+        component : `str`, optional
+            Component to read from the Dataset. Only used if the `StorageClass`
+            for reading differed from the `StorageClass` used to write the
+            file.
+
+        Returns
+        -------
+        inMemoryDataset : `object`
+            The requested data as a Python object. The type of object
+            is controlled by the specific formatter.
+        """
+        raise NotImplementedError("Type does not support reading from a stream.")
+
+    def toStream(self, inMemoryDataset: Any, stream: BinaryIO) -> None:
+        """Serialize the Dataset to a binary file-like stream.
+
+        Parameters
+        ----------
+        inMemoryDataset : `object`
+            The Python object to serialize.
+        stream : file-like
+            Binary stream to write, such as one returned by `ButlerURI.open`.
+        """
+        raise NotImplementedError("Type does not support writing to a stream.")
+
     @contextlib.contextmanager
     def _updateLocation(self, location: Optional[Location]) -> Iterator[Location]:
         """Temporarily replace the location associated with this formatter.
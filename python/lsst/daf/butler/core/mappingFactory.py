@@ -28,6 +28,7 @@ from typing import (
     Dict,
     Iterable,
     List,
+    Optional,
     Set,
     Tuple,
     Type,
@@ -59,6 +60,9 @@ class MappingFactory:
 
     def __init__(self, refType: Type):
         self._registry: Dict[LookupKey, Dict[str, Any]] = {}
+        # Results of successful lookups, keyed by the tuple of normalized
+        # targets; cleared whenever the registry is modified.
+        self._matchCache: Dict[Tuple[Optional[LookupKey], ...], Tuple[LookupKey, Type, Dict[Any, Any]]] = {}
         self.refType = refType
 
     def __contains__(self, key: Any) -> bool:
@@ -115,19 +119,22 @@ class MappingFactory:
             Raised if none of the supplied target classes match an item in the
             registry.
         """
-        attempts: List[Any] = []
-        for t in (targetClasses):
-            if t is None:
-                attempts.append(t)
-            else:
-                key = self._getNameKey(t)
-                attempts.append(key)
+        attempts: List[Optional[LookupKey]] = [None if t is None else self._getNameKey(t)
+                                               for t in targetClasses]
+        cacheKey = tuple(attempts)
+        cached = self._matchCache.get(cacheKey)
+        if cached is not None:
+            return cached
+        for key in attempts:
+            if key is not None:
                 try:
                     entry = self._registry[key]
                 except KeyError:
                     pass
                 else:
-                    return key, getClassOf(entry["type"]), entry["kwargs"]
+                    result = (key, getClassOf(entry["type"]), entry["kwargs"])
+                    self._matchCache[cacheKey] = result
+                    return result
 
         # Convert list to a string for error reporting
         msg = ", ".join(str(k) for k in attempts)
@@ -264,6 +271,7 @@ class MappingFactory:
         self._registry[key] = {"type": typeName,
                                "kwargs": dict(**kwargs),
                                }
+        self._matchCache.clear()
 
     @staticmethod
     def _getNameKey(typeOrName: Any) -> LookupKey:
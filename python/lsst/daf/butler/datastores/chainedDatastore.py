@@ -249,6 +249,24 @@ class ChainedDatastore(Datastore):
                 return True
         return False
 
+    def mexists(self, refs: Iterable[DatasetRef],
+                checkArtifacts: bool = True) -> Dict[DatasetRef, bool]:
+        # Docstring inherited from Datastore.mexists.
+        refs = list(refs)
+        existence = {ref: False for ref in refs}
+        remaining = refs
+        for datastore in self.datastores:
+            if not remaining:
+                break
+            childExistence = datastore.mexists(remaining, checkArtifacts=checkArtifacts)
+            remaining = []
+            for ref, exists in childExistence.items():
+                if exists:
+                    existence[ref] = True
+                else:
+                    remaining.append(ref)
+        return existence
+
     def get(self, ref: DatasetRef, parameters: Optional[Mapping[str, Any]] = None) -> Any:
         """Load an InMemoryDataset from the store.
 
@@ -483,6 +501,45 @@ class ChainedDatastore(Datastore):
 
         raise FileNotFoundError("Dataset {} not in any datastore".format(ref))
 
+    def getManyURIs(self, refs: Iterable[DatasetRef], predict: bool = False
+                    ) -> Dict[DatasetRef, Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]]:
+        # Docstring inherited from Datastore.getManyURIs.
+        # Choose the datastore to ask about each dataset with the same
+        # preferences as getURIs, but checking each child only once.
+        refs = list(refs)
+        chosen: Dict[DatasetRef, Datastore] = {}
+        firstEphemeral: Dict[DatasetRef, Datastore] = {}
+        for datastore in self.datastores:
+            candidates = [ref for ref in refs
+                          if ref not in chosen and not (datastore.isEphemeral and ref in firstEphemeral)]
+            if not candidates:
+                continue
+            for ref, exists in datastore.mexists(candidates).items():
+                if not exists:
+                    continue
+                if datastore.isEphemeral:
+                    firstEphemeral[ref] = datastore
+                else:
+                    chosen[ref] = datastore
+        for ref, datastore in firstEphemeral.items():
+            chosen.setdefault(ref, datastore)
+
+        missing = [ref for ref in refs if ref not in chosen]
+        if missing:
+            if not predict or not self.datastores:
+                raise FileNotFoundError("Dataset {} not in any datastore".format(missing[0]))
+            predictor = next((d for d in self.datastores if not d.isEphemeral), self.datastores[0])
+
+        byDatastore: Dict[int, Tuple[Datastore, List[DatasetRef]]] = {}
+        for ref, datastore in chosen.items():
+            byDatastore.setdefault(id(datastore), (datastore, []))[1].append(ref)
+        uris = {}
+        for datastore, datastoreRefs in byDatastore.values():
+            uris.update(datastore.getManyURIs(datastoreRefs))
+        if missing:
+            uris.update(predictor.getManyURIs(missing, predict=True))
+        return {ref: uris[ref] for ref in refs}
+
     def getURI(self, ref: DatasetRef, predict: bool = False) -> ButlerURI:
         """URI to the Dataset.
 
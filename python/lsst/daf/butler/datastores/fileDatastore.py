@@ -24,6 +24,8 @@ from __future__ import annotations
 
 __all__ = ("FileDatastore", )
 
+import contextlib
+import functools
 import hashlib
 import logging
 import os
@@ -31,19 +33,24 @@ import tempfile
 
 from sqlalchemy import BigInteger, String
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Iterable,
     List,
     Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
 )
 
@@ -51,6 +58,7 @@ from lsst.daf.butler import (
     ButlerURI,
     CompositesMap,
     Config,
+    DatastoreCacheManager,
     FileDataset,
     DatasetRef,
     DatasetType,
@@ -88,6 +96,8 @@ log = logging.getLogger(__name__)
 # String to use when a Python None is encountered
 NULLSTR = "__NULL_STRING__"
 
+_T = TypeVar("_T")
+
 
 class _IngestPrepData(Datastore.IngestPrepData):
     """Helper class for FileDatastore ingest implementation.
@@ -286,6 +296,20 @@ class FileDatastore(GenericBaseDatastore):
         # requested dataset is not known to registry
         self.trustGetRequest = self.config.get("trust_get_request", False)
 
+        # Local cache for artifacts read from remote storage.
+        self.cacheManager = DatastoreCacheManager(self.config.get("cache"))
+
+        # Maximum number of threads to use when reading or writing the
+        # artifacts of a single dataset; 1 disables concurrent I/O.
+        self.ioThreads = max(int(self.config.get("io_threads", 1)), 1)
+
+        # Maximum number of threads to use when transferring and checksumming
+        # files during ingest; defaults to the artifact I/O thread count.
+        self.ingestThreads = max(int(self.config.get("ingest_threads", self.ioThreads)), 1)
+
+        # Maximum number of trashed datasets to remove at once.
+        self.trashChunkSize = max(int(self.config.get("trash_chunk_size", 1000)), 1)
+
         # Check existence and create directory structure if necessary
         if not self.root.exists():
             if "create" not in self.config or not self.config["create"]:
@@ -351,29 +375,59 @@ class FileDatastore(GenericBaseDatastore):
             )
         self._table.insert(*records)
 
+    def _record_to_info(self, record: Mapping[str, Any]) -> StoredFileInfo:
+        """Convert a row of the internal records table to `StoredFileInfo`.
+
+        Parameters
+        ----------
+        record : `dict`
+            A single row from the records table.
+
+        Returns
+        -------
+        info : `StoredFileInfo`
+            The stored information associated with that row.
+        """
+        # Convert name of StorageClass to instance
+        storageClass = self.storageClassFactory.getStorageClass(record["storage_class"])
+        component = record["component"] if (record["component"]
+                                            and record["component"] != NULLSTR) else None
+
+        return StoredFileInfo(formatter=record["formatter"],
+                              path=record["path"],
+                              storageClass=storageClass,
+                              component=component,
+                              checksum=record["checksum"],
+                              file_size=record["file_size"])
+
     def getStoredItemsInfo(self, ref: DatasetIdRef) -> List[StoredFileInfo]:
         # Docstring inherited from GenericBaseDatastore
 
         # Look for the dataset_id -- there might be multiple matches
         # if we have disassembled the dataset.
         records = list(self._table.fetch(dataset_id=ref.id))
+        return [self._record_to_info(record) for record in records]
 
-        results = []
-        for record in records:
-            # Convert name of StorageClass to instance
-            storageClass = self.storageClassFactory.getStorageClass(record["storage_class"])
-            component = record["component"] if (record["component"]
-                                                and record["component"] != NULLSTR) else None
-
-            info = StoredFileInfo(formatter=record["formatter"],
-                                  path=record["path"],
-                                  storageClass=storageClass,
-                                  component=component,
-                                  checksum=record["checksum"],
-                                  file_size=record["file_size"])
-            results.append(info)
+    def _get_stored_records_associated_with_refs(self, refs: Iterable[DatasetIdRef]
+                                                 ) -> Dict[int, List[StoredFileInfo]]:
+        """Retrieve all records associated with the provided refs using a
+        single set-based query.
 
-        return results
+        Parameters
+        ----------
+        refs : iterable of `DatasetIdRef`
+            The refs for which records are to be retrieved.
+
+        Returns
+        -------
+        records : `dict` [`int`, `list` [`StoredFileInfo`]]
+            The matching records indexed by the ref ID.  Refs that have no
+            records in this datastore are not included.
+        """
+        records: Dict[int, List[StoredFileInfo]] = defaultdict(list)
+        for record in self._table.fetch(dataset_id=[ref.id for ref in refs]):
+            records[record["dataset_id"]].append(self._record_to_info(record))
+        return records
 
     def _registered_refs_per_artifact(self, pathInStore: ButlerURI) -> Set[int]:
         """Return all dataset refs associated with the supplied path.
@@ -413,7 +467,23 @@ class FileDatastore(GenericBaseDatastore):
         """
         # Get the file information (this will fail if no file)
         records = self.getStoredItemsInfo(ref)
+        return self._get_locations_from_records(records)
+
+    def _get_locations_from_records(self, records: Iterable[StoredFileInfo]
+                                    ) -> List[Tuple[Location, StoredFileInfo]]:
+        r"""Determine the `Location`\ s associated with stored file records.
 
+        Parameters
+        ----------
+        records : iterable of `StoredFileInfo`
+            Stored information about each file associated with one dataset.
+
+        Returns
+        -------
+        results : `list` [`tuple` [`Location`, `StoredFileInfo` ]]
+            Location of each file within the datastore and the associated
+            stored information.
+        """
         # Use the path to determine the location -- we need to take
         # into account absolute URIs in the datastore record
         locations: List[Tuple[Location, StoredFileInfo]] = []
@@ -520,7 +590,9 @@ class FileDatastore(GenericBaseDatastore):
                 for location, formatter, storageClass, component in all_info]
 
     def _prepare_for_get(self, ref: DatasetRef,
-                         parameters: Optional[Mapping[str, Any]] = None) -> List[DatastoreFileGetInformation]:
+                         parameters: Optional[Mapping[str, Any]] = None, *,
+                         fileLocations: Optional[List[Tuple[Location, StoredFileInfo]]] = None
+                         ) -> List[DatastoreFileGetInformation]:
         """Check parameters for ``get`` and obtain formatter and
         location.
 
@@ -531,6 +603,10 @@ class FileDatastore(GenericBaseDatastore):
         parameters : `dict`
             `StorageClass`-specific parameters that specify, for example,
             a slice of the dataset to be loaded.
+        fileLocations : `list` [`tuple`], optional
+            Locations and stored information for this dataset that have
+            already been retrieved from the internal records.  If `None`
+            they will be looked up.
 
         Returns
         -------
@@ -540,7 +616,8 @@ class FileDatastore(GenericBaseDatastore):
         log.debug("Retrieve %s from %s with parameters %s", ref, self.name, parameters)
 
         # Get file metadata and internal metadata
-        fileLocations = self._get_dataset_locations_info(ref)
+        if fileLocations is None:
+            fileLocations = self._get_dataset_locations_info(ref)
         if not fileLocations:
             if not self.trustGetRequest:
                 raise FileNotFoundError(f"Could not retrieve dataset {ref}.")
@@ -761,7 +838,8 @@ class FileDatastore(GenericBaseDatastore):
 
     def _extractIngestInfo(self, path: Union[str, ButlerURI], ref: DatasetRef, *,
                            formatter: Union[Formatter, Type[Formatter]],
-                           transfer: Optional[str] = None) -> StoredFileInfo:
+                           transfer: Optional[str] = None,
+                           location: Optional[Location] = None) -> StoredFileInfo:
         """Relocate (if necessary) and extract `StoredFileInfo` from a
         to-be-ingested file.
 
@@ -777,6 +855,11 @@ class FileDatastore(GenericBaseDatastore):
         transfer : `str`, optional
             How (and whether) the dataset should be added to the datastore.
             See `ingest` for details of transfer modes.
+        location : `Location`, optional
+            Target location of the file inside the datastore, as computed by
+            `_calculate_ingested_datastore_name`, for transfer modes other
+            than `None` and ``"direct"``.  If given, the caller is
+            responsible for having created its parent directory.
 
         Returns
         -------
@@ -826,10 +909,11 @@ class FileDatastore(GenericBaseDatastore):
         else:
             # Work out the name we want this ingested file to have
             # inside the datastore
-            tgtLocation = self._calculate_ingested_datastore_name(srcUri, ref, formatter)
-            if not tgtLocation.uri.dirname().exists():
-                log.debug("Folder %s does not exist yet.", tgtLocation.uri.dirname())
-                tgtLocation.uri.dirname().mkdir()
+            if location is not None:
+                tgtLocation = location
+            else:
+                tgtLocation = self._calculate_ingested_datastore_name(srcUri, ref, formatter)
+                self._makeIngestDirectory(tgtLocation.uri.dirname())
 
             # if we are transferring from a local file to a remote location
             # it may be more efficient to get the size and checksum of the
@@ -881,14 +965,52 @@ class FileDatastore(GenericBaseDatastore):
     @transactional
     def _finishIngest(self, prepData: Datastore.IngestPrepData, *, transfer: Optional[str] = None) -> None:
         # Docstring inherited from Datastore._finishIngest.
+        datasets = list(prepData.datasets)
+        locations: List[Optional[Location]] = [None] * len(datasets)
+        if transfer is not None and transfer != "direct":
+            # Work out where every file will go up front, so each distinct
+            # directory is only checked for and created once, and the
+            # transfers themselves never race to create the same directory.
+            directories: Dict[str, ButlerURI] = {}
+            for i, dataset in enumerate(datasets):
+                # Do ingest as if the first dataset ref is associated with
+                # the file.
+                location = self._calculate_ingested_datastore_name(
+                    ButlerURI(dataset.path, forceAbsolute=False), dataset.refs[0], dataset.formatter
+                )
+                locations[i] = location
+                directory = location.uri.dirname()
+                directories.setdefault(str(directory), directory)
+            self._map_artifacts(self._makeIngestDirectory, list(directories.values()),
+                                nThreads=self.ingestThreads)
+
+        def ingestOne(item: Tuple[FileDataset, Optional[Location]]) -> StoredFileInfo:
+            dataset, location = item
+            return self._extractIngestInfo(dataset.path, dataset.refs[0], formatter=dataset.formatter,
+                                           transfer=transfer, location=location)
+
+        # Transfers and checksums are independent for each file, so overlap
+        # them; all of the records are then inserted in one bulk write.
+        infos = self._map_artifacts(ingestOne, list(zip(datasets, locations)), nThreads=self.ingestThreads)
         refsAndInfos = []
-        for dataset in prepData.datasets:
-            # Do ingest as if the first dataset ref is associated with the file
-            info = self._extractIngestInfo(dataset.path, dataset.refs[0], formatter=dataset.formatter,
-                                           transfer=transfer)
+        for dataset, info in zip(datasets, infos):
             refsAndInfos.extend([(ref, info) for ref in dataset.refs])
         self._register_datasets(refsAndInfos)
 
+    @staticmethod
+    def _makeIngestDirectory(directory: ButlerURI) -> None:
+        """Create a directory to ingest files into if it does not already
+        exist.
+
+        Parameters
+        ----------
+        directory : `ButlerURI`
+            Directory to create.
+        """
+        if not directory.exists():
+            log.debug("Folder %s does not exist yet.", directory)
+            directory.mkdir()
+
     def _calculate_ingested_datastore_name(self, srcUri: ButlerURI, ref: DatasetRef,
                                            formatter: Union[Formatter, Type[Formatter]]) -> Location:
         """Given a source URI and a DatasetRef, determine the name the
@@ -971,13 +1093,19 @@ class FileDatastore(GenericBaseDatastore):
             formatter.write(inMemoryDataset)
             log.debug("Successfully wrote python object to local file at %s", uri)
         else:
-            # This is a remote URI, so first try bytes and write directly else
-            # fallback to a temporary file
+            # This is a remote URI, so first try streaming and then bytes to
+            # write directly else fallback to a temporary file
             try:
-                serializedDataset = formatter.toBytes(inMemoryDataset)
-                log.debug("Writing bytes directly to %s", uri)
-                uri.write(serializedDataset, overwrite=True)
-                log.debug("Successfully wrote bytes directly to %s", uri)
+                if formatter.can_write_stream():
+                    log.debug("Streaming dataset directly to %s", uri)
+                    with uri.open("wb") as stream:
+                        formatter.toStream(inMemoryDataset, stream)
+                    log.debug("Successfully streamed dataset directly to %s", uri)
+                else:
+                    serializedDataset = formatter.toBytes(inMemoryDataset)
+                    log.debug("Writing bytes directly to %s", uri)
+                    uri.write(serializedDataset, overwrite=True)
+                    log.debug("Successfully wrote bytes directly to %s", uri)
             except NotImplementedError:
                 with tempfile.NamedTemporaryFile(suffix=uri.getExtension()) as tmpFile:
                     # Need to configure the formatter to write to a different
@@ -1014,16 +1142,6 @@ class FileDatastore(GenericBaseDatastore):
         uri = location.uri
         log.debug("Accessing data from %s", uri)
 
-        # Cannot recalculate checksum but can compare size as a quick check
-        # Do not do this if the size is negative since that indicates
-        # we do not know.
-        recorded_size = getInfo.info.file_size
-        resource_size = uri.size()
-        if recorded_size >= 0 and resource_size != recorded_size:
-            raise RuntimeError("Integrity failure in Datastore. "
-                               f"Size of file {uri} ({resource_size}) "
-                               f"does not match size recorded in registry of {recorded_size}")
-
         # For the general case we have choices for how to proceed.
         # 1. Always use a local file (downloading the remote resource to a
         #    temporary file if needed).
@@ -1034,42 +1152,119 @@ class FileDatastore(GenericBaseDatastore):
 
         formatter = getInfo.formatter
         nbytes_max = 10_000_000  # Arbitrary number that we can tune
-        if resource_size <= nbytes_max and formatter.can_read_bytes():
-            serializedDataset = uri.read()
-            log.debug("Deserializing %s from %d bytes from location %s with formatter %s",
-                      f"component {getInfo.component}" if isComponent else "",
-                      len(serializedDataset), uri, formatter.name())
-            try:
-                result = formatter.fromBytes(serializedDataset,
-                                             component=getInfo.component if isComponent else None)
-            except Exception as e:
-                raise ValueError(f"Failure from formatter '{formatter.name()}' for dataset {ref.id}"
-                                 f" ({ref.datasetType.name} from {uri}): {e}") from e
-        else:
-            # Read from file
-            with uri.as_local() as local_uri:
-                # Have to update the Location associated with the formatter
-                # because formatter.read does not allow an override.
-                # This could be improved.
-                msg = ""
-                newLocation = None
-                if uri != local_uri:
-                    newLocation = Location(*local_uri.split())
-                    msg = "(via download to local file)"
-
-                log.debug("Reading %s from location %s %s with formatter %s",
+        with contextlib.ExitStack() as stack:
+            if self.cacheManager.shouldBeCached(uri) and ref.id is not None:
+                # Read from a local copy of the artifact kept in the cache,
+                # downloading it there first if necessary.
+                readUri = stack.enter_context(self.cacheManager.get(uri, ref, getInfo.info))
+            else:
+                readUri = uri
+
+            # Cannot recalculate checksum but can compare size as a quick
+            # check.  Do not do this if the size is negative since that
+            # indicates we do not know.  A cached copy is checked instead of
+            # the original, so a cache hit needs no remote request.
+            recorded_size = getInfo.info.file_size
+            resource_size = readUri.size()
+            if recorded_size >= 0 and resource_size != recorded_size:
+                raise RuntimeError("Integrity failure in Datastore. "
+                                   f"Size of file {readUri} ({resource_size}) "
+                                   f"does not match size recorded in registry of {recorded_size}")
+
+            if (not readUri.isLocal and formatter.can_read_ranges()
+                    and (isComponent or formatter.fileDescriptor.parameters)):
+                # Only transfer the parts of a remote artifact that are
+                # needed for the requested component or parameters.  Full
+                # reads are done below with a single download instead of one
+                # request per buffer.
+                log.debug("Deserializing %s from byte ranges at location %s with formatter %s",
+                          f"component {getInfo.component}" if isComponent else "",
+                          uri, formatter.name())
+                try:
+                    with readUri.open_ranged() as stream:
+                        result = formatter.fromStream(stream,
+                                                      component=getInfo.component if isComponent else None)
+                except Exception as e:
+                    raise ValueError(f"Failure from formatter '{formatter.name()}' for dataset {ref.id}"
+                                     f" ({ref.datasetType.name} from {uri}): {e}") from e
+            elif resource_size <= nbytes_max and formatter.can_read_bytes():
+                serializedDataset = readUri.read()
+                log.debug("Deserializing %s from %d bytes from location %s with formatter %s",
                           f"component {getInfo.component}" if isComponent else "",
-                          uri, msg, formatter.name())
+                          len(serializedDataset), uri, formatter.name())
                 try:
-                    with formatter._updateLocation(newLocation):
-                        result = formatter.read(component=getInfo.component if isComponent else None)
+                    result = formatter.fromBytes(serializedDataset,
+                                                 component=getInfo.component if isComponent else None)
                 except Exception as e:
                     raise ValueError(f"Failure from formatter '{formatter.name()}' for dataset {ref.id}"
                                      f" ({ref.datasetType.name} from {uri}): {e}") from e
+            elif not readUri.isLocal and formatter.can_read_stream():
+                # Stream large remote artifacts without a temporary file
+                log.debug("Deserializing %s from stream at location %s with formatter %s",
+                          f"component {getInfo.component}" if isComponent else "",
+                          uri, formatter.name())
+                try:
+                    with readUri.open("rb") as stream:
+                        result = formatter.fromStream(stream,
+                                                      component=getInfo.component if isComponent else None)
+                except Exception as e:
+                    raise ValueError(f"Failure from formatter '{formatter.name()}' for dataset {ref.id}"
+                                     f" ({ref.datasetType.name} from {uri}): {e}") from e
+            else:
+                # Read from file
+                with readUri.as_local() as local_uri:
+                    # Have to update the Location associated with the formatter
+                    # because formatter.read does not allow an override.
+                    # This could be improved.
+                    msg = ""
+                    newLocation = None
+                    if uri != local_uri:
+                        newLocation = Location(*local_uri.split())
+                        msg = "(via download to local file)"
+
+                    log.debug("Reading %s from location %s %s with formatter %s",
+                              f"component {getInfo.component}" if isComponent else "",
+                              uri, msg, formatter.name())
+                    try:
+                        with formatter._updateLocation(newLocation):
+                            result = formatter.read(component=getInfo.component if isComponent else None)
+                    except Exception as e:
+                        raise ValueError(f"Failure from formatter '{formatter.name()}' for dataset {ref.id}"
+                                         f" ({ref.datasetType.name} from {uri}): {e}") from e
 
         return self._post_process_get(result, getInfo.readStorageClass, getInfo.assemblerParams,
                                       isComponent=isComponent)
 
+    def _map_artifacts(self, func: Callable[[Any], _T], items: Sequence[Any],
+                       nThreads: Optional[int] = None) -> List[_T]:
+        """Apply an artifact I/O function to each of the given items, using
+        a pool of threads if more than one item is given and the datastore
+        is configured to allow it.
+
+        Parameters
+        ----------
+        func : `~collections.abc.Callable`
+            Function to call on each item.  Must be safe to call from
+            multiple threads at once.
+        items : `~collections.abc.Sequence`
+            Items to pass to ``func``.
+        nThreads : `int`, optional
+            Maximum number of threads to use; defaults to ``ioThreads``.
+
+        Returns
+        -------
+        results : `list`
+            The results of calling ``func`` on each item, in the same order
+            as ``items``.  If any call raises, the exception from the first
+            such item is re-raised once all calls have completed.
+        """
+        nThreads = min(nThreads if nThreads is not None else self.ioThreads, len(items))
+        if nThreads <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=nThreads, thread_name_prefix=f"{self.name}-io") as executor:
+            futures = [executor.submit(func, item) for item in items]
+        return [future.result() for future in futures]
+
     def exists(self, ref: DatasetRef) -> bool:
         """Check if the dataset exists in the datastore.
 
@@ -1097,6 +1292,144 @@ class FileDatastore(GenericBaseDatastore):
 
         return True
 
+    def _locate_many(self, refs: Iterable[DatasetRef], checkArtifacts: bool = True
+                     ) -> Dict[DatasetRef, Optional[List[Tuple[Location, StoredFileInfo]]]]:
+        """Find the artifacts of multiple datasets and check that they exist.
+
+        Parameters
+        ----------
+        refs : iterable of `DatasetRef`
+            References to the required datasets.
+        checkArtifacts : `bool`, optional
+            If `False`, datasets with records in this datastore are assumed
+            to exist without checking their artifacts.  Artifacts whose
+            locations had to be predicted are always checked.
+
+        Returns
+        -------
+        locations : `dict` [`DatasetRef`, `list` or `None`]
+            The location and stored file information of each artifact of
+            each dataset, or `None` for datasets that do not exist.
+
+        Notes
+        -----
+        Records are fetched with a single query, and artifacts are checked
+        concurrently.
+        """
+        refs = list(refs)
+        records = self._get_stored_records_associated_with_refs(refs)
+        candidates: Dict[DatasetRef, List[Tuple[Location, StoredFileInfo]]] = {}
+        toCheck: Dict[str, Location] = {}
+        for ref in refs:
+            fileLocations = self._get_locations_from_records(records.get(ref.id, []))
+            guessing = False
+            if not fileLocations and self.trustGetRequest:
+                fileLocations = self._get_expected_dataset_locations_info(ref)
+                guessing = True
+            candidates[ref] = fileLocations
+            if checkArtifacts or guessing:
+                for location, _ in fileLocations:
+                    toCheck.setdefault(str(location.uri), location)
+        found = dict(zip(toCheck.keys(), self._map_artifacts(self._artifact_exists, list(toCheck.values()))))
+        return {
+            ref: fileLocations
+            if fileLocations and all(found.get(str(location.uri), True) for location, _ in fileLocations)
+            else None
+            for ref, fileLocations in candidates.items()
+        }
+
+    def mexists(self, refs: Iterable[DatasetRef],
+                checkArtifacts: bool = True) -> Dict[DatasetRef, bool]:
+        # Docstring inherited from Datastore.mexists.
+        return {ref: fileLocations is not None
+                for ref, fileLocations in self._locate_many(refs, checkArtifacts=checkArtifacts).items()}
+
+    def _predict_URIs(self, ref: DatasetRef) -> Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]:
+        """Predict the URIs a dataset would have if it were written to this
+        datastore.
+
+        Parameters
+        ----------
+        ref : `DatasetRef`
+            Reference to the required dataset.
+
+        Returns
+        -------
+        primary : `ButlerURI`
+            The predicted URI of the primary artifact, or `None` if the
+            dataset would be disassembled.
+        components : `dict`
+            Predicted URIs of the component artifacts, if the dataset would
+            be disassembled.
+        """
+        primary: Optional[ButlerURI] = None
+        components: Dict[str, ButlerURI] = {}
+
+        doDisassembly = self.composites.shouldBeDisassembled(ref)
+
+        if doDisassembly:
+
+            for component, componentStorage in ref.datasetType.storageClass.components.items():
+                compRef = ref.makeComponentRef(component)
+                compLocation, _ = self._determine_put_formatter_location(compRef)
+
+                # Add a URI fragment to indicate this is a guess
+                components[component] = ButlerURI(compLocation.uri.geturl() + "#predicted")
+
+        else:
+
+            location, _ = self._determine_put_formatter_location(ref)
+
+            # Add a URI fragment to indicate this is a guess
+            primary = ButlerURI(location.uri.geturl() + "#predicted")
+
+        return primary, components
+
+    @staticmethod
+    def _URIs_from_locations(fileLocations: List[Tuple[Location, StoredFileInfo]]
+                             ) -> Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]:
+        """Return the URIs of the artifacts of a dataset.
+
+        Parameters
+        ----------
+        fileLocations : `list` [`tuple` [`Location`, `StoredFileInfo`]]
+            The location and stored file information of each artifact of the
+            dataset.
+
+        Returns
+        -------
+        primary : `ButlerURI`
+            The URI of the primary artifact, or `None` if the dataset was
+            disassembled.
+        components : `dict`
+            URIs of the component artifacts, if the dataset was
+            disassembled.
+        """
+        primary: Optional[ButlerURI] = None
+        components: Dict[str, ButlerURI] = {}
+        if len(fileLocations) == 1:
+            # No disassembly so this is the primary URI
+            primary = fileLocations[0][0].uri
+        else:
+            for location, storedFileInfo in fileLocations:
+                if storedFileInfo.component is None:
+                    raise RuntimeError(f"Unexpectedly got no component name for a component at {location}")
+                components[storedFileInfo.component] = location.uri
+        return primary, components
+
+    def getManyURIs(self, refs: Iterable[DatasetRef], predict: bool = False
+                    ) -> Dict[DatasetRef, Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]]:
+        # Docstring inherited from Datastore.getManyURIs.
+        uris = {}
+        for ref, fileLocations in self._locate_many(refs).items():
+            if fileLocations is None:
+                if not predict:
+                    raise FileNotFoundError("Dataset {} not in this datastore".format(ref))
+                uris[ref] = self._predict_URIs(ref)
+            else:
+                uris[ref] = self._URIs_from_locations(fileLocations)
+        return uris
+
     def getURIs(self, ref: DatasetRef,
                 predict: bool = False) -> Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]:
         """Return URIs associated with dataset.
@@ -1120,33 +1453,11 @@ class FileDatastore(GenericBaseDatastore):
             Can be empty if there are no components.
         """
 
-        primary: Optional[ButlerURI] = None
-        components: Dict[str, ButlerURI] = {}
-
         # if this has never been written then we have to guess
         if not self.exists(ref):
             if not predict:
                 raise FileNotFoundError("Dataset {} not in this datastore".format(ref))
-
-            doDisassembly = self.composites.shouldBeDisassembled(ref)
-
-            if doDisassembly:
-
-                for component, componentStorage in ref.datasetType.storageClass.components.items():
-                    compRef = ref.makeComponentRef(component)
-                    compLocation, _ = self._determine_put_formatter_location(compRef)
-
-                    # Add a URI fragment to indicate this is a guess
-                    components[component] = ButlerURI(compLocation.uri.geturl() + "#predicted")
-
-            else:
-
-                location, _ = self._determine_put_formatter_location(ref)
-
-                # Add a URI fragment to indicate this is a guess
-                primary = ButlerURI(location.uri.geturl() + "#predicted")
-
-            return primary, components
+            return self._predict_URIs(ref)
 
         # If this is a ref that we have written we can get the path.
         # Get file metadata and internal metadata
@@ -1159,23 +1470,12 @@ class FileDatastore(GenericBaseDatastore):
             fileLocations = self._get_expected_dataset_locations_info(ref)
             guessing = True
 
-        if len(fileLocations) == 1:
-            # No disassembly so this is the primary URI
-            uri = fileLocations[0][0].uri
-            if guessing and not uri.exists():
-                raise FileNotFoundError(f"Expected URI ({uri}) does not exist")
-            primary = uri
-
-        else:
-            for location, storedFileInfo in fileLocations:
-                if storedFileInfo.component is None:
-                    raise RuntimeError(f"Unexpectedly got no component name for a component at {location}")
-                uri = location.uri
-                if guessing and not uri.exists():
-                    raise FileNotFoundError(f"Expected URI ({uri}) does not exist")
-                components[storedFileInfo.component] = uri
+        if guessing:
+            for location, _ in fileLocations:
+                if not location.uri.exists():
+                    raise FileNotFoundError(f"Expected URI ({location.uri}) does not exist")
 
-        return primary, components
+        return self._URIs_from_locations(fileLocations)
 
     def getURI(self, ref: DatasetRef, predict: bool = False) -> ButlerURI:
         """URI to the Dataset.
@@ -1245,6 +1545,41 @@ class FileDatastore(GenericBaseDatastore):
             Formatter failed to process the dataset.
         """
         allGetInfo = self._prepare_for_get(ref, parameters)
+        return self._read_dataset(allGetInfo, ref, parameters)
+
+    def getMany(self, refs: Iterable[DatasetRef],
+                parameters: Optional[Mapping[str, Any]] = None) -> List[Any]:
+        # Docstring inherited from Datastore.getMany.
+        refs = list(refs)
+        # Fetch the internal records for all datasets in one query.
+        records = self._get_stored_records_associated_with_refs(refs)
+        results = []
+        for ref in refs:
+            fileLocations = self._get_locations_from_records(records.get(ref.id, []))
+            allGetInfo = self._prepare_for_get(ref, parameters, fileLocations=fileLocations)
+            results.append(self._read_dataset(allGetInfo, ref, parameters))
+        return results
+
+    def _read_dataset(self, allGetInfo: List[DatastoreFileGetInformation], ref: DatasetRef,
+                      parameters: Optional[Mapping[str, Any]] = None) -> Any:
+        """Read a dataset, reassembling it from its components if necessary.
+
+        Parameters
+        ----------
+        allGetInfo : `list` [`DatastoreFileGetInformation`]
+            Parameters needed to retrieve each file, as returned by
+            `_prepare_for_get`.
+        ref : `DatasetRef`
+            Reference to the required Dataset.
+        parameters : `dict`
+            `StorageClass`-specific parameters that specify, for example,
+            a slice of the dataset to be loaded.
+
+        Returns
+        -------
+        inMemoryDataset : `object`
+            Requested dataset or slice thereof as an InMemoryDataset.
+        """
         refComponent = ref.datasetType.component()
 
         # Supplied storage class for the component being read
@@ -1290,7 +1625,7 @@ class FileDatastore(GenericBaseDatastore):
             # assembler.
             usedParams = set()
 
-            components: Dict[str, Any] = {}
+            componentNames: List[str] = []
             for getInfo in allGetInfo:
                 # assemblerParams are parameters not understood by the
                 # associated formatter.
@@ -1300,12 +1635,16 @@ class FileDatastore(GenericBaseDatastore):
 
                 if component is None:
                     raise RuntimeError(f"Internal error in datastore assembly of {ref}")
+                componentNames.append(component)
 
-                # We do not want the formatter to think it's reading
-                # a component though because it is really reading a
-                # standalone dataset -- always tell reader it is not a
-                # component.
-                components[component] = self._read_artifact_into_memory(getInfo, ref, isComponent=False)
+            # Read (and deserialize) the component artifacts concurrently.
+            # We do not want the formatter to think it's reading
+            # a component though because it is really reading a
+            # standalone dataset -- always tell reader it is not a
+            # component.
+            readComponent = functools.partial(self._read_artifact_into_memory, ref=ref, isComponent=False)
+            components: Dict[str, Any] = dict(zip(componentNames,
+                                                  self._map_artifacts(readComponent, allGetInfo)))
 
             inMemoryDataset = ref.datasetType.storageClass.delegate().assemble(components)
 
@@ -1432,27 +1771,60 @@ class FileDatastore(GenericBaseDatastore):
         requiring that every datastore accepts the dataset.
         """
 
+        artifacts = self._write_dataset_artifacts(inMemoryDataset, ref)
+        self._register_datasets(artifacts)
+
+    @transactional
+    def putMany(self, items: Iterable[Tuple[Any, DatasetRef]]) -> None:
+        # Docstring inherited from Datastore.putMany.
+        artifacts = []
+        for inMemoryDataset, ref in items:
+            artifacts.extend(self._write_dataset_artifacts(inMemoryDataset, ref))
+        # Record everything with one bridge insert and one records insert.
+        self._register_datasets(artifacts)
+
+    def _write_dataset_artifacts(self, inMemoryDataset: Any,
+                                 ref: DatasetRef) -> List[Tuple[DatasetRef, StoredFileInfo]]:
+        """Write all the artifacts for a dataset, disassembling it if
+        configured to do so.
+
+        Parameters
+        ----------
+        inMemoryDataset : `object`
+            The dataset to store.
+        ref : `DatasetRef`
+            Reference to the associated Dataset.
+
+        Returns
+        -------
+        artifacts : `list` [`tuple` [`DatasetRef`, `StoredFileInfo`]]
+            The reference and stored information for each artifact written.
+            These have not yet been registered.
+        """
         doDisassembly = self.composites.shouldBeDisassembled(ref)
         # doDisassembly = True
 
         artifacts = []
         if doDisassembly:
             components = ref.datasetType.storageClass.delegate().disassemble(inMemoryDataset)
-            for component, componentInfo in components.items():
-                # Don't recurse because we want to take advantage of
-                # bulk insert -- need a new DatasetRef that refers to the
-                # same dataset_id but has the component DatasetType
-                # DatasetType does not refer to the types of components
-                # So we construct one ourselves.
-                compRef = ref.makeComponentRef(component)
-                storedInfo = self._write_in_memory_to_artifact(componentInfo.component, compRef)
+            # Don't recurse because we want to take advantage of
+            # bulk insert -- need a new DatasetRef that refers to the
+            # same dataset_id but has the component DatasetType
+            # DatasetType does not refer to the types of components
+            # So we construct one ourselves.
+            toWrite = [(componentInfo.component, ref.makeComponentRef(component))
+                       for component, componentInfo in components.items()]
+            # Write the component artifacts concurrently.
+            storedInfos = self._map_artifacts(lambda item: self._write_in_memory_to_artifact(*item),
+                                              toWrite)
+            for (_, compRef), storedInfo in zip(toWrite, storedInfos):
                 artifacts.append((compRef, storedInfo))
         else:
             # Write the entire thing out
             storedInfo = self._write_in_memory_to_artifact(inMemoryDataset, ref)
             artifacts.append((ref, storedInfo))
 
-        self._register_datasets(artifacts)
+        return artifacts
 
     @transactional
     def trash(self, ref: DatasetRef, ignore_errors: bool = True) -> None:
@@ -1516,59 +1888,100 @@ class FileDatastore(GenericBaseDatastore):
             If `True` return without error even if something went wrong.
             Problems could occur if another process is simultaneously trying
             to delete.
+
+        Notes
+        -----
+        The trash is emptied in chunks of at most ``trashChunkSize``
+        datasets.  Each chunk is removed from the trash as soon as its
+        artifacts and records are gone, so an interrupted call can simply be
+        repeated to finish the job.
         """
         log.debug("Emptying trash in datastore %s", self.name)
-        # Context manager will empty trash iff we finish it without raising.
-        with self.bridge.emptyTrash() as trashed:
-            for ref in trashed:
-                fileLocations = self._get_dataset_locations_info(ref)
-
-                if not fileLocations:
-                    err_msg = f"Requested dataset ({ref}) does not exist in datastore {self.name}"
-                    if ignore_errors:
-                        log.warning(err_msg)
-                        continue
-                    else:
-                        raise FileNotFoundError(err_msg)
+        while True:
+            # Context manager will remove this chunk from the trash iff we
+            # finish it without raising.
+            with self.bridge.emptyTrash(limit=self.trashChunkSize) as trashed:
+                refs = list(trashed)
+                if refs:
+                    self._empty_trash_chunk(refs, ignore_errors=ignore_errors)
+            if len(refs) < self.trashChunkSize:
+                break
+
+    def _empty_trash_chunk(self, refs: List[DatasetIdRef], ignore_errors: bool) -> None:
+        """Remove the artifacts and records of a chunk of trashed datasets.
 
-                for location, _ in fileLocations:
+        Parameters
+        ----------
+        refs : `list` [`DatasetIdRef`]
+            References to the trashed datasets.
+        ignore_errors : `bool`
+            If `True` log problems rather than raising.
+        """
+        records = self._get_stored_records_associated_with_refs(refs)
+        for ref in refs:
+            if ref.id not in records:
+                err_msg = f"Requested dataset ({ref}) does not exist in datastore {self.name}"
+                if ignore_errors:
+                    log.warning(err_msg)
+                else:
+                    raise FileNotFoundError(err_msg)
 
-                    if not self._artifact_exists(location):
-                        err_msg = f"Dataset {location.uri} no longer present in datastore {self.name}"
-                        if ignore_errors:
-                            log.warning(err_msg)
-                            continue
-                        else:
-                            raise FileNotFoundError(err_msg)
-
-                    # Can only delete the artifact if there are no references
-                    # to the file from untrashed dataset refs.
-                    if self._can_remove_dataset_artifact(ref, location):
-                        # Point of no return for this artifact
-                        log.debug("Removing artifact %s from datastore %s", location.uri, self.name)
-                        try:
-                            self._delete_artifact(location)
-                        except Exception as e:
-                            if ignore_errors:
-                                log.critical("Encountered error removing artifact %s from datastore %s: %s",
-                                             location.uri, self.name, e)
-                            else:
-                                raise
-
-                # Now must remove the entry from the internal registry even if
-                # the artifact removal failed and was ignored,
-                # otherwise the removal check above will never be true
-                try:
-                    # There may be multiple rows associated with this ref
-                    # depending on disassembly
-                    self.removeStoredItemInfo(ref)
-                except Exception as e:
-                    if ignore_errors:
-                        log.warning("Error removing dataset %s (%s) from internal registry of %s: %s",
-                                    ref.id, location.uri, self.name, e)
-                        continue
-                    else:
-                        raise FileNotFoundError(err_msg)
+        # Can only delete an artifact if there are no references to it from
+        # datasets outside this chunk (including untrashed datasets).  Any
+        # trashed datasets sharing it in later chunks will delete it once
+        # they are the last ones left.
+        paths = {info.path for infos in records.values() for info in infos}
+        shared = {record["path"] for record in self._table.fetch(path=paths)
+                  if record["dataset_id"] not in records}
+        toRemove: Dict[str, Location] = {}
+        for infos in records.values():
+            for location, info in self._get_locations_from_records(infos):
+                if info.path not in shared:
+                    toRemove.setdefault(info.path, location)
+        self._map_artifacts(functools.partial(self._remove_trashed_artifact, ignore_errors=ignore_errors),
+                            list(toRemove.values()))
+
+        # Now must remove the entries from the internal registry even if
+        # the artifact removal failed and was ignored, otherwise the removal
+        # check above will never be true.  There may be multiple rows
+        # associated with each ref depending on disassembly.
+        try:
+            self._table.delete(dataset_id=list(records.keys()))
+        except Exception as e:
+            if ignore_errors:
+                log.warning("Error removing %d datasets from internal registry of %s: %s",
+                            len(records), self.name, e)
+            else:
+                raise
+
+    def _remove_trashed_artifact(self, location: Location, ignore_errors: bool) -> None:
+        """Delete the artifact of a trashed dataset.
+
+        Parameters
+        ----------
+        location : `Location`
+            Location of the artifact.
+        ignore_errors : `bool`
+            If `True` log problems rather than raising.
+        """
+        if not self._artifact_exists(location):
+            err_msg = f"Dataset {location.uri} no longer present in datastore {self.name}"
+            if ignore_errors:
+                log.warning(err_msg)
+                return
+            else:
+                raise FileNotFoundError(err_msg)
+
+        # Point of no return for this artifact
+        log.debug("Removing artifact %s from datastore %s", location.uri, self.name)
+        try:
+            self._delete_artifact(location)
+        except Exception as e:
+            if ignore_errors:
+                log.critical("Encountered error removing artifact %s from datastore %s: %s",
+                             location.uri, self.name, e)
+            else:
+                raise
 
     def validateConfiguration(self, entities: Iterable[Union[DatasetRef, DatasetType, StorageClass]],
                               logFailures: bool = False) -> None:
@@ -1691,7 +2104,8 @@ class FileDatastore(GenericBaseDatastore):
             yield FileDataset(refs=[ref], path=pathInStore, formatter=storedFileInfo.formatter)
 
     @staticmethod
-    def computeChecksum(uri: ButlerURI, algorithm: str = "blake2b", block_size: int = 8192) -> Optional[str]:
+    def computeChecksum(uri: ButlerURI, algorithm: str = "blake2b",
+                        block_size: int = 1024 * 1024) -> Optional[str]:
         """Compute the checksum of the supplied file.
 
         Parameters
@@ -1722,8 +2136,16 @@ class FileDatastore(GenericBaseDatastore):
         hasher = hashlib.new(algorithm)
 
         with uri.as_local() as local_uri:
-            with open(local_uri.ospath, "rb") as f:
-                for chunk in iter(lambda: f.read(block_size), b""):
-                    hasher.update(chunk)
+            # Read into a single reusable buffer, bypassing Python's own
+            # buffering; hashlib releases the GIL for large updates, so this
+            # can proceed in parallel with other ingest threads.
+            buffer = bytearray(block_size)
+            view = memoryview(buffer)
+            with open(local_uri.ospath, "rb", buffering=0) as f:
+                while True:
+                    n = f.readinto(buffer)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
 
         return hasher.hexdigest()
@@ -30,6 +30,7 @@ from abc import abstractmethod
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
     Optional,
     Type,
 )
@@ -241,6 +242,77 @@ class FileFormatter(Formatter):
 
         return data
 
+    @classmethod
+    def can_read_stream(cls) -> bool:
+        # Docstring inherited from Formatter.can_read_stream.
+        return hasattr(cls, "_readStream")
+
+    @classmethod
+    def can_write_stream(cls) -> bool:
+        # Docstring inherited from Formatter.can_write_stream.
+        return hasattr(cls, "_writeStream")
+
+    def fromStream(self, stream: BinaryIO, component: Optional[str] = None) -> Any:
+        """Read a Dataset or its component from a binary file-like stream.
+
+        Parameters
+        ----------
+        stream : file-like
+            Binary stream to read, such as one returned by `ButlerURI.open`.
+        component : `str`, optional
+            Component to read from the Dataset. Only used if the `StorageClass`
+            for reading differed from the `StorageClass` used to write the
+            file.
+
+        Returns
+        -------
+        inMemoryDataset : `object`
+            The requested data as a Python object. The type of object
+            is controlled by the specific formatter.
+
+        Raises
+        ------
+        NotImplementedError
+            Formatter does not support reading from a stream.
+        """
+        if not hasattr(self, "_readStream"):
+            raise NotImplementedError("Type does not support reading from a stream.")
+
+        # mypy can not understand that the previous line protects this call
+        data = self._readStream(stream, self.fileDescriptor.storageClass.pytype)  # type: ignore
+
+        # Assemble the requested dataset and potentially return only its
+        # component coercing it to its appropriate pytype
+        data = self._assembleDataset(data, component)
+
+        # Special case components by allowing a formatter to return None
+        # to indicate that the component was understood but is missing
+        if data is None and component is None:
+            raise ValueError(f"Unable to read data with URI {self.fileDescriptor.location.uri}")
+
+        return data
+
+    def toStream(self, inMemoryDataset: Any, stream: BinaryIO) -> None:
+        """Serialize the Dataset to a binary file-like stream.
+
+        Parameters
+        ----------
+        inMemoryDataset : `object`
+            Object to serialize.
+        stream : file-like
+            Binary stream to write, such as one returned by `ButlerURI.open`.
+
+        Raises
+        ------
+        NotImplementedError
+            Formatter does not support writing to a stream.
+        """
+        if not hasattr(self, "_writeStream"):
+            raise NotImplementedError("Type does not support writing to a stream.")
+
+        # mypy can not understand that the previous line protects this call
+        self._writeStream(inMemoryDataset, stream)  # type: ignore
+
     def write(self, inMemoryDataset: Any) -> None:
         """Write a Python object to a file.
 
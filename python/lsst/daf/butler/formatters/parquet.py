@@ -29,6 +29,7 @@ import collections.abc
 import itertools
 from typing import (
     Any,
+    BinaryIO,
     Dict,
     Iterable,
     Iterator,
@@ -52,10 +53,10 @@ class _ParquetLoader:
 
     Parameters
     ----------
-    path : `str`
-        Full path to the file to be loaded.
+    path : `str` or file-like
+        Full path to the file to be loaded, or a seekable binary stream.
     """
-    def __init__(self, path: str):
+    def __init__(self, path: Union[str, BinaryIO]):
         self.file = pq.ParquetFile(path)
         self.md = json.loads(self.file.metadata.metadata[b"pandas"])
         indexes = self.md["column_indexes"]
@@ -182,7 +183,41 @@ class ParquetFormatter(Formatter):
 
     def read(self, component: Optional[str] = None) -> Any:
         # Docstring inherited from Formatter.read.
-        loader = _ParquetLoader(self.fileDescriptor.location.path)
+        return self._read(_ParquetLoader(self.fileDescriptor.location.path), component)
+
+    @classmethod
+    def can_read_stream(cls) -> bool:
+        # Docstring inherited from Formatter.can_read_stream.
+        # pyarrow needs to seek to the footer, so fromStream can only be used
+        # with the seekable streams implied by can_read_ranges.
+        return False
+
+    @classmethod
+    def can_read_ranges(cls) -> bool:
+        # Docstring inherited from Formatter.can_read_ranges.
+        # Parquet files are read from their footer metadata, and then only
+        # the requested column chunks.
+        return True
+
+    def fromStream(self, stream: BinaryIO, component: Optional[str] = None) -> Any:
+        # Docstring inherited from Formatter.fromStream.
+        return self._read(_ParquetLoader(stream), component)
+
+    def _read(self, loader: _ParquetLoader, component: Optional[str] = None) -> Any:
+        """Read the dataset or a component with a loader.
+
+        Parameters
+        ----------
+        loader : `_ParquetLoader`
+            Loader for the file.
+        component : `str`, optional
+            Component to read.
+
+        Returns
+        -------
+        inMemoryDataset : `object`
+            The requested data.
+        """
         if component == "columns":
             return loader.columns
 
@@ -29,6 +29,7 @@ import pickle
 
 from typing import (
     Any,
+    BinaryIO,
     Optional,
     Type,
 )
@@ -85,6 +86,46 @@ class PickleFormatter(FileFormatter):
         with open(self.fileDescriptor.location.path, "wb") as fd:
             pickle.dump(inMemoryDataset, fd, protocol=-1)
 
+    def _readStream(self, stream: BinaryIO, pytype: Optional[Type[Any]] = None) -> Any:
+        """Read a python object from a pickle stream.
+
+        Parameters
+        ----------
+        stream : file-like
+            Binary stream to unpickle from.
+        pytype : `class`, optional
+            Not used by this implementation.
+
+        Returns
+        -------
+        inMemoryDataset : `object`
+            The requested data as a object, or None if the stream could
+            not be read.
+        """
+        try:
+            data = pickle.load(stream)
+        except pickle.PicklingError:
+            data = None
+
+        return data
+
+    def _writeStream(self, inMemoryDataset: Any, stream: BinaryIO) -> None:
+        """Write the in memory dataset to a pickle stream.
+
+        Parameters
+        ----------
+        inMemoryDataset : `object`
+            Object to serialize.
+        stream : file-like
+            Binary stream to pickle to.
+
+        Raises
+        ------
+        Exception
+            The object could not be pickled.
+        """
+        pickle.dump(inMemoryDataset, stream, protocol=-1)
+
     def _fromBytes(self, serializedDataset: bytes, pytype: Optional[Type[Any]] = None) -> Any:
         """Read the bytes object as a python object.
 
@@ -23,7 +23,7 @@ from __future__ import annotations
 
 __all__ = ("RegistryConfig",)
 
-from typing import Optional, Type, TYPE_CHECKING, Union
+from typing import Any, Dict, Optional, Type, TYPE_CHECKING, Union
 
 import sqlalchemy
 
@@ -67,6 +67,25 @@ class RegistryConfig(ConfigSubset):
         databaseClass = self["engines", dialect]
         return doImport(databaseClass)
 
+    def getEngineOptions(self) -> Dict[str, Any]:
+        """Return the engine options for the configured database dialect.
+
+        These are read from the ``engine_options`` section of the registry
+        config, under the dialect name, and are passed as keyword arguments
+        to the ``makeEngine`` method of the `Database` class returned by
+        `getDatabaseClass`.
+
+        Returns
+        -------
+        options : `dict` [ `str`, `Any` ]
+            Keyword arguments for ``makeEngine``; empty if there is no
+            section for this dialect.
+        """
+        options = self.get(("engine_options", self.getDialect()))
+        if not options:
+            return {}
+        return options.toDict()
+
     def makeDefaultDatabaseUri(self, root: str) -> Optional[str]:
         """Return a default 'db' URI for the registry configured here that is
         appropriate for a new empty repository with the given root.
@@ -73,12 +73,14 @@ from ._exceptions import ConflictingDefinitionError, InconsistentDataIdError, Or
 from .managers import RegistryManagerTypes, RegistryManagerInstances
 from .wildcards import CategorizedWildcard, CollectionQuery, CollectionSearch, Ellipsis
 from .summaries import CollectionSummary
-from .interfaces import ChainedCollectionRecord, RunRecord
+from .interfaces import ChainedCollectionRecord, DimensionRecordCacheStatistics, RunRecord
 
 if TYPE_CHECKING:
     from .._butlerConfig import ButlerConfig
     from .interfaces import (
+        CollectionRecord,
         Database,
+        DatasetRecordStorage,
         DatastoreRegistryBridgeManager,
     )
 
@@ -167,7 +169,8 @@ class Registry:
 
         DatabaseClass = config.getDatabaseClass()
         database = DatabaseClass.fromUri(str(config.connectionString), origin=config.get("origin", 0),
-                                         namespace=config.get("namespace"))
+                                         namespace=config.get("namespace"),
+                                         engineOptions=config.getEngineOptions())
         managerTypes = RegistryManagerTypes.fromConfig(config)
         managers = managerTypes.makeRepo(database, dimensionConfig)
         return cls(database, RegistryDefaults(), managers)
@@ -205,9 +208,13 @@ class Registry:
         config.replaceRoot(butlerRoot)
         DatabaseClass = config.getDatabaseClass()
         database = DatabaseClass.fromUri(str(config.connectionString), origin=config.get("origin", 0),
-                                         namespace=config.get("namespace"), writeable=writeable)
+                                         namespace=config.get("namespace"), writeable=writeable,
+                                         engineOptions=config.getEngineOptions())
         managerTypes = RegistryManagerTypes.fromConfig(config)
-        managers = managerTypes.loadRepo(database)
+        if "stream_batch_size" in config:
+            database.streamBatchSize = config["stream_batch_size"]
+        managers = managerTypes.loadRepo(database, lazy=config.get("lazy_load", False))
+        managers.datasets.setCalibrationCaching(config.get("cache_calibrations", False))
         if defaults is None:
             defaults = RegistryDefaults()
         return cls(database, defaults, managers)
@@ -294,6 +301,33 @@ class Registry:
         """
         self._managers.refresh()
 
+    def prefetch(self, *, datasetTypes: Iterable[Union[DatasetType, str]] = (),
+                 collections: Iterable[str] = ()) -> None:
+        """Load the definitions of the given dataset types and collections
+        in bulk.
+
+        Parameters
+        ----------
+        datasetTypes : `~collections.abc.Iterable` [ `DatasetType` or `str` ]
+            Dataset types (or their names) that are about to be used.
+        collections : `~collections.abc.Iterable` [ `str` ]
+            Names of collections that are about to be used.
+
+        Notes
+        -----
+        This only has an effect if the registry was configured with
+        ``lazy_load: true``, so that dataset types and collections are loaded
+        from the database when they are first used instead of all at once on
+        construction.  Prefetching replaces one query per dataset type or
+        collection with a single query for each kind.  Names that are not
+        registered are ignored.
+        """
+        self._managers.datasets.prefetch(
+            datasetType.name if isinstance(datasetType, DatasetType) else datasetType
+            for datasetType in datasetTypes
+        )
+        self._managers.collections.prefetch(collections)
+
     @contextlib.contextmanager
     def transaction(self, *, savepoint: bool = False) -> Iterator[None]:
         """Return a context manager that represents a transaction.
@@ -305,6 +339,7 @@ class Registry:
             # TODO: this clears the caches sometimes when we wouldn't actually
             # need to.  Can we avoid that?
             self._managers.dimensions.clearCaches()
+            self._managers.datasets.clearCalibrationCaches()
             raise
 
     def resetConnectionPool(self) -> None:
@@ -363,7 +398,8 @@ class Registry:
             Additional keyword arguments are interpreted as equality
             constraints that restrict the returned rows (combined with AND);
             keyword arguments are column names and values are the values they
-            must have.
+            must have.  Collection values (`list`, `tuple`, `set`, or
+            `frozenset`) match any of the values they contain.
 
         Yields
         ------
@@ -471,6 +507,10 @@ class Registry:
         `~CollectionType.CHAINED` collection; the ``CHAINED`` collection must
         be deleted or redefined first.
         """
+        # Removing a collection cascades to calibration associations (either
+        # its own or those of the datasets in it) without going through the
+        # dataset record storage, so cached validity ranges must be dropped.
+        self._managers.datasets.clearCalibrationCaches()
         self._managers.collections.remove(name)
 
     def getCollectionChain(self, parent: str) -> CollectionSearch:
@@ -733,22 +773,113 @@ class Registry:
         dataId = DataCoordinate.standardize(dataId, graph=storage.datasetType.dimensions,
                                             universe=self.dimensions, defaults=self.defaults.dataId,
                                             **kwargs)
+        collectionRecords = self._resolveFindFirstCollections(storage, collections, timespan,
+                                                              "findDataset")
+        if not collectionRecords:
+            return None
+        return storage.findFirst(collectionRecords, dataId, timespan=timespan)
+
+    def findDatasets(self, datasetType: Union[DatasetType, str], dataIds: Iterable[DataId], *,
+                     collections: Any = None, timespan: Optional[Timespan] = None
+                     ) -> Dict[DataCoordinate, DatasetRef]:
+        """Find datasets given their `DatasetType` and data IDs.
+
+        This is a vectorized version of `findDataset` that searches for all
+        of the given data IDs at once, instead of executing (at least) one
+        query per data ID.
+
+        Parameters
+        ----------
+        datasetType : `DatasetType` or `str`
+            A `DatasetType` or the name of one.
+        dataIds : `~collections.abc.Iterable` of `dict` or `DataCoordinate`
+            `dict`-like objects containing the `Dimension` links that identify
+            the datasets within a collection.  Default data ID values from
+            ``self.defaults.dataId`` are applied to each.
+        collections, optional.
+            An expression that fully or partially identifies the collections to
+            search for the datasets; see
+            :ref:`daf_butler_collection_expressions` for more information.
+            Defaults to ``self.defaults.collections``.
+        timespan : `Timespan`, optional
+            A timespan that the validity range of the datasets must overlap.
+            If not provided, any `~CollectionType.CALIBRATION` collections
+            matched by the ``collections`` argument will not be searched.
+
+        Returns
+        -------
+        refs : `dict` [ `DataCoordinate`, `DatasetRef` ]
+            References to the datasets found, keyed by the standardized data
+            ID.  Data IDs for which no dataset was found are not included.
+
+        Raises
+        ------
+        TypeError
+            Raised if ``collections`` is `None` and
+            ``self.defaults.collections`` is `None`.
+        LookupError
+            Raised if one or more data ID keys are missing.
+        KeyError
+            Raised if the dataset type does not exist.
+        MissingCollectionError
+            Raised if any of ``collections`` does not exist in the registry.
+
+        Notes
+        -----
+        As with `findDataset`, datasets that are not found do not cause an
+        exception to be raised; callers should compare the keys of the
+        returned dictionary to the data IDs they passed in.
+        """
+        if isinstance(datasetType, DatasetType):
+            storage = self._managers.datasets[datasetType.name]
+        else:
+            storage = self._managers.datasets[datasetType]
+        standardizedDataIds = [
+            DataCoordinate.standardize(dataId, graph=storage.datasetType.dimensions,
+                                       universe=self.dimensions, defaults=self.defaults.dataId)
+            for dataId in dataIds
+        ]
+        collectionRecords = self._resolveFindFirstCollections(storage, collections, timespan,
+                                                              "findDatasets")
+        if not collectionRecords or not standardizedDataIds:
+            return {}
+        return storage.findFirstMany(collectionRecords, standardizedDataIds, timespan=timespan)
+
+    def _resolveFindFirstCollections(self, storage: DatasetRecordStorage, collections: Any,
+                                     timespan: Optional[Timespan], caller: str) -> List[CollectionRecord]:
+        """Return the flattened, ordered list of collections to search for a
+        dataset in `findDataset` and `findDatasets`.
+
+        Parameters
+        ----------
+        storage : `DatasetRecordStorage`
+            Storage for the dataset type being searched for.
+        collections
+            Collection expression passed by the caller, or `None` to use the
+            defaults.
+        timespan : `Timespan`, optional
+            Timespan passed by the caller; `~CollectionType.CALIBRATION`
+            collections are dropped if this is `None`.
+        caller : `str`
+            Name of the calling method, for error messages.
+
+        Returns
+        -------
+        records : `list` [ `CollectionRecord` ]
+            Records for the collections to search, in order.
+        """
         if collections is None:
             if not self.defaults.collections:
-                raise TypeError("No collections provided to findDataset, "
+                raise TypeError(f"No collections provided to {caller}, "
                                 "and no defaults from registry construction.")
             collections = self.defaults.collections
         else:
             collections = CollectionSearch.fromExpression(collections)
-        for collectionRecord in collections.iter(self._managers.collections):
-            if (collectionRecord.type is CollectionType.CALIBRATION
-                    and (not storage.datasetType.isCalibration() or timespan is None)):
-                continue
-            result = storage.find(collectionRecord, dataId, timespan=timespan)
-            if result is not None:
-                return result
-
-        return None
+        return [
+            collectionRecord for collectionRecord in collections.iter(self._managers.collections)
+            if not (collectionRecord.type is CollectionType.CALIBRATION
+                    and (not storage.datasetType.isCalibration() or timespan is None))
+        ]
 
     @transactional
     def insertDatasets(self, datasetType: Union[DatasetType, str], dataIds: Iterable[DataId],
@@ -1216,6 +1347,58 @@ class Registry:
         storage = self._managers.dimensions[element]  # type: ignore
         return storage.sync(record)
 
+    def getDimensionRecordCacheStatistics(self) -> Dict[str, DimensionRecordCacheStatistics]:
+        """Return statistics for the in-memory caches of dimension records.
+
+        Returns
+        -------
+        statistics : `dict` [ `str`, `DimensionRecordCacheStatistics` ]
+            Snapshot of cache hit, miss, and eviction counters, keyed by the
+            name of the dimension element.  Elements whose records are not
+            cached are not included; unbounded caches are included, with
+            ``maxSize`` set to `None`.
+
+        Notes
+        -----
+        The size limit and the expiration time for cached negative results
+        are configured by the ``max_size`` and ``negative_ttl`` keys of the
+        storage configuration for each element in the dimension
+        configuration.
+        """
+        result = {}
+        for element in self.dimensions.getStaticElements():
+            storage = self._managers.dimensions.get(element)
+            if storage is None:
+                continue
+            statistics = storage.getCacheStatistics()
+            if statistics is not None:
+                result[element.name] = statistics
+        return result
+
+    @transactional
+    def materializeDimensionOverlaps(self) -> int:
+        """Compute and store spatial overlaps between dimension elements for
+        all dimension records that do not have them already.
+
+        Returns
+        -------
+        count : `int`
+            Number of combinations of dimension elements and governor values
+            (e.g. instrument and skymap) whose overlaps were newly
+            materialized.
+
+        Notes
+        -----
+        Overlaps between elements in different spatial families (such as
+        ``visit`` and ``patch``) are materialized automatically as dimension
+        records are inserted, and allow spatial joins between them to be
+        performed entirely in the database.  This method only needs to be
+        called once, to backfill repositories populated before that was the
+        case; until it is, queries fall back to computing those overlaps
+        themselves.
+        """
+        return self._managers.dimensions.materializeOverlaps()
+
     def queryDatasetTypes(self, expression: Any = ..., *, components: Optional[bool] = None
                           ) -> Iterator[DatasetType]:
         """Iterate over the dataset types whose names match an expression.
@@ -23,7 +23,7 @@ from __future__ import annotations
 __all__ = ("EphemeralDatastoreRegistryBridge",)
 
 from contextlib import contextmanager
-from typing import Iterable, Iterator, Set
+from typing import Iterable, Iterator, Optional, Set
 
 from lsst.daf.butler.registry.interfaces import DatasetIdRef, DatastoreRegistryBridge, FakeDatasetRef
 
@@ -66,8 +66,9 @@ class EphemeralDatastoreRegistryBridge(DatastoreRegistryBridge):
         return ref.getCheckedId() in self._datasetIds and ref.getCheckedId() not in self._trashedIds
 
     @contextmanager
-    def emptyTrash(self) -> Iterator[Iterable[DatasetIdRef]]:
+    def emptyTrash(self, limit: Optional[int] = None) -> Iterator[Iterable[DatasetIdRef]]:
         # Docstring inherited from DatastoreRegistryBridge
-        yield (FakeDatasetRef(id) for id in self._trashedIds)
-        self._datasetIds.difference_update(self._trashedIds)
-        self._trashedIds = set()
+        trashedIds = list(self._trashedIds)[:limit]
+        yield (FakeDatasetRef(id) for id in trashedIds)
+        self._datasetIds.difference_update(trashedIds)
+        self._trashedIds.difference_update(trashedIds)
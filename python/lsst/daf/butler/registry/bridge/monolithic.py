@@ -180,7 +180,7 @@ class MonolithicDatastoreRegistryBridge(DatastoreRegistryBridge):
             yield byId[row["dataset_id"]]
 
     @contextmanager
-    def emptyTrash(self) -> Iterator[Iterable[DatasetIdRef]]:
+    def emptyTrash(self, limit: Optional[int] = None) -> Iterator[Iterable[DatasetIdRef]]:
         # Docstring inherited from DatastoreRegistryBridge
         sql = sqlalchemy.sql.select(
             [self._tables.dataset_location_trash.columns.dataset_id]
@@ -189,6 +189,8 @@ class MonolithicDatastoreRegistryBridge(DatastoreRegistryBridge):
         ).where(
             self._tables.dataset_location_trash.columns.datastore_name == self.datastoreName
         )
+        if limit is not None:
+            sql = sql.limit(limit)
         # Run query, transform results into a list of dicts that we can later
         # use to delete.
         rows = [{"dataset_id": row["dataset_id"], "datastore_name": self.datastoreName}
@@ -309,7 +309,10 @@ class DefaultCollectionManager(Generic[K], CollectionManager):
     -----
     Implementation uses "aggressive" pre-fetching and caching of the records
     in memory. Memory cache is synchronized from database when `refresh`
-    method is called.
+    method is called.  If `refresh` is called with ``lazy=True`` the cache is
+    emptied instead, and records are fetched and cached when they are first
+    looked up (or in bulk by `prefetch`); iterating over the manager still
+    loads all records.
     """
     def __init__(self, db: Database, tables: CollectionTablesTuple, collectionIdName: str, *,
                  dimensions: DimensionRecordStorageManager):
@@ -318,14 +321,43 @@ class DefaultCollectionManager(Generic[K], CollectionManager):
         self._collectionIdName = collectionIdName
         self._records: Dict[K, CollectionRecord] = {}  # indexed by record ID
         self._dimensions = dimensions
+        self._lazy = False
+        self._complete = False  # whether all records are in the cache
 
-    def refresh(self) -> None:
+    def refresh(self, *, lazy: Optional[bool] = None) -> None:
         # Docstring inherited from CollectionManager.
+        if lazy is not None:
+            self._lazy = lazy
+        if self._lazy:
+            self._setRecordCache([])
+            self._complete = False
+        else:
+            self._loadRecords()
+
+    def prefetch(self, names: Iterable[str]) -> None:
+        # Docstring inherited from CollectionManager.
+        if self._lazy and not self._complete:
+            missing = {name for name in names if self._getByName(name) is None}
+            if missing:
+                self._loadRecords(self._tables.collection.columns.name.in_(missing))
+
+    def _loadRecords(self, where: Optional[sqlalchemy.sql.ColumnElement] = None) -> None:
+        """Load collection records from the database into the cache.
+
+        Parameters
+        ----------
+        where : `sqlalchemy.sql.ColumnElement`, optional
+            Expression restricting the rows of the collection table to load.
+            If not given, all records are loaded and replace the contents of
+            the cache.
+        """
         sql = sqlalchemy.sql.select(
             self._tables.collection.columns + self._tables.run.columns
         ).select_from(
             self._tables.collection.join(self._tables.run, isouter=True)
         )
+        if where is not None:
+            sql = sql.where(where)
         # Put found records into a temporary instead of updating self._records
         # in place, for exception safety.
         records = []
@@ -356,13 +388,30 @@ class DefaultCollectionManager(Generic[K], CollectionManager):
             else:
                 record = CollectionRecord(key=collection_id, name=name, type=type)
             records.append(record)
-        self._setRecordCache(records)
+        if where is None:
+            self._setRecordCache(records)
+            self._complete = True
+        else:
+            for record in records:
+                self._addCachedRecord(record)
+        # Children of chains are looked up only once all records from this
+        # query are in the cache; in lazy mode that may load more records.
         for chain in chains:
             chain.refresh(self)
 
+    def _findByName(self, name: str) -> Optional[CollectionRecord]:
+        """Find collection record given collection name, loading it from the
+        database if it is not in the cache yet.
+        """
+        record = self._getByName(name)
+        if record is None and self._lazy and not self._complete:
+            self._loadRecords(self._tables.collection.columns.name == name)
+            record = self._getByName(name)
+        return record
+
     def register(self, name: str, type: CollectionType, doc: Optional[str] = None) -> CollectionRecord:
         # Docstring inherited from CollectionManager.
-        record = self._getByName(name)
+        record = self._findByName(name)
         if record is None:
             row, _ = self._db.sync(
                 self._tables.collection,
@@ -401,7 +450,7 @@ class DefaultCollectionManager(Generic[K], CollectionManager):
 
     def remove(self, name: str) -> None:
         # Docstring inherited from CollectionManager.
-        record = self._getByName(name)
+        record = self._findByName(name)
         if record is None:
             raise MissingCollectionError(f"No collection with name '{name}' found.")
         # This may raise
@@ -411,19 +460,24 @@ class DefaultCollectionManager(Generic[K], CollectionManager):
 
     def find(self, name: str) -> CollectionRecord:
         # Docstring inherited from CollectionManager.
-        result = self._getByName(name)
+        result = self._findByName(name)
         if result is None:
             raise MissingCollectionError(f"No collection with name '{name}' found.")
         return result
 
     def __getitem__(self, key: Any) -> CollectionRecord:
         # Docstring inherited from CollectionManager.
-        try:
-            return self._records[key]
-        except KeyError as err:
-            raise MissingCollectionError(f"Collection with key '{key}' not found.") from err
+        record = self._records.get(key)
+        if record is None and self._lazy and not self._complete:
+            self._loadRecords(self._tables.collection.columns[self._collectionIdName] == key)
+            record = self._records.get(key)
+        if record is None:
+            raise MissingCollectionError(f"Collection with key '{key}' not found.")
+        return record
 
     def __iter__(self) -> Iterator[CollectionRecord]:
+        if self._lazy and not self._complete:
+            self._loadRecords()
         yield from self._records.values()
 
     def getDocumentation(self, key: Any) -> Optional[str]:
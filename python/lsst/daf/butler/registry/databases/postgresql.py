@@ -23,7 +23,7 @@ from __future__ import annotations
 __all__ = ["PostgresqlDatabase"]
 
 from contextlib import contextmanager, closing
-from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union
 
 import psycopg2
 import sqlalchemy.dialects.postgresql
@@ -152,6 +152,76 @@ class PostgresqlDatabase(Database):
         # Docstring inherited.
         return _RangeTimespanRepresentation
 
+    def insert(self, table: sqlalchemy.schema.Table, *rows: dict, returnIds: bool = False,
+               select: Optional[sqlalchemy.sql.Select] = None,
+               names: Optional[Iterable[str]] = None,
+               ) -> Optional[List[int]]:
+        # Docstring inherited.
+        if not returnIds or len(rows) <= 1 or not rows[0]:
+            return super().insert(table, *rows, returnIds=returnIds, select=select, names=names)
+        self.assertTableWriteable(table, f"Cannot insert into read-only table {table}.")
+        if select is not None:
+            raise TypeError("'select' is incompatible with passing value rows or returnIds=True.")
+        # Use multi-row INSERT ... RETURNING statements to get the generated
+        # keys back with one round trip per batch of rows.  PostgreSQL does
+        # not guarantee that RETURNING yields rows in the order of the VALUES
+        # clause, so we also return the columns of a unique constraint whose
+        # values are all provided by the caller, and use those to put the
+        # generated keys back in the order of ``rows``.  When all rows are
+        # identical (as for the ``dataset`` table in `Registry.insertDatasets`)
+        # the order does not matter, and we use the keys as returned.  If
+        # neither applies we cannot match them up, and fall back to the
+        # per-row implementation.
+        primaryKey = next(iter(table.primary_key.columns))
+        ids: List[int] = []
+        if all(row == rows[0] for row in rows):
+            sql = table.insert().returning(primaryKey)
+            for start in range(0, len(rows), self._INSERT_BATCH_SIZE):
+                batch = list(rows[start:start + self._INSERT_BATCH_SIZE])
+                ids.extend(sorted(row[0] for row in self._connection.execute(sql.values(batch))))
+            return ids
+        key = self._findSuppliedUniqueKey(table, rows)
+        if key is None:
+            return super().insert(table, *rows, returnIds=returnIds, select=select, names=names)
+        sql = table.insert().returning(primaryKey, *[table.columns[name] for name in key])
+        for start in range(0, len(rows), self._INSERT_BATCH_SIZE):
+            batch = list(rows[start:start + self._INSERT_BATCH_SIZE])
+            idsByKey = {tuple(row[1:]): row[0] for row in self._connection.execute(sql.values(batch))}
+            ids.extend(idsByKey[tuple(row[name] for name in key)] for row in batch)
+        return ids
+
+    @staticmethod
+    def _findSuppliedUniqueKey(table: sqlalchemy.schema.Table,
+                               rows: Sequence[dict]) -> Optional[Tuple[str, ...]]:
+        """Find a unique constraint whose columns are given non-null values
+        in all of the given rows.
+
+        Parameters
+        ----------
+        table : `sqlalchemy.schema.Table`
+            Table the rows will be inserted into.
+        rows : `Sequence` [ `dict` ]
+            Rows to be inserted, as dictionaries mapping column name to value.
+
+        Returns
+        -------
+        key : `tuple` [ `str` ] or `None`
+            Names of the columns in the constraint, or `None` if no unique
+            constraint is fully populated by ``rows``.
+        """
+        for constraint in table.constraints:
+            if not isinstance(constraint, sqlalchemy.schema.UniqueConstraint):
+                continue
+            key = tuple(column.name for column in constraint.columns)
+            if key and all(row.get(name) is not None for row in rows for name in key):
+                return key
+        return None
+
+    _INSERT_BATCH_SIZE = 10000
+    """Maximum number of rows in a single multi-row INSERT statement used by
+    `insert` when ``returnIds=True`` (`int`).
+    """
+
     def replace(self, table: sqlalchemy.schema.Table, *rows: dict) -> None:
         self.assertTableWriteable(table, f"Cannot replace into read-only table {table}.")
         if not rows:
@@ -24,9 +24,10 @@ __all__ = ["SqliteDatabase"]
 
 from contextlib import closing
 import copy
-from typing import Any, ContextManager, Dict, Iterable, List, Optional
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Mapping, Optional, Sequence
 from dataclasses import dataclass
 import os
+import re
 import urllib.parse
 
 import sqlite3
@@ -58,6 +59,82 @@ def _onSqlite3Begin(connection: sqlalchemy.engine.Connection) -> sqlalchemy.engi
     return connection
 
 
+def _onSqlite3BeginReadOnly(connection: sqlalchemy.engine.Connection) -> sqlalchemy.engine.Connection:
+    assert connection.dialect.name == "sqlite"
+    # Read-only connections never need the write lock, so use a deferred
+    # transaction that only takes a shared lock when it first reads; taking
+    # the lock up front would serialize all concurrent readers.
+    connection.execute("BEGIN DEFERRED")
+    return connection
+
+
+# PRAGMA settings that may be set via the 'pragmas' argument to
+# SqliteDatabase.makeEngine.
+_SQLITE_PRAGMAS = frozenset(["journal_mode", "synchronous", "mmap_size", "cache_size", "temp_store"])
+
+# PRAGMA settings that modify the database file and hence can only be set on
+# writeable connections.  The journal mode is persistent, so read-only
+# connections will still see a mode set by an earlier writeable one.
+_SQLITE_WRITE_PRAGMAS = frozenset(["journal_mode"])
+
+
+def _makeSqlite3PragmaListener(pragmas: Mapping[str, Any], writeable: bool
+                               ) -> Callable[[sqlite3.Connection, sqlalchemy.pool._ConnectionRecord], None]:
+    """Return a "connect" event listener that sets the given PRAGMAs.
+
+    Parameters
+    ----------
+    pragmas : `Mapping` [ `str`, `str` or `int` ]
+        PRAGMA names and values.  Entries with `None` values are ignored.
+    writeable : `bool`
+        Whether the connections will be writeable.
+
+    Returns
+    -------
+    listener : `Callable`
+        Listener to register for the engine's "connect" event.
+
+    Raises
+    ------
+    ValueError
+        Raised if a PRAGMA name is not supported or a value is not an
+        integer or an identifier.
+    """
+    statements = []
+    for name, value in pragmas.items():
+        if name not in _SQLITE_PRAGMAS:
+            raise ValueError(f"Unsupported SQLite PRAGMA {name!r}; "
+                             f"supported PRAGMAs are {sorted(_SQLITE_PRAGMAS)}.")
+        if value is None or (not writeable and name in _SQLITE_WRITE_PRAGMAS):
+            continue
+        if isinstance(value, bool) or not (isinstance(value, int) or re.fullmatch(r"\w+", str(value))):
+            raise ValueError(f"Invalid value {value!r} for SQLite PRAGMA {name!r}.")
+        statements.append(f"PRAGMA {name} = {value};")
+
+    def onConnect(dbapiConnection: sqlite3.Connection,
+                  connectionRecord: sqlalchemy.pool._ConnectionRecord) -> None:
+        with closing(dbapiConnection.cursor()) as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    return onConnect
+
+
+def _onSqlite3PoolConnect(dbapiConnection: sqlite3.Connection,
+                          connectionRecord: sqlalchemy.pool._ConnectionRecord) -> None:
+    connectionRecord.info["pid"] = os.getpid()
+
+
+def _onSqlite3PoolCheckout(dbapiConnection: sqlite3.Connection,
+                           connectionRecord: sqlalchemy.pool._ConnectionRecord,
+                           connectionProxy: Any) -> None:
+    # SQLite connections must not be used in a process forked from the one
+    # that opened them; make the pool discard and replace them instead.
+    if connectionRecord.info["pid"] != os.getpid():
+        connectionRecord.connection = connectionProxy.connection = None
+        raise sqlalchemy.exc.DisconnectionError("SQLite connection was opened by a different process.")
+
+
 class _Replace(sqlalchemy.sql.Insert):
     """A SQLAlchemy query that compiles to INSERT ... ON CONFLICT REPLACE
     on the primary key constraint for the table.
@@ -178,7 +255,8 @@ class SqliteDatabase(Database):
 
     @classmethod
     def makeEngine(cls, uri: Optional[str] = None, *, filename: Optional[str] = None,
-                   writeable: bool = True) -> sqlalchemy.engine.Engine:
+                   writeable: bool = True, pragmas: Optional[Mapping[str, Any]] = None,
+                   poolSize: Optional[int] = None) -> sqlalchemy.engine.Engine:
         """Create a `sqlalchemy.engine.Engine` from a SQLAlchemy URI or
         filename.
 
@@ -191,12 +269,33 @@ class SqliteDatabase(Database):
             database.  Ignored if ``uri is not None``.
         writeable : `bool`, optional
             If `True`, allow write operations on the database, including
-            ``CREATE TABLE``.
+            ``CREATE TABLE``.  Transactions on read-only engines are
+            deferred (``BEGIN DEFERRED``), so they do not block each other.
+        pragmas : `Mapping` [ `str`, `str` or `int` ], optional
+            SQLite PRAGMA settings to apply to every new connection, e.g.
+            ``{"journal_mode": "WAL", "cache_size": -65536}``.  Supported
+            names are ``journal_mode``, ``synchronous``, ``mmap_size``,
+            ``cache_size`` and ``temp_store``; `None` values are ignored.
+            ``journal_mode`` is only set on writeable connections, because
+            it modifies the database file.
+        poolSize : `int`, optional
+            Number of connections to keep open for reuse when connecting to
+            a file.  If `None` (default) or zero, a new connection is opened
+            whenever one is needed outside a `~Database.session`, and
+            per-connection state such as the page cache is discarded with it.
+            More connections are opened if needed, but only this many are
+            kept once they are returned.
 
         Returns
         -------
         engine : `sqlalchemy.engine.Engine`
             A database engine.
+
+        Raises
+        ------
+        ValueError
+            Raised if ``pragmas`` includes an unsupported name or an invalid
+            value.
         """
         # In order to be able to tell SQLite that we want a read-only or
         # read-write connection, we need to make the SQLite DBAPI connection
@@ -245,10 +344,23 @@ class SqliteDatabase(Database):
         def creator() -> sqlite3.Connection:
             return sqlite3.connect(target, check_same_thread=False, uri=True)
 
-        engine = sqlalchemy.engine.create_engine(uri, creator=creator)
+        engineKwargs: Dict[str, Any] = {}
+        if filename is not None and poolSize:
+            # No limit on overflow connections: query result iterators that
+            # are not exhausted keep their connection checked out until they
+            # are garbage-collected, and a hard limit would make later queries
+            # block waiting for them.  Overflow connections are closed when
+            # returned, so only poolSize connections are kept open.
+            engineKwargs.update(poolclass=sqlalchemy.pool.QueuePool, pool_size=poolSize, max_overflow=-1)
+        engine = sqlalchemy.engine.create_engine(uri, creator=creator, **engineKwargs)
+        if engineKwargs:
+            sqlalchemy.event.listen(engine, "connect", _onSqlite3PoolConnect)
+            sqlalchemy.event.listen(engine, "checkout", _onSqlite3PoolCheckout)
 
         sqlalchemy.event.listen(engine, "connect", _onSqlite3Connect)
-        sqlalchemy.event.listen(engine, "begin", _onSqlite3Begin)
+        if pragmas:
+            sqlalchemy.event.listen(engine, "connect", _makeSqlite3PragmaListener(pragmas, writeable))
+        sqlalchemy.event.listen(engine, "begin", _onSqlite3Begin if writeable else _onSqlite3BeginReadOnly)
         try:
             return engine
         except sqlalchemy.exc.OperationalError as err:
@@ -272,9 +384,10 @@ class SqliteDatabase(Database):
     def _lockTables(self, tables: Iterable[sqlalchemy.schema.Table] = ()) -> None:
         # Docstring inherited.
         # Our SQLite database always acquires full-database locks at the
-        # beginning of a transaction, so there's no need to acquire table-level
-        # locks - which is good, because SQLite doesn't have table-level
-        # locking.
+        # beginning of a transaction (unless it is read-only, in which case
+        # there is nothing to lock against), so there's no need to acquire
+        # table-level locks - which is good, because SQLite doesn't have
+        # table-level locking.
         pass
 
     # MyPy claims that the return type here isn't covariant with the return
@@ -397,18 +510,11 @@ class SqliteDatabase(Database):
                 # because we can't safely generate autoincrement values
                 # otherwise.
                 assert all(autoincr.column not in row and row["origin"] == self.origin for row in rows)
-                # Insert into the autoincr table one by one to get the
-                # primary key values back, then insert into the target table
-                # in the same transaction.
+                # Reserve a block of IDs in the autoincr table, then insert
+                # into the target table in the same transaction.
                 with self.transaction():
-                    newRows = []
-                    ids = []
-                    for row in rows:
-                        newRow = row.copy()
-                        id = self._connection.execute(autoincr.table.insert()).inserted_primary_key[0]
-                        newRow[autoincr.column] = id
-                        newRows.append(newRow)
-                        ids.append(id)
+                    ids = self._insertWithConsecutiveIds(autoincr.table, "id", [{}]*len(rows))
+                    newRows = [dict(row, **{autoincr.column: id}) for row, id in zip(rows, ids)]
                     # Don't ever ask to returnIds here, because we've already
                     # got them.
                     super().insert(table, *newRows)
@@ -416,9 +522,56 @@ class SqliteDatabase(Database):
                     return ids
                 else:
                     return None
+        elif returnIds and rows:
+            if select is not None:
+                raise TypeError("'select' is incompatible with passing value rows or returnIds=True.")
+            idColumn = next(iter(table.primary_key.columns))
+            if idColumn.name in rows[0]:
+                return super().insert(table, *rows, returnIds=returnIds)
+            with self.transaction():
+                return self._insertWithConsecutiveIds(table, idColumn.name, rows)
         else:
             return super().insert(table, *rows, select=select, names=names, returnIds=returnIds)
 
+    def _insertWithConsecutiveIds(self, table: sqlalchemy.schema.Table, idName: str,
+                                  rows: Sequence[dict]) -> List[int]:
+        """Insert rows into a table with an integer primary key, generating
+        consecutive values for that key.
+
+        Parameters
+        ----------
+        table : `sqlalchemy.schema.Table`
+            Table rows should be inserted into.  Its primary key must be a
+            single integer column, which is an alias for the SQLite rowid.
+        idName : `str`
+            Name of the primary key column.
+        rows : `Sequence` [ `dict` ]
+            Rows to insert, which must not include values for the primary
+            key.
+
+        Returns
+        -------
+        ids : `list` [ `int` ]
+            Primary key values for the inserted rows, in order.
+
+        Notes
+        -----
+        This must be called inside a transaction.  Only the first row is
+        inserted on its own, to find out which ID SQLite assigns to it; the
+        rest are inserted with a single bulk INSERT using the following IDs.
+        Those are guaranteed to be unused because SQLite always assigns a new
+        rowid larger than any already in the table, and the first INSERT
+        gives this transaction the database write lock until it ends.
+        """
+        first = self._connection.execute(table.insert(), rows[0]).inserted_primary_key[0]
+        ids = list(range(first, first + len(rows)))
+        if len(rows) > 1:
+            self._connection.execute(
+                table.insert(),
+                *[dict(row, **{idName: id}) for row, id in zip(rows[1:], ids[1:])]
+            )
+        return ids
+
     def replace(self, table: sqlalchemy.schema.Table, *rows: dict) -> None:
         self.assertTableWriteable(table, f"Cannot replace into read-only table {table}.")
         if not rows:
@@ -5,6 +5,7 @@ __all__ = ("ByDimensionsDatasetRecordStorageManager",)
 from typing import (
     Any,
     Dict,
+    Iterable,
     Iterator,
     Optional,
     Tuple,
@@ -68,7 +69,9 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
 
      - It aggressively loads all DatasetTypes into memory instead of fetching
        them from the database only when needed or attempting more clever forms
-       of caching.
+       of caching, unless `refresh` is called with ``lazy=True``; dataset
+       types (and collection summaries) are then fetched and cached when they
+       are first used, or in bulk by `prefetch`.
 
     Alternative implementations that make different choices for these while
     keeping the same general table organization might be reasonable as well.
@@ -102,6 +105,9 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
         self._summaries = summaries
         self._byName: Dict[str, ByDimensionsDatasetRecordStorage] = {}
         self._byId: Dict[int, ByDimensionsDatasetRecordStorage] = {}
+        self._lazy = False
+        self._complete = False  # whether all dataset types are in the cache
+        self._cacheCalibrations = False
 
     @classmethod
     def initialize(
@@ -129,12 +135,54 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
         # Docstring inherited from DatasetRecordStorageManager.
         return addDatasetForeignKey(tableSpec, name=name, onDelete=onDelete, constraint=constraint, **kwargs)
 
-    def refresh(self) -> None:
+    def refresh(self, *, lazy: Optional[bool] = None) -> None:
         # Docstring inherited from DatasetRecordStorageManager.
+        if lazy is not None:
+            self._lazy = lazy
+        if self._lazy:
+            self._byName = {}
+            self._byId = {}
+            self._complete = False
+        else:
+            self._loadStorage()
+        self._summaries.refresh(self._getDatasetTypeById, lazy=self._lazy)
+
+    def prefetch(self, names: Iterable[str]) -> None:
+        # Docstring inherited from DatasetRecordStorageManager.
+        if self._lazy and not self._complete:
+            missing = {DatasetType.splitDatasetTypeName(name)[0] for name in names}
+            missing.difference_update(self._byName.keys())
+            if missing:
+                self._loadStorage(self._static.dataset_type.columns.name.in_(missing))
+
+    def setCalibrationCaching(self, enabled: bool) -> None:
+        # Docstring inherited from DatasetRecordStorageManager.
+        self._cacheCalibrations = enabled
+        for storage in self._byName.values():
+            storage.setCalibrationCaching(enabled)
+
+    def clearCalibrationCaches(self) -> None:
+        # Docstring inherited from DatasetRecordStorageManager.
+        for storage in self._byName.values():
+            storage.clearCalibrationCaches()
+
+    def _loadStorage(self, where: Optional[sqlalchemy.sql.ColumnElement] = None) -> None:
+        """Load dataset types from the database into the cache.
+
+        Parameters
+        ----------
+        where : `sqlalchemy.sql.ColumnElement`, optional
+            Expression restricting the rows of the dataset type table to load.
+            If not given, all dataset types are loaded and replace the
+            contents of the cache.
+        """
         byName = {}
         byId = {}
         c = self._static.dataset_type.columns
-        for row in self._db.query(self._static.dataset_type.select()).fetchall():
+        sql = self._static.dataset_type.select()
+        if where is not None:
+            sql = sql.where(where)
+        for row in self._db.query(sql).fetchall():
             name = row[c.name]
             dimensions = self._dimensions.loadDimensionGraph(row[c.dimensions_key])
             calibTableName = row[c.calibration_association_table]
@@ -152,12 +200,44 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
                                                        static=self._static, summaries=self._summaries,
                                                        tags=tags, calibs=calibs,
                                                        dataset_type_id=row["id"],
-                                                       collections=self._collections)
+                                                       collections=self._collections,
+                                                       cacheCalibrations=self._cacheCalibrations)
             byName[datasetType.name] = storage
             byId[storage._dataset_type_id] = storage
-        self._byName = byName
-        self._byId = byId
-        self._summaries.refresh(lambda dataset_type_id: self._byId[dataset_type_id].datasetType)
+        if where is None:
+            self._byName = byName
+            self._byId = byId
+            self._complete = True
+        else:
+            self._byName.update(byName)
+            self._byId.update(byId)
+
+    def _getStorage(self, name: str) -> Optional[ByDimensionsDatasetRecordStorage]:
+        """Return the storage for a non-component dataset type, loading it
+        from the database if it is not in the cache yet.
+        """
+        storage = self._byName.get(name)
+        if storage is None and self._lazy and not self._complete:
+            self._loadStorage(self._static.dataset_type.columns.name == name)
+            storage = self._byName.get(name)
+        return storage
+
+    def _getStorageById(self, dataset_type_id: int) -> Optional[ByDimensionsDatasetRecordStorage]:
+        """Return the storage for a dataset type given its primary key,
+        loading it from the database if it is not in the cache yet.
+        """
+        storage = self._byId.get(dataset_type_id)
+        if storage is None and self._lazy and not self._complete:
+            self._loadStorage(self._static.dataset_type.columns.id == dataset_type_id)
+            storage = self._byId.get(dataset_type_id)
+        return storage
+
+    def _getDatasetTypeById(self, dataset_type_id: int) -> DatasetType:
+        """Return a dataset type given its primary key.
+        """
+        storage = self._getStorageById(dataset_type_id)
+        assert storage is not None, "Should be guaranteed by foreign key constraints."
+        return storage.datasetType
 
     def remove(self, name: str) -> None:
         # Docstring inherited from DatasetRecordStorageManager.
@@ -179,7 +259,7 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
     def find(self, name: str) -> Optional[DatasetRecordStorage]:
         # Docstring inherited from DatasetRecordStorageManager.
         compositeName, componentName = DatasetType.splitDatasetTypeName(name)
-        storage = self._byName.get(compositeName)
+        storage = self._getStorage(compositeName)
         if storage is not None and componentName is not None:
             componentStorage = copy.copy(storage)
             componentStorage.datasetType = storage.datasetType.makeComponentDatasetType(componentName)
@@ -192,7 +272,7 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
         if datasetType.isComponent():
             raise ValueError("Component dataset types can not be stored in registry."
                              f" Rejecting {datasetType.name}")
-        storage = self._byName.get(datasetType.name)
+        storage = self._getStorage(datasetType.name)
         if storage is None:
             dimensionsKey = self._dimensions.saveDimensionGraph(datasetType.dimensions)
             tagTableName = makeTagTableName(datasetType, dimensionsKey)
@@ -228,7 +308,8 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
                                                        static=self._static, summaries=self._summaries,
                                                        tags=tags, calibs=calibs,
                                                        dataset_type_id=row["id"],
-                                                       collections=self._collections)
+                                                       collections=self._collections,
+                                                       cacheCalibrations=self._cacheCalibrations)
             self._byName[datasetType.name] = storage
             self._byId[storage._dataset_type_id] = storage
         else:
@@ -239,6 +320,8 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
         return storage, inserted
 
     def __iter__(self) -> Iterator[DatasetType]:
+        if self._lazy and not self._complete:
+            self._loadStorage()
         for storage in self._byName.values():
             yield storage.datasetType
 
@@ -257,10 +340,10 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
         row = self._db.query(sql).fetchone()
         if row is None:
             return None
-        recordsForType = self._byId.get(row[self._static.dataset.columns.dataset_type_id])
+        recordsForType = self._getStorageById(row[self._static.dataset.columns.dataset_type_id])
         if recordsForType is None:
             self.refresh()
-            recordsForType = self._byId.get(row[self._static.dataset.columns.dataset_type_id])
+            recordsForType = self._getStorageById(row[self._static.dataset.columns.dataset_type_id])
             assert recordsForType is not None, "Should be guaranteed by foreign key constraints."
         return DatasetRef(
             recordsForType.datasetType,
@@ -2,24 +2,33 @@ from __future__ import annotations
 
 __all__ = ("ByDimensionsDatasetRecordStorage",)
 
+import bisect
+from collections import defaultdict
+from contextlib import contextmanager, ExitStack
+import itertools
 from typing import (
     Any,
     Dict,
     Iterable,
     Iterator,
+    List,
     Optional,
+    Sequence,
     Set,
+    Tuple,
     TYPE_CHECKING,
 )
 
 import sqlalchemy
 
 from lsst.daf.butler import (
+    addDimensionForeignKey,
     CollectionType,
     DataCoordinate,
     DataCoordinateSet,
     DatasetRef,
     DatasetType,
+    ddl,
     SimpleQuery,
     Timespan,
 )
@@ -34,6 +43,65 @@ if TYPE_CHECKING:
     from .summaries import CollectionSummaryManager
 
 
+class _CalibrationIndex:
+    """An in-memory index of the validity ranges of the datasets of a single
+    type in a single `~CollectionType.CALIBRATION` collection.
+
+    Parameters
+    ----------
+    rows : `Iterable` [ `tuple` ]
+        Tuples of ``(values, timespan, dataset_id, run_key)``, where
+        ``values`` is a tuple of required dimension values.
+
+    Notes
+    -----
+    The validity ranges of datasets with the same data ID in a collection are
+    guaranteed to be disjoint, so sorting them by their beginnings also sorts
+    them by their ends, and the ranges that overlap a given timespan can be
+    found by bisection.
+    """
+    def __init__(self, rows: Iterable[Tuple[Tuple[Any, ...], Timespan, int, Any]]):
+        byValues: Dict[Tuple[Any, ...], List[Tuple[int, int, int, Any]]] = defaultdict(list)
+        for values, timespan, datasetId, runKey in rows:
+            if not timespan.isEmpty():
+                begin, end = timespan._nsec
+                byValues[values].append((begin, end, datasetId, runKey))
+        self._ranges: Dict[Tuple[Any, ...], Tuple[List[int], List[Tuple[int, int, int, Any]]]] = {}
+        for values, entries in byValues.items():
+            entries.sort()
+            self._ranges[values] = ([entry[1] for entry in entries], entries)
+
+    def find(self, values: Tuple[Any, ...], timespan: Timespan) -> List[Tuple[int, Any]]:
+        """Find the datasets whose validity ranges overlap a timespan.
+
+        Parameters
+        ----------
+        values : `tuple`
+            Required dimension values of the data ID to search for.
+        timespan : `Timespan`
+            Timespan the validity ranges must overlap.
+
+        Returns
+        -------
+        matches : `list` [ `tuple` ]
+            Tuples of ``(dataset_id, run_key)`` for all matching datasets.
+        """
+        indexed = self._ranges.get(values)
+        if indexed is None or timespan.isEmpty():
+            return []
+        ends, entries = indexed
+        begin, end = timespan._nsec
+        # Skip ranges that end before this timespan begins (ends are
+        # exclusive), then take ranges until one begins after it ends.
+        result = []
+        for entryBegin, _, datasetId, runKey in itertools.islice(entries, bisect.bisect_right(ends, begin),
+                                                                 None):
+            if entryBegin >= end:
+                break
+            result.append((datasetId, runKey))
+        return result
+
+
 class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
     """Dataset record storage implementation paired with
     `ByDimensionsDatasetRecordStorageManager`; see that class for more
@@ -49,7 +117,8 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
                  static: StaticDatasetTablesTuple,
                  summaries: CollectionSummaryManager,
                  tags: sqlalchemy.schema.Table,
-                 calibs: Optional[sqlalchemy.schema.Table]):
+                 calibs: Optional[sqlalchemy.schema.Table],
+                 cacheCalibrations: bool = False):
         super().__init__(datasetType=datasetType)
         self._dataset_type_id = dataset_type_id
         self._db = db
@@ -59,6 +128,168 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         self._tags = tags
         self._calibs = calibs
         self._runKeyColumn = collections.getRunForeignKeyName()
+        self._calibIndexes: Optional[Dict[Any, Tuple[CollectionRecord, _CalibrationIndex]]] = None
+        self.setCalibrationCaching(cacheCalibrations)
+
+    def setCalibrationCaching(self, enabled: bool) -> None:
+        """Enable or disable in-memory caching of validity ranges in
+        `~CollectionType.CALIBRATION` collections.
+
+        Parameters
+        ----------
+        enabled : `bool`
+            Whether to cache validity ranges.  Anything already cached is
+            discarded either way.
+
+        Notes
+        -----
+        When enabled, the validity ranges of all datasets of this type in a
+        `~CollectionType.CALIBRATION` collection are loaded the first time
+        that collection is searched with a timespan, and later searches are
+        done in memory.  The cache for a collection is discarded when this
+        object certifies, decertifies or deletes datasets, and is not used if
+        the collection's record has been replaced (e.g. by a refresh).  It is
+        never loaded inside a transaction, so that it cannot hold changes that
+        are later rolled back.  It does not see changes made by other clients
+        until it is refreshed.
+        """
+        self._calibIndexes = {} if enabled and self._calibs is not None else None
+
+    def clearCalibrationCaches(self) -> None:
+        """Discard all cached validity range indexes.
+
+        This must be called when calibration associations may have been
+        removed without going through this object, such as by the database's
+        cascading deletes when a `~CollectionType.RUN` collection is removed.
+        """
+        if self._calibIndexes is not None:
+            self._calibIndexes.clear()
+
+    def _canUseCalibrationIndex(self, collection: CollectionRecord) -> bool:
+        """Test whether a collection can be searched with a validity range
+        index.
+
+        Parameters
+        ----------
+        collection : `CollectionRecord`
+            Record for the collection.
+
+        Returns
+        -------
+        can : `bool`
+            `True` if caching is enabled, ``collection`` is a
+            `~CollectionType.CALIBRATION` collection, and its index is either
+            already loaded or can be loaded now (i.e. outside a transaction).
+        """
+        if self._calibIndexes is None or collection.type is not CollectionType.CALIBRATION:
+            return False
+        if not self._db.isInTransaction():
+            return True
+        cached = self._calibIndexes.get(collection.key)
+        return cached is not None and cached[0] is collection
+
+    def _getCalibrationIndex(self, collection: CollectionRecord) -> _CalibrationIndex:
+        """Return the validity range index for a `~CollectionType.CALIBRATION`
+        collection, loading it if necessary.
+
+        Parameters
+        ----------
+        collection : `CollectionRecord`
+            Record for the collection, for which `_canUseCalibrationIndex`
+            must return `True`.
+
+        Returns
+        -------
+        index : `_CalibrationIndex`
+            Index of the validity ranges of all datasets of this type in the
+            collection.
+        """
+        assert self._calibIndexes is not None
+        cached = self._calibIndexes.get(collection.key)
+        if cached is not None and cached[0] is collection:
+            return cached[1]
+        sql = self.select(collection, dataId=SimpleQuery.Select, id=SimpleQuery.Select,
+                          run=SimpleQuery.Select, timespan=SimpleQuery.Select).combine()
+        TimespanReprClass = self._db.getTimespanRepresentation()
+        names = self.datasetType.dimensions.required.names
+        index = _CalibrationIndex(
+            (tuple(row[name] for name in names), TimespanReprClass.extract(row), row["id"],
+             row[self._runKeyColumn])
+            for row in self._db.query(sql)
+        )
+        self._calibIndexes[collection.key] = (collection, index)
+        return index
+
+    def _partitionCachedCollections(self, collections: Sequence[CollectionRecord],
+                                    timespan: Optional[Timespan]
+                                    ) -> Tuple[List[CollectionRecord], List[CollectionRecord]]:
+        """Split the collections to search into those that must be queried
+        and those that can be searched with cached validity range indexes.
+
+        Parameters
+        ----------
+        collections : `Sequence` [ `CollectionRecord` ]
+            Records for the collections to search.
+        timespan : `Timespan`, optional
+            Timespan the validity range of the dataset must overlap.
+
+        Returns
+        -------
+        queried : `list` [ `CollectionRecord` ]
+            Collections to search via `_selectFindFirstCandidates`.
+        cached : `list` [ `CollectionRecord` ]
+            `~CollectionType.CALIBRATION` collections to search via
+            `_findCachedCandidates`.
+        """
+        if self._calibIndexes is None or timespan is None:
+            return list(collections), []
+        queried = []
+        cached = []
+        for collection in collections:
+            if self._canUseCalibrationIndex(collection):
+                cached.append(collection)
+            else:
+                queried.append(collection)
+        return queried, cached
+
+    def _findCachedCandidates(self, collections: Sequence[CollectionRecord],
+                              dataIdsByValues: Dict[Tuple[Any, ...], DataCoordinate],
+                              names: Tuple[str, ...], timespan: Timespan) -> List[Dict[str, Any]]:
+        """Search cached validity range indexes, returning rows like those of
+        the queries built by `_selectFindFirstCandidates`.
+
+        Parameters
+        ----------
+        collections : `Sequence` [ `CollectionRecord` ]
+            Records for the `~CollectionType.CALIBRATION` collections to
+            search.
+        dataIdsByValues : `dict` [ `tuple`, `DataCoordinate` ]
+            The data IDs to search for, keyed by the tuple of their values for
+            the dimensions in ``names``.
+        names : `tuple` [ `str` ]
+            Names of the dimension columns to include in each row.
+        timespan : `Timespan`
+            Timespan the validity range of the dataset must overlap.
+
+        Returns
+        -------
+        rows : `list` [ `dict` ]
+            Rows suitable for `_resolveFindFirstCandidates`.
+        """
+        collectionFkName = self._collections.getCollectionForeignKeyName()
+        requiredNames = self.datasetType.dimensions.required.names
+        rows = []
+        for collection in collections:
+            index = self._getCalibrationIndex(collection)
+            for values, dataId in dataIdsByValues.items():
+                for datasetId, runKey in index.find(tuple(dataId[name] for name in requiredNames),
+                                                    timespan):
+                    row = dict(zip(names, values))
+                    row[collectionFkName] = collection.key
+                    row["id"] = datasetId
+                    row[self._runKeyColumn] = runKey
+                    rows.append(row)
+        return rows
 
     def insert(self, run: RunRecord, dataIds: Iterable[DataCoordinate]) -> Iterator[DatasetRef]:
         # Docstring inherited from DatasetRecordStorage.
@@ -111,6 +342,13 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         if collection.type is CollectionType.CALIBRATION and timespan is None:
             raise TypeError(f"Cannot search for dataset in CALIBRATION collection {collection.name} "
                             f"without an input timespan.")
+        if self._canUseCalibrationIndex(collection):
+            assert timespan is not None
+            refs = self._resolveFindFirstCandidates(
+                [collection], self._findCachedCandidates([collection], {(): dataId}, (), timespan),
+                {(): dataId}, (), timespan
+            )
+            return refs.get(dataId)
         sql = self.select(collection=collection, dataId=dataId, id=SimpleQuery.Select,
                           run=SimpleQuery.Select, timespan=timespan).combine()
         results = self._db.query(sql)
@@ -140,10 +378,215 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
             run=self._collections[row[self._runKeyColumn]].name
         )
 
+    def findFirst(self, collections: Sequence[CollectionRecord], dataId: DataCoordinate,
+                  timespan: Optional[Timespan] = None) -> Optional[DatasetRef]:
+        # Docstring inherited from DatasetRecordStorage.
+        assert dataId.graph == self.datasetType.dimensions
+        queried, cached = self._partitionCachedCollections(collections, timespan)
+        rows: Iterable[Any] = []
+        if cached:
+            assert timespan is not None
+            rows = self._findCachedCandidates(cached, {(): dataId}, (), timespan)
+        sql = self._selectFindFirstCandidates(queried, timespan, dataId=dataId)
+        if sql is not None:
+            rows = itertools.chain(rows, self._db.query(sql))
+        refs = self._resolveFindFirstCandidates(collections, rows, {(): dataId}, (), timespan)
+        return refs.get(dataId)
+
+    def findFirstMany(self, collections: Sequence[CollectionRecord], dataIds: Iterable[DataCoordinate],
+                      timespan: Optional[Timespan] = None) -> Dict[DataCoordinate, DatasetRef]:
+        # Docstring inherited from DatasetRecordStorage.
+        names = tuple(self.datasetType.dimensions.required.names)
+        dataIdsByValues = {}
+        for dataId in dataIds:
+            assert dataId.graph == self.datasetType.dimensions
+            dataIdsByValues[tuple(dataId[name] for name in names)] = dataId
+        if len(dataIdsByValues) <= 1:
+            # Nothing to gain from a temporary table; this also handles
+            # dataset types with no dimensions.
+            result = {}
+            for dataId in dataIdsByValues.values():
+                ref = self.findFirst(collections, dataId, timespan=timespan)
+                if ref is not None:
+                    result[dataId] = ref
+            return result
+        queried, cached = self._partitionCachedCollections(collections, timespan)
+        rows: Iterable[Any] = []
+        if cached:
+            assert timespan is not None
+            rows = self._findCachedCandidates(cached, dataIdsByValues, names, timespan)
+        if not queried:
+            return self._resolveFindFirstCandidates(collections, rows, dataIdsByValues, names, timespan)
+        # Upload the data IDs to a temporary table and join against it, so we
+        # can search for all of them (in all other collections) with one
+        # query.
+        spec = ddl.TableSpec(fields=())
+        for dimension in self.datasetType.dimensions.required:
+            addDimensionForeignKey(spec, dimension, primaryKey=True, constraint=False)
+        with self._db.session() as session:
+            table = session.makeTemporaryTable(spec)
+            try:
+                self._db.insert(table, *[dict(zip(names, values)) for values in dataIdsByValues])
+                sql = self._selectFindFirstCandidates(queried, timespan, dataIdTable=table)
+                if sql is not None:
+                    rows = itertools.chain(rows, self._db.query(sql))
+                result = self._resolveFindFirstCandidates(collections, rows, dataIdsByValues, names,
+                                                          timespan)
+            finally:
+                session.dropTemporaryTable(table)
+        return result
+
+    def _selectFindFirstCandidates(self, collections: Sequence[CollectionRecord],
+                                   timespan: Optional[Timespan], *,
+                                   dataId: Optional[DataCoordinate] = None,
+                                   dataIdTable: Optional[sqlalchemy.schema.Table] = None,
+                                   ) -> Optional[sqlalchemy.sql.Selectable]:
+        """Build a query for all datasets in any of the given collections that
+        match the given data ID(s).
+
+        Parameters
+        ----------
+        collections : `Sequence` [ `CollectionRecord` ]
+            Records for the collections to search.  Order is irrelevant here;
+            it is applied by `_resolveFindFirstCandidates`.
+        timespan : `Timespan`, optional
+            A timespan that the validity range of the dataset must overlap.
+            Required if any of ``collections`` is a
+            `~CollectionType.CALIBRATION` collection.
+        dataId : `DataCoordinate`, optional
+            A single data ID to constrain the query with.
+        dataIdTable : `sqlalchemy.schema.Table`, optional
+            A table with a column for each required dimension, holding the
+            data IDs to search for.  Mutually exclusive with ``dataId``.
+
+        Returns
+        -------
+        sql : `sqlalchemy.sql.Selectable` or `None`
+            A query with dataset ID, run key, collection key, and (required)
+            dimension columns, or `None` if no collection could possibly hold
+            a matching dataset.
+        """
+        collectionFkName = self._collections.getCollectionForeignKeyName()
+        taggedKeys = []
+        calibrationKeys = []
+        for collection in collections:
+            assert collection.type is not CollectionType.CHAINED
+            if collection.type is CollectionType.CALIBRATION:
+                if timespan is None:
+                    raise TypeError(f"Cannot search for dataset in CALIBRATION collection {collection.name} "
+                                    f"without an input timespan.")
+                if self._calibs is not None:
+                    calibrationKeys.append(collection.key)
+            else:
+                taggedKeys.append(collection.key)
+        selects = []
+        for table, keys in ((self._tags, taggedKeys), (self._calibs, calibrationKeys)):
+            if not keys:
+                continue
+            query = SimpleQuery()
+            query.join(
+                self._static.dataset,
+                id=SimpleQuery.Select,
+                dataset_type_id=self._dataset_type_id,
+                **{self._runKeyColumn: SimpleQuery.Select}
+            )
+            kwargs: Dict[str, Any] = {collectionFkName: SimpleQuery.Select}
+            if dataId is not None:
+                kwargs.update(dataId.byName())
+            else:
+                kwargs.update({name: SimpleQuery.Select
+                               for name in self.datasetType.dimensions.required.names})
+            query.join(
+                table,
+                onclause=(self._static.dataset.columns.id == table.columns.dataset_id),
+                **kwargs
+            )
+            query.where.append(table.columns[collectionFkName].in_(keys))
+            if table is self._calibs:
+                TimespanReprClass = self._db.getTimespanRepresentation()
+                query.where.append(
+                    TimespanReprClass.fromSelectable(table).overlaps(TimespanReprClass.fromLiteral(timespan))
+                )
+            if dataIdTable is not None:
+                query.join(
+                    dataIdTable,
+                    onclause=sqlalchemy.sql.and_(*[
+                        table.columns[name] == dataIdTable.columns[name]
+                        for name in self.datasetType.dimensions.required.names
+                    ])
+                )
+            selects.append(query.combine())
+        if not selects:
+            return None
+        elif len(selects) == 1:
+            return selects[0]
+        else:
+            return sqlalchemy.sql.union_all(*selects)
+
+    def _resolveFindFirstCandidates(self, collections: Sequence[CollectionRecord],
+                                    rows: Iterable[Any],
+                                    dataIdsByValues: Dict[Tuple[Any, ...], DataCoordinate],
+                                    names: Tuple[str, ...],
+                                    timespan: Optional[Timespan]) -> Dict[DataCoordinate, DatasetRef]:
+        """Select the first dataset found for each data ID from the result
+        rows of a query built by `_selectFindFirstCandidates`.
+
+        Parameters
+        ----------
+        collections : `Sequence` [ `CollectionRecord` ]
+            Records for the collections searched, in order.
+        rows : `Iterable`
+            Result rows of the query.
+        dataIdsByValues : `dict` [ `tuple`, `DataCoordinate` ]
+            The data IDs searched for, keyed by the tuple of their values for
+            the dimensions in ``names``.
+        names : `tuple` [ `str` ]
+            Names of the dimension columns to extract from each row in order
+            to identify its data ID.
+        timespan : `Timespan`, optional
+            Timespan used in the search, for diagnostic messages only.
+
+        Returns
+        -------
+        refs : `dict` [ `DataCoordinate`, `DatasetRef` ]
+            Resolved references to the first dataset found for each data ID.
+        """
+        collectionFkName = self._collections.getCollectionForeignKeyName()
+        ranks: Dict[Any, int] = {}
+        for rank, collection in enumerate(collections):
+            ranks.setdefault(collection.key, rank)
+        best: Dict[Tuple[Any, ...], Tuple[int, List[Any]]] = {}
+        for row in rows:
+            values = tuple(row[name] for name in names)
+            rank = ranks[row[collectionFkName]]
+            previous = best.get(values)
+            if previous is None or rank < previous[0]:
+                best[values] = (rank, [row])
+            elif rank == previous[0]:
+                # Only possible for CALIBRATION collections; see `find`.
+                previous[1].append(row)
+        result = {}
+        for values, (rank, candidates) in best.items():
+            dataId = dataIdsByValues[values]
+            if len(candidates) > 1:
+                raise RuntimeError(
+                    f"Multiple matches found for calibration lookup in {collections[rank].name} for "
+                    f"{self.datasetType.name} with {dataId} overlapping {timespan}. "
+                )
+            row, = candidates
+            result[dataId] = DatasetRef(
+                datasetType=self.datasetType,
+                dataId=dataId,
+                id=row["id"],
+                run=self._collections[row[self._runKeyColumn]].name
+            )
+        return result
+
     def delete(self, datasets: Iterable[DatasetRef]) -> None:
         # Docstring inherited from DatasetRecordStorage.
         # Only delete from common dataset table; ON DELETE foreign key clauses
         # will handle the rest.
+        self.clearCalibrationCaches()
         self._db.delete(
             self._static.dataset,
             ["id"],
@@ -189,9 +632,10 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         self._db.delete(self._tags, ["dataset_id", self._collections.getCollectionForeignKeyName()],
                         *rows)
 
+    @contextmanager
     def _buildCalibOverlapQuery(self, collection: CollectionRecord,
                                 dataIds: Optional[DataCoordinateSet],
-                                timespan: Timespan) -> SimpleQuery:
+                                timespan: Timespan) -> Iterator[SimpleQuery]:
         assert self._calibs is not None
         # Start by building a SELECT query for any rows that would overlap
         # this one.
@@ -202,18 +646,23 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         query.where.append(
             self._calibs.columns[self._collections.getCollectionForeignKeyName()] == collection.key
         )
-        # Add a WHERE clause matching any of the given data IDs.
-        if dataIds is not None:
-            dataIds.constrain(
-                query,
-                lambda name: self._calibs.columns[name],  # type: ignore
-            )
         # Add WHERE clause for timespan overlaps.
         TimespanReprClass = self._db.getTimespanRepresentation()
         query.where.append(
             TimespanReprClass.fromSelectable(self._calibs).overlaps(TimespanReprClass.fromLiteral(timespan))
         )
-        return query
+        with ExitStack() as stack:
+            # Constrain to any of the given data IDs; for many data IDs this
+            # joins in a temporary table that must outlive the query.
+            if dataIds is not None:
+                stack.enter_context(
+                    dataIds.constrainInSession(
+                        query,
+                        lambda name: self._calibs.columns[name],  # type: ignore
+                        self._db,
+                    )
+                )
+            yield query
 
     def certify(self, collection: CollectionRecord, datasets: Iterable[DatasetRef],
                 timespan: Timespan) -> None:
@@ -224,6 +673,8 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         if collection.type is not CollectionType.CALIBRATION:
             raise TypeError(f"Cannot certify into collection '{collection.name}' "
                             f"of type {collection.type.name}; must be CALIBRATION.")
+        if self._calibIndexes is not None:
+            self._calibIndexes.pop(collection.key, None)
         TimespanReprClass = self._db.getTimespanRepresentation()
         protoRow = {
             self._collections.getCollectionForeignKeyName(): collection.key,
@@ -260,22 +711,20 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
                 ) from err
         else:
             # Have to implement exclusion constraint ourselves.
-            # Start by building a SELECT query for any rows that would overlap
-            # this one.
-            query = self._buildCalibOverlapQuery(
-                collection,
-                DataCoordinateSet(dataIds, graph=self.datasetType.dimensions),  # type: ignore
-                timespan
-            )
-            query.columns.append(sqlalchemy.sql.func.count())
-            sql = query.combine()
             # Acquire a table lock to ensure there are no concurrent writes
             # could invalidate our checking before we finish the inserts.  We
             # use a SAVEPOINT in case there is an outer transaction that a
             # failure here should not roll back.
             with self._db.transaction(lock=[self._calibs], savepoint=True):
-                # Run the check SELECT query.
-                conflicting = self._db.query(sql).scalar()
+                # Build and run a SELECT query for any rows that would overlap
+                # this one.
+                with self._buildCalibOverlapQuery(
+                    collection,
+                    DataCoordinateSet(dataIds, graph=self.datasetType.dimensions),  # type: ignore
+                    timespan
+                ) as query:
+                    query.columns.append(sqlalchemy.sql.func.count())
+                    conflicting = self._db.query(query.combine()).scalar()
                 if conflicting > 0:
                     raise ConflictingDefinitionError(
                         f"{conflicting} validity range conflicts certifying datasets of type "
@@ -294,6 +743,8 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         if collection.type is not CollectionType.CALIBRATION:
             raise TypeError(f"Cannot decertify from collection '{collection.name}' "
                             f"of type {collection.type.name}; must be CALIBRATION.")
+        if self._calibIndexes is not None:
+            self._calibIndexes.pop(collection.key, None)
         TimespanReprClass = self._db.getTimespanRepresentation()
         # Construct a SELECT query to find all rows that overlap our inputs.
         dataIdSet: Optional[DataCoordinateSet]
@@ -301,9 +752,6 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
             dataIdSet = DataCoordinateSet(set(dataIds), graph=self.datasetType.dimensions)
         else:
             dataIdSet = None
-        query = self._buildCalibOverlapQuery(collection, dataIdSet, timespan)
-        query.columns.extend(self._calibs.columns)
-        sql = query.combine()
         # Set up collections to populate with the rows we'll want to modify.
         # The insert rows will have the same values for collection and
         # dataset type.
@@ -315,8 +763,10 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         rowsToInsert = []
         # Acquire a table lock to ensure there are no concurrent writes
         # between the SELECT and the DELETE and INSERT queries based on it.
-        with self._db.transaction(lock=[self._calibs], savepoint=True):
-            for row in self._db.query(sql):
+        with self._db.transaction(lock=[self._calibs], savepoint=True), \
+                self._buildCalibOverlapQuery(collection, dataIdSet, timespan) as query:
+            query.columns.extend(self._calibs.columns)
+            for row in self._db.query(query.combine()):
                 rowsToDelete.append({"id": row["id"]})
                 # Construct the insert row(s) by copying the prototype row,
                 # then adding the dimension column values, then adding what's
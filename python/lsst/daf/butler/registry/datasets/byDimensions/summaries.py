@@ -30,6 +30,7 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Optional,
     TypeVar,
 )
 
@@ -150,6 +151,8 @@ class CollectionSummaryManager:
         self._dimensions = dimensions
         self._tables = tables
         self._cache: Dict[Any, CollectionSummary] = {}
+        self._lazy = False
+        self._get_dataset_type: Optional[Callable[[int], DatasetType]] = None
 
     @classmethod
     def initialize(
@@ -256,7 +259,7 @@ class CollectionSummaryManager:
         summary.datasetTypes.add(datasetType)
         summary.dimensions.update(governors)
 
-    def refresh(self, get_dataset_type: Callable[[int], DatasetType]) -> None:
+    def refresh(self, get_dataset_type: Callable[[int], DatasetType], *, lazy: bool = False) -> None:
         """Load all collection summary information from the database.
 
         Parameters
@@ -264,7 +267,30 @@ class CollectionSummaryManager:
         get_dataset_type : `Callable`
             Function that takes an `int` dataset_type_id value and returns a
             `DatasetType` instance.
+        lazy : `bool`, optional
+            If `True`, discard cached summaries instead, and load the summary
+            of each collection from the database when it is first needed.
         """
+        self._get_dataset_type = get_dataset_type
+        self._lazy = lazy
+        self._cache = {} if lazy else self._fetch()
+
+    def _fetch(self, collectionKey: Any = None) -> Dict[Any, CollectionSummary]:
+        """Fetch collection summary information from the database.
+
+        Parameters
+        ----------
+        collectionKey
+            Primary key of the collection to fetch the summary of.  If `None`
+            (default), summaries of all collections are fetched.
+
+        Returns
+        -------
+        summaries : `dict`
+            Collection summaries, keyed by collection primary key.
+            Collections without any datasets are not included.
+        """
+        assert self._get_dataset_type is not None, "refresh must be called first."
         # Set up the SQL query we'll use to fetch all of the summary
         # information at once.
         columns = [
@@ -283,6 +309,8 @@ class CollectionSummaryManager:
                 isouter=True,
             )
         sql = sqlalchemy.sql.select(columns).select_from(fromClause)
+        if collectionKey is not None:
+            sql = sql.where(self._tables.datasetType.columns[self._collectionKeyName] == collectionKey)
         # Run the query and construct CollectionSummary objects from the result
         # rows.  This will never include CHAINED collections or collections
         # with no datasets.
@@ -293,7 +321,7 @@ class CollectionSummaryManager:
             collectionKey = row[self._collectionKeyName]
             # dataset_type_id should also nver be None/NULL; it's in the first
             # table we joined.
-            datasetType = get_dataset_type(row["dataset_type_id"])
+            datasetType = self._get_dataset_type(row["dataset_type_id"])
             # See if we have a summary already for this collection; if not,
             # make one.
             summary = summaries.get(collectionKey)
@@ -312,7 +340,7 @@ class CollectionSummaryManager:
                 value = row[dimension.name]
                 if value is not None:
                     summary.dimensions.add(dimension, value)
-        self._cache = summaries
+        return summaries
 
     def get(self, collection: CollectionRecord) -> CollectionSummary:
         """Return a summary for the given collection.
@@ -346,6 +374,13 @@ class CollectionSummaryManager:
                     summary = CollectionSummary.union(*child_summaries)
                 else:
                     summary = CollectionSummary.makeEmpty(self._dimensions.universe)
+            elif self._lazy:
+                # Summaries are loaded on demand; an empty one is cached if
+                # the collection has no datasets.
+                summary = self._fetch(collection.key).get(collection.key)
+                if summary is None:
+                    summary = CollectionSummary.makeEmpty(self._dimensions.universe)
+                self._cache[collection.key] = summary
             else:
                 # Either this collection doesn't have any datasets yet, or the
                 # only datasets it has were created by some other process since
@@ -22,6 +22,8 @@ from __future__ import annotations
 
 __all__ = ["CachingDimensionRecordStorage"]
 
+from collections import OrderedDict
+import time
 from typing import Any, Dict, Iterable, Mapping, Optional, Set
 
 import sqlalchemy
@@ -44,6 +46,7 @@ from ...core import (
 from ..interfaces import (
     Database,
     DatabaseDimensionRecordStorage,
+    DimensionRecordCacheStatistics,
     GovernorDimensionRecordStorage,
     StaticTablesContext,
 )
@@ -59,10 +62,32 @@ class CachingDimensionRecordStorage(DatabaseDimensionRecordStorage):
     nested : `DatabaseDimensionRecordStorage`
         The other storage to cache fetches from and to delegate all other
         operations to.
+    maxSize : `int`, optional
+        Maximum number of data IDs (including those for which no record
+        exists) to hold in the cache; the least-recently used entries are
+        evicted first.  `None` (default) for no limit.
+    negativeTTL : `float`, optional
+        Number of seconds for which the absence of a record is cached.  `None`
+        (default) caches negative results until `clearCaches` is called.
+
+    Notes
+    -----
+    The ``max_size`` and ``negative_ttl`` keys of the element's storage
+    configuration are passed as ``maxSize`` and ``negativeTTL`` by
+    `initialize`.
     """
-    def __init__(self, nested: DatabaseDimensionRecordStorage):
+    def __init__(self, nested: DatabaseDimensionRecordStorage, *, maxSize: Optional[int] = None,
+                 negativeTTL: Optional[float] = None):
+        if maxSize is not None and maxSize < 1:
+            raise ValueError(f"Invalid maximum cache size {maxSize} for {nested.element.name}.")
         self._nested = nested
-        self._cache: Dict[DataCoordinate, Optional[DimensionRecord]] = {}
+        self._cache: OrderedDict[DataCoordinate, Optional[DimensionRecord]] = OrderedDict()
+        # Monotonic-clock expiration times for negative cache entries; only
+        # populated if negativeTTL is not None.
+        self._negativeExpirations: Dict[DataCoordinate, float] = {}
+        self._maxSize = maxSize
+        self._negativeTTL = negativeTTL
+        self._statistics = DimensionRecordCacheStatistics(maxSize=maxSize)
 
     @classmethod
     def initialize(
@@ -74,10 +99,12 @@ class CachingDimensionRecordStorage(DatabaseDimensionRecordStorage):
         governors: NamedKeyMapping[GovernorDimension, GovernorDimensionRecordStorage],
     ) -> DatabaseDimensionRecordStorage:
         # Docstring inherited from DatabaseDimensionRecordStorage.
+        maxSize = config.get("max_size")
+        negativeTTL = config.get("negative_ttl")
         config = config["nested"]
         NestedClass = doImport(config["cls"])
         nested = NestedClass.initialize(db, element, context=context, config=config, governors=governors)
-        return cls(nested)
+        return cls(nested, maxSize=maxSize, negativeTTL=negativeTTL)
 
     @property
     def element(self) -> DatabaseDimensionElement:
@@ -87,8 +114,72 @@ class CachingDimensionRecordStorage(DatabaseDimensionRecordStorage):
     def clearCaches(self) -> None:
         # Docstring inherited from DimensionRecordStorage.clearCaches.
         self._cache.clear()
+        self._negativeExpirations.clear()
         self._nested.clearCaches()
 
+    def getCacheStatistics(self) -> Optional[DimensionRecordCacheStatistics]:
+        # Docstring inherited from DimensionRecordStorage.getCacheStatistics.
+        return DimensionRecordCacheStatistics(
+            hits=self._statistics.hits,
+            misses=self._statistics.misses,
+            evictions=self._statistics.evictions,
+            size=len(self._cache),
+            maxSize=self._maxSize,
+        )
+
+    def _lookup(self, dataId: DataCoordinate) -> Any:
+        """Look up a data ID in the cache, updating statistics and recency.
+
+        Parameters
+        ----------
+        dataId : `DataCoordinate`
+            Data ID to look up.
+
+        Returns
+        -------
+        record : `DimensionRecord`, `None`, or ``...``
+            The cached record, `None` if the record is known not to exist, or
+            ``...`` if the data ID is not in the cache (or its negative
+            result has expired).
+        """
+        # Use ... as sentinal value so we can also cache None == "no such
+        # record exists".
+        record = self._cache.get(dataId, ...)
+        if record is None and self._negativeTTL is not None:
+            if self._negativeExpirations[dataId] <= time.monotonic():
+                del self._cache[dataId]
+                del self._negativeExpirations[dataId]
+                record = ...
+        if record is ...:
+            self._statistics.misses += 1
+        else:
+            self._statistics.hits += 1
+            self._cache.move_to_end(dataId)
+        return record
+
+    def _store(self, dataId: DataCoordinate, record: Optional[DimensionRecord]) -> None:
+        """Add a record (or the absence of one) to the cache, evicting the
+        least-recently used entries if necessary.
+
+        Parameters
+        ----------
+        dataId : `DataCoordinate`
+            Data ID of the record.
+        record : `DimensionRecord` or `None`
+            The record, or `None` to record that no such record exists.
+        """
+        self._cache[dataId] = record
+        self._cache.move_to_end(dataId)
+        if record is None and self._negativeTTL is not None:
+            self._negativeExpirations[dataId] = time.monotonic() + self._negativeTTL
+        else:
+            self._negativeExpirations.pop(dataId, None)
+        if self._maxSize is not None:
+            while len(self._cache) > self._maxSize:
+                evicted, _ = self._cache.popitem(last=False)
+                self._negativeExpirations.pop(evicted, None)
+                self._statistics.evictions += 1
+
     def join(
         self,
         builder: QueryBuilder, *,
@@ -102,36 +193,34 @@ class CachingDimensionRecordStorage(DatabaseDimensionRecordStorage):
         # Docstring inherited from DimensionRecordStorage.insert.
         self._nested.insert(*records)
         for record in records:
-            self._cache[record.dataId] = record
+            self._store(record.dataId, record)
 
     def sync(self, record: DimensionRecord) -> bool:
         # Docstring inherited from DimensionRecordStorage.sync.
         inserted = self._nested.sync(record)
         if inserted:
-            self._cache[record.dataId] = record
+            self._store(record.dataId, record)
         return inserted
 
     def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
         # Docstring inherited from DimensionRecordStorage.fetch.
         missing: Set[DataCoordinate] = set()
         for dataId in dataIds:
-            # Use ... as sentinal value so we can also cache None == "no such
-            # record exists".
-            record = self._cache.get(dataId, ...)
+            record = self._lookup(dataId)
             if record is ...:
                 missing.add(dataId)
             elif record is not None:
-                # Unclear why MyPy can't tell that this isn't ..., but it
-                # thinks it's still a possibility.
-                yield record  # type: ignore
+                yield record
         if missing:
-            toFetch = DataCoordinateSet(missing, graph=self.element.graph)
+            # The nested fetch may iterate over the set lazily, so give it a
+            # copy of the one we modify below.
+            toFetch = DataCoordinateSet(set(missing), graph=self.element.graph)
             for record in self._nested.fetch(toFetch):
-                self._cache[record.dataId] = record
+                self._store(record.dataId, record)
+                missing.discard(record.dataId)
                 yield record
-            missing -= self._cache.keys()
             for dataId in missing:
-                self._cache[dataId] = None
+                self._store(dataId, None)
 
     def digestTables(self) -> Iterable[sqlalchemy.schema.Table]:
         # Docstring inherited from DimensionRecordStorage.digestTables.
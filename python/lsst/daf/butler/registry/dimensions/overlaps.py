@@ -25,10 +25,18 @@ __all__ = (
     "CrossFamilyDimensionOverlapStorage",
 )
 
+from collections import defaultdict
+import itertools
 import logging
 from typing import (
+    AbstractSet,
+    Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
+    Sequence,
+    Set,
     Tuple,
 )
 
@@ -37,7 +45,10 @@ import sqlalchemy
 from ...core import (
     addDimensionForeignKey,
     DatabaseDimensionElement,
+    DataCoordinate,
+    DataCoordinateIterable,
     ddl,
+    DimensionRecord,
 )
 from ..interfaces import (
     Database,
@@ -75,8 +86,14 @@ class CrossFamilyDimensionOverlapStorage(DatabaseDimensionOverlapStorage):
 
     Notes
     -----
-    At present, this class (like its ABC) is just a stub that creates the
-    tables it will use, but does nothing else.
+    Overlaps are materialized for every combination of the two elements'
+    governor dimension values as soon as both values exist (so, for example,
+    a new skymap immediately has its overlaps with all existing instruments'
+    visits materialized), and maintained as new records for either element
+    are inserted.  Candidate pairs are found via each element's materialized
+    overlaps with `DimensionUniverse.commonSkyPix`, and then tested exactly
+    using their regions, so the overlap table contains only pairs whose
+    regions actually overlap.
     """
     def __init__(
         self,
@@ -91,6 +108,9 @@ class CrossFamilyDimensionOverlapStorage(DatabaseDimensionOverlapStorage):
         self._governorStorage = governorStorage
         self._summaryTable = summaryTable
         self._overlapTable = overlapTable
+        # In-memory copy of the summary table; loaded on first use, and
+        # discarded by `refresh`.
+        self._summary: Optional[Set[Tuple[str, str]]] = None
 
     @classmethod
     def initialize(
@@ -114,7 +134,7 @@ class CrossFamilyDimensionOverlapStorage(DatabaseDimensionOverlapStorage):
             cls._OVERLAP_TABLE_NAME_SPEC.format(*elements),
             cls._makeOverlapTableSpec(elements),
         )
-        return CrossFamilyDimensionOverlapStorage(
+        result = CrossFamilyDimensionOverlapStorage(
             db,
             elementStorage,
             governorStorage,
@@ -122,6 +142,23 @@ class CrossFamilyDimensionOverlapStorage(DatabaseDimensionOverlapStorage):
             overlapTable=overlapTable,
         )
 
+        # Whenever anyone inserts a new governor dimension value, we want to
+        # enable overlaps between that value and all existing values of the
+        # other governor dimension.
+        def callback0(record: DimensionRecord) -> None:
+            value = getattr(record, governorStorage[0].element.primaryKey.name)
+            for other in governorStorage[1].values:
+                result.enable((value, other))
+
+        def callback1(record: DimensionRecord) -> None:
+            value = getattr(record, governorStorage[1].element.primaryKey.name)
+            for other in governorStorage[0].values:
+                result.enable((other, value))
+
+        governorStorage[0].registerInsertionListener(callback0)
+        governorStorage[1].registerInsertionListener(callback1)
+        return result
+
     @property
     def elements(self) -> Tuple[DatabaseDimensionElement, DatabaseDimensionElement]:
         # Docstring inherited from DatabaseDimensionOverlapStorage.
@@ -131,6 +168,214 @@ class CrossFamilyDimensionOverlapStorage(DatabaseDimensionOverlapStorage):
         # Docstring inherited from DatabaseDimensionOverlapStorage.
         return [self._summaryTable, self._overlapTable]
 
+    def _governorColumns(self, table: sqlalchemy.schema.Table
+                         ) -> Tuple[sqlalchemy.sql.ColumnElement, sqlalchemy.sql.ColumnElement]:
+        """Return the columns for the two governor dimensions in one of this
+        object's tables.
+        """
+        return (table.columns[self._governorStorage[0].element.name],
+                table.columns[self._governorStorage[1].element.name])
+
+    def _refreshSummary(self) -> Set[Tuple[str, str]]:
+        """Reload the in-memory copy of the summary table from the database.
+
+        Returns
+        -------
+        summary : `set` [ `tuple` [ `str`, `str` ] ]
+            Combinations of governor values whose overlaps are materialized.
+        """
+        gvCol0, gvCol1 = self._governorColumns(self._summaryTable)
+        query = sqlalchemy.sql.select([gvCol0, gvCol1]).select_from(self._summaryTable)
+        self._summary = {(row[gvCol0], row[gvCol1]) for row in self._db.query(query)}
+        return self._summary
+
+    def enable(self, governorValues: Tuple[str, str]) -> None:
+        """Enable materialization of overlaps between the records of the
+        two elements with a particular pair of governor values.
+
+        Parameters
+        ----------
+        governorValues : `tuple` [ `str`, `str` ]
+            Values of the two elements' governor dimensions, in the same
+            order as `elements`.  For example, if `elements` is
+            ``(patch, visit)``, this is a ``(skymap, instrument)`` tuple.
+
+        Notes
+        -----
+        If there are existing records for the given governor values, overlap
+        rows for them will be immediately computed and inserted.  After
+        calling `enable` for a particular combination, any new records for
+        either element that are inserted will automatically be accompanied by
+        overlap records (via calls to `insert` made by the element's record
+        storage).
+        """
+        # Lock the summary and overlap tables so the set of combinations to
+        # materialize can't change while we fill in the new one.
+        with self._db.transaction(lock=[self._summaryTable, self._overlapTable]):
+            _, inserted = self._db.sync(
+                self._summaryTable,
+                keys={
+                    self._governorStorage[0].element.name: governorValues[0],
+                    self._governorStorage[1].element.name: governorValues[1],
+                },
+            )
+            if inserted:
+                _LOG.debug("Precomputing initial overlaps for %s vs %s for %s.",
+                           self.elements[0].name, self.elements[1].name, governorValues)
+                self._fill(governorValues)
+        if inserted and self._summary is not None:
+            self._summary.add(governorValues)
+
+    def _fill(self, governorValues: Tuple[str, str]) -> None:
+        """Insert overlap records for a newly-enabled combination of governor
+        values.
+
+        This method should only be called by `enable`.
+
+        Parameters
+        ----------
+        governorValues : `tuple` [ `str`, `str` ]
+            Values of the two elements' governor dimensions, in the same
+            order as `elements`.
+        """
+        # As in `_SkyPixOverlapStorage._fill`, we rely on `fetch` accepting a
+        # data ID for just the governor dimension.
+        governor = self._governorStorage[0].element
+        governorDataId = DataCoordinate.standardize({governor.name: governorValues[0]},
+                                                    graph=governor.graph)
+        records = iter(self._elementStorage[0].fetch(DataCoordinateIterable.fromScalar(governorDataId)))
+        count = 0
+        while True:
+            chunk = list(itertools.islice(records, self._FILL_CHUNK))
+            if not chunk:
+                break
+            # Insert each chunk's overlaps as soon as they are computed, so
+            # only one chunk's rows are held in memory at a time.
+            overlapRecords = list(self._compute(0, chunk, {governorValues[1]}))
+            self._db.insert(self._overlapTable, *overlapRecords)
+            count += len(overlapRecords)
+        _LOG.debug("Inserted %d initial overlap rows for %s vs %s for %s.",
+                   count, self.elements[0].name, self.elements[1].name, governorValues)
+
+    _FILL_CHUNK = 100
+    """Number of records whose overlaps are computed together when filling in
+    overlaps for existing records (`int`).
+
+    Candidates are looked up for all regions in a chunk at once, so this
+    trades the number of queries against the number of candidates that must
+    be tested.
+    """
+
+    def insert(self, records: Sequence[DimensionRecord]) -> None:
+        # Docstring inherited from DatabaseDimensionOverlapStorage.
+        if not records:
+            return
+        index = self.elements.index(records[0].definition)
+        governor = self._governorStorage[index].element
+        # Group records by governor value.
+        grouped: Dict[str, List[DimensionRecord]] = defaultdict(list)
+        for record in records:
+            grouped[getattr(record, governor.name)].append(record)
+        _LOG.debug("Precomputing new overlaps for %s vs %s where %s in %s.",
+                   self.elements[index].name, self.elements[1 - index].name, governor.name, grouped.keys())
+        # Make sure the set of combinations to materialize does not change
+        # while we are materializing the ones we have, by locking the summary
+        # table.
+        with self._db.transaction(lock=[self._summaryTable]):
+            gvCols = self._governorColumns(self._summaryTable)
+            query = sqlalchemy.sql.select(
+                list(gvCols)
+            ).select_from(
+                self._summaryTable
+            ).where(
+                gvCols[index].in_(list(grouped.keys()))
+            )
+            others: Dict[str, Set[str]] = defaultdict(set)
+            for row in self._db.query(query):
+                others[row[gvCols[index]]].add(row[gvCols[1 - index]])
+            overlapRecords: List[dict] = []
+            for gv, group in grouped.items():
+                overlapRecords.extend(self._compute(index, group, others[gv]))
+            _LOG.debug("Inserting %d new overlap rows for %s vs %s where %s in %s.",
+                       len(overlapRecords), self.elements[index].name, self.elements[1 - index].name,
+                       governor.name, grouped.keys())
+            self._db.insert(self._overlapTable, *overlapRecords)
+
+    def _compute(self, index: int, records: Sequence[DimensionRecord],
+                 otherGovernorValues: AbstractSet[str]) -> Iterator[dict]:
+        """Compute overlap rows between records of one element and all
+        existing records of the other element.
+
+        This method should only be called by `insert` and `_fill`.
+
+        Parameters
+        ----------
+        index : `int`
+            Index of the element ``records`` belong to in `elements`.
+        records : `Sequence` [ `DimensionRecord` ]
+            Records to compute overlaps for.  Records with `None` regions are
+            ignored.
+        otherGovernorValues : `AbstractSet` [ `str` ]
+            Values of the other element's governor dimension to compute
+            overlaps with.
+
+        Yields
+        ------
+        row : `dict`
+            Dictionary representing an overlap row.
+        """
+        records = [record for record in records if record.region is not None]
+        if not records or not otherGovernorValues:
+            return
+        candidates = [
+            (candidate, candidate.region.getBoundingBox())
+            for candidate in self._elementStorage[1 - index].fetchOverlapCandidates(
+                [record.region for record in records],
+                otherGovernorValues,
+            )
+            if candidate.region is not None
+        ]
+        for record in records:
+            box = record.region.getBoundingBox()
+            baseOverlapRecord = record.dataId.byName()
+            for candidate, candidateBox in candidates:
+                # Disjoint bounding boxes imply disjoint regions, and are much
+                # cheaper to test.
+                if box.isDisjointFrom(candidateBox) or record.region.isDisjointFrom(candidate.region):
+                    continue
+                yield dict(baseOverlapRecord, **candidate.dataId.byName())
+
+    def refresh(self) -> None:
+        # Docstring inherited from DatabaseDimensionOverlapStorage.
+        self._summary = None
+
+    def materialize(self) -> int:
+        # Docstring inherited from DatabaseDimensionOverlapStorage.
+        summary = self._refreshSummary()
+        count = 0
+        for governorValues in itertools.product(self._governorStorage[0].values,
+                                                self._governorStorage[1].values):
+            if governorValues not in summary:
+                self.enable(governorValues)
+                count += 1
+        return count
+
+    def select(self) -> Optional[sqlalchemy.sql.FromClause]:
+        # Docstring inherited from DatabaseDimensionOverlapStorage.
+        required = set(itertools.product(self._governorStorage[0].values,
+                                         self._governorStorage[1].values))
+        summary = self._summary
+        if summary is None:
+            summary = self._refreshSummary()
+        # If overlaps are not (yet) materialized for all combinations, e.g.
+        # because the repository was populated by an older client and has not
+        # been backfilled, queries compute them instead.  A backfill by
+        # another client is not seen until `refresh`, so that queries on such
+        # repositories do not reload the summary every time.
+        if not required.issubset(summary):
+            return None
+        return self._overlapTable
+
     _SUMMARY_TABLE_NAME_SPEC = "{0.name}_{1.name}_overlap_summary"
 
     @classmethod
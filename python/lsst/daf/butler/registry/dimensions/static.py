@@ -127,7 +127,7 @@ class StaticDimensionRecordStorageManager(DimensionRecordStorageManager):
                 governorStoragePair = (governors[family1.governor], governors[family2.governor])
                 if elementStoragePair[0].element > elementStoragePair[1].element:
                     elementStoragePair = (elementStoragePair[1], elementStoragePair[0])
-                    governorStoragePair = (governorStoragePair[1], governorStoragePair[1])
+                    governorStoragePair = (governorStoragePair[1], governorStoragePair[0])
                 overlapStorage = CrossFamilyDimensionOverlapStorage.initialize(
                     db,
                     elementStoragePair,
@@ -148,6 +148,8 @@ class StaticDimensionRecordStorageManager(DimensionRecordStorageManager):
             storage = self._records[dimension]
             assert isinstance(storage, GovernorDimensionRecordStorage)
             storage.refresh()
+        for overlapStorage in self._overlaps.values():
+            overlapStorage.refresh()
 
     def get(self, element: DimensionElement) -> Optional[DimensionRecordStorage]:
         # Docstring inherited from DimensionRecordStorageManager.
@@ -162,6 +164,17 @@ class StaticDimensionRecordStorageManager(DimensionRecordStorageManager):
         assert result, "All records instances should be created in initialize()."
         return result
 
+    def getOverlapStorage(self, element1: DatabaseDimensionElement, element2: DatabaseDimensionElement
+                          ) -> Optional[DatabaseDimensionOverlapStorage]:
+        # Docstring inherited from DimensionRecordStorageManager.
+        if element1 > element2:
+            element1, element2 = element2, element1
+        return self._overlaps.get((element1, element2))
+
+    def materializeOverlaps(self) -> int:
+        # Docstring inherited from DimensionRecordStorageManager.
+        return sum(overlapStorage.materialize() for overlapStorage in self._overlaps.values())
+
     def saveDimensionGraph(self, graph: DimensionGraph) -> int:
         # Docstring inherited from DimensionRecordStorageManager.
         return self._dimensionGraphStorage.save(graph)
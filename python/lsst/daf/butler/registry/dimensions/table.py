@@ -40,6 +40,8 @@ from typing import (
 
 import sqlalchemy
 
+from lsst.sphgeom import Region
+
 from ...core import (
     addDimensionForeignKey,
     DatabaseDimensionElement,
@@ -192,24 +194,56 @@ class TableDimensionRecordStorage(DatabaseDimensionRecordStorage):
         builder.finishJoin(self._table, joinOn)
         return self._table
 
-    def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
-        # Docstring inherited from DimensionRecordStorage.fetch.
-        RecordClass = self.element.RecordClass
+    def _makeRecordQuery(self) -> SimpleQuery:
+        """Return a query for all of the columns needed to construct records
+        from this element's table.
+
+        Returns
+        -------
+        query : `SimpleQuery`
+            Query with columns and the element's table (but no constraints)
+            already included.  Should be passed to `_fetchRecords` after
+            constraints are added.
+        """
         query = SimpleQuery()
-        query.columns.extend(self._table.columns[name] for name in RecordClass.fields.standard.names)
+        query.columns.extend(self._table.columns[name]
+                             for name in self.element.RecordClass.fields.standard.names)
         if self.element.spatial is not None:
             query.columns.append(self._table.columns["region"])
         if self.element.temporal is not None:
             TimespanReprClass = self._db.getTimespanRepresentation()
             query.columns.extend(self._table.columns[name] for name in TimespanReprClass.getFieldNames())
         query.join(self._table)
-        dataIds.constrain(query, lambda name: self._fetchColumns[name])
+        return query
+
+    def _fetchRecords(self, query: SimpleQuery) -> Iterator[DimensionRecord]:
+        """Execute a query created by `_makeRecordQuery` and construct records
+        from its results.
+
+        Parameters
+        ----------
+        query : `SimpleQuery`
+            Query to execute.
+
+        Yields
+        ------
+        record : `DimensionRecord`
+            Record for this element.
+        """
+        RecordClass = self.element.RecordClass
+        TimespanReprClass = self._db.getTimespanRepresentation()
         for row in self._db.query(query.combine()):
             values = dict(row)
             if self.element.temporal is not None:
                 values[TimespanDatabaseRepresentation.NAME] = TimespanReprClass.extract(values)
             yield RecordClass(**values)
 
+    def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
+        # Docstring inherited from DimensionRecordStorage.fetch.
+        query = self._makeRecordQuery()
+        with dataIds.constrainInSession(query, lambda name: self._fetchColumns[name], self._db):
+            return list(self._fetchRecords(query))
+
     def insert(self, *records: DimensionRecord) -> None:
         # Docstring inherited from DimensionRecordStorage.insert.
         elementRows = [record.toDict() for record in records]
@@ -222,6 +256,8 @@ class TableDimensionRecordStorage(DatabaseDimensionRecordStorage):
             self._db.insert(self._table, *elementRows)
             if self._skyPixOverlap is not None:
                 self._skyPixOverlap.insert(records)
+            for overlaps in self._otherOverlaps:
+                overlaps.insert(records)
 
     def sync(self, record: DimensionRecord) -> bool:
         # Docstring inherited from DimensionRecordStorage.sync.
@@ -241,6 +277,9 @@ class TableDimensionRecordStorage(DatabaseDimensionRecordStorage):
             )
             if inserted and self._skyPixOverlap is not None:
                 self._skyPixOverlap.insert([record])
+            if inserted:
+                for overlaps in self._otherOverlaps:
+                    overlaps.insert([record])
         return inserted
 
     def digestTables(self) -> Iterable[sqlalchemy.schema.Table]:
@@ -254,6 +293,35 @@ class TableDimensionRecordStorage(DatabaseDimensionRecordStorage):
         # Docstring inherited from DatabaseDimensionRecordStorage.
         self._otherOverlaps.append(overlaps)
 
+    def fetchOverlapCandidates(self, regions: Iterable[Region],
+                               governorValues: AbstractSet[str]) -> Iterable[DimensionRecord]:
+        # Docstring inherited from DatabaseDimensionRecordStorage.
+        assert self._skyPixOverlap is not None
+        # Candidates are the records that share at least one commonSkyPix
+        # pixel with the given regions, according to the materialized skypix
+        # overlaps we always maintain.
+        skypix = self.element.universe.commonSkyPix
+        indices: Set[int] = set()
+        for region in regions:
+            for begin, end in skypix.pixelization.envelope(region):
+                indices.update(range(begin, end))
+        if not indices or not governorValues:
+            return ()
+        overlaps = self._skyPixOverlap.select(skypix, governorValues)
+        requiredNames = self.element.graph.required.names
+        keys = sqlalchemy.sql.select(
+            [overlaps.columns[name] for name in requiredNames]
+        ).where(
+            overlaps.columns[skypix.name].in_(sorted(indices))
+        ).distinct().alias(f"{self.element.name}_candidates")
+        query = self._makeRecordQuery()
+        query.join(
+            keys,
+            onclause=sqlalchemy.sql.and_(*[keys.columns[name] == self._fetchColumns[name]
+                                           for name in requiredNames]),
+        )
+        return self._fetchRecords(query)
+
 
 class _SkyPixOverlapStorage:
     """A helper object for `TableDimensionRecordStorage` that manages its
@@ -27,6 +27,7 @@ from typing import (
     Any,
     ContextManager,
     Iterable,
+    Optional,
     Type,
     TYPE_CHECKING,
     Union,
@@ -172,11 +173,17 @@ class DatastoreRegistryBridge(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def emptyTrash(self) -> ContextManager[Iterable[DatasetIdRef]]:
+    def emptyTrash(self, limit: Optional[int] = None) -> ContextManager[Iterable[DatasetIdRef]]:
         """Retrieve all the dataset ref IDs that are in the trash
         associated for this datastore, and then remove them if the context
         exists without an exception being raised.
 
+        Parameters
+        ----------
+        limit : `int`, optional
+            If provided, the maximum number of dataset ref IDs to retrieve;
+            the rest are left in the trash for a later call.
+
         Returns
         -------
         ids : `set` of `DatasetIdRef`
@@ -30,6 +30,7 @@ __all__ = [
 from abc import abstractmethod
 from typing import (
     Any,
+    Iterable,
     Iterator,
     Optional,
     TYPE_CHECKING,
@@ -389,13 +390,37 @@ class CollectionManager(VersionedExtension):
         raise NotImplementedError()
 
     @abstractmethod
-    def refresh(self) -> None:
+    def refresh(self, *, lazy: Optional[bool] = None) -> None:
         """Ensure all other operations on this manager are aware of any
         collections that may have been registered by other clients since it
         was initialized or last refreshed.
+
+        Parameters
+        ----------
+        lazy : `bool`, optional
+            If `True`, discard all cached records instead of reloading them,
+            and load each record from the database when it is first needed.
+            If `False`, load all records now.  If `None` (default), keep the
+            mode used by the previous call.
         """
         raise NotImplementedError()
 
+    def prefetch(self, names: Iterable[str]) -> None:
+        """Load the records of the given collections in bulk.
+
+        Parameters
+        ----------
+        names : `~collections.abc.Iterable` [ `str` ]
+            Names of the collections that are about to be used.  Names that
+            do not correspond to any collection are ignored.
+
+        Notes
+        -----
+        This is an optimization for managers that load records on demand
+        (see `refresh`); the default implementation does nothing.
+        """
+        pass
+
     @abstractmethod
     def register(self, name: str, type: CollectionType, doc: Optional[str] = None) -> CollectionRecord:
         """Ensure that a collection of the given name and type are present
@@ -37,6 +37,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
     Sequence,
     Set,
@@ -336,7 +337,7 @@ class Database(ABC):
 
     @classmethod
     def fromUri(cls, uri: str, *, origin: int, namespace: Optional[str] = None,
-                writeable: bool = True) -> Database:
+                writeable: bool = True, engineOptions: Optional[Mapping[str, Any]] = None) -> Database:
         """Construct a database from a SQLAlchemy URI.
 
         Parameters
@@ -354,13 +355,18 @@ class Database(ABC):
         writeable : `bool`, optional
             If `True`, allow write operations on the database, including
             ``CREATE TABLE``.
+        engineOptions : `Mapping` [ `str`, `Any` ], optional
+            Additional keyword arguments for `makeEngine`; which are supported
+            depends on the `Database` subclass.
 
         Returns
         -------
         db : `Database`
             A new `Database` instance.
         """
-        return cls.fromEngine(cls.makeEngine(uri, writeable=writeable),
+        if engineOptions is None:
+            engineOptions = {}
+        return cls.fromEngine(cls.makeEngine(uri, writeable=writeable, **engineOptions),
                               origin=origin,
                               namespace=namespace,
                               writeable=writeable)
@@ -439,10 +445,31 @@ class Database(ABC):
         else:
             # open new connection and close it when done
             self._session_connection = self._engine.connect()
-            yield Session(self)
-            self._session_connection.close()
-            self._session_connection = None
-            # Temporary tables only live within session
+            try:
+                yield Session(self)
+            finally:
+                self._dropSessionTemporaryTables()
+                self._session_connection.close()
+                self._session_connection = None
+
+    def _dropSessionTemporaryTables(self) -> None:
+        """Drop all temporary tables created in the current session.
+
+        Temporary tables only live within a session, but the session's
+        connection may be returned to a pool rather than closed, and the
+        tables would then be visible to the next user of the connection.
+        If they cannot be dropped, the connection is invalidated so the pool
+        discards it.
+        """
+        assert self._session_connection is not None
+        try:
+            for key in self._tempTables:
+                table = self._metadata.tables[key]
+                self._session_connection.execute(sqlalchemy.schema.DropTable(table))
+                self._metadata.remove(table)
+        except sqlalchemy.exc.SQLAlchemyError:
+            self._session_connection.invalidate()
+        finally:
             self._tempTables = set()
 
     @contextmanager
@@ -516,6 +543,14 @@ class Database(ABC):
                 if not connection.in_transaction():
                     connection.info.pop(_IN_SAVEPOINT_TRANSACTION, None)
 
+    def isInTransaction(self) -> bool:
+        """Return `True` if a transaction opened by `transaction` is active.
+
+        Anything read while this is `True` may include changes that are later
+        rolled back.
+        """
+        return self._session_connection is not None and self._session_connection.in_transaction()
+
     @property
     def _connection(self) -> sqlalchemy.engine.Connectable:
         """Object that can be used to execute queries
@@ -1499,6 +1534,63 @@ class Database(ABC):
         # TODO: should we guard against non-SELECT queries here?
         return self._connection.execute(sql, *args, **kwds)
 
+    def streamQuery(self, sql: sqlalchemy.sql.FromClause, *args: Any,
+                    batchSize: Optional[int] = None, **kwds: Any) -> Iterator[sqlalchemy.engine.RowProxy]:
+        """Run a SELECT query against the database, yielding result rows as
+        they are fetched instead of loading them all at once.
+
+        Parameters
+        ----------
+        sql : `sqlalchemy.sql.FromClause`
+            A SQLAlchemy representation of a ``SELECT`` query.
+        *args
+            Additional positional arguments are forwarded to
+            `sqlalchemy.engine.Connection.execute`.
+        batchSize : `int`, optional
+            Number of rows to fetch from the database at a time.  Defaults to
+            `streamBatchSize`.
+        **kwds
+            Additional keyword arguments are forwarded to
+            `sqlalchemy.engine.Connection.execute`.
+
+        Yields
+        ------
+        row : `sqlalchemy.engine.RowProxy`
+            Result row from the query.
+
+        Notes
+        -----
+        Where the database driver supports them (e.g. psycopg2), this uses a
+        server-side cursor, so the full result set is never held in client
+        memory.  Server-side cursors are invalidated when their transaction
+        commits, so they are only used when there is no active session (in
+        which case the query gets its own connection) or when the session is
+        already in a transaction; otherwise rows are still fetched in batches,
+        but the driver may buffer them all on the client.
+
+        The query is not executed until the first row is requested, and the
+        result is closed when the iterator is exhausted or closed.
+        """
+        if batchSize is None:
+            batchSize = self.streamBatchSize
+        connection = self._connection
+        if self._session_connection is None or self._session_connection.in_transaction():
+            connection = connection.execution_options(stream_results=True)
+        result = connection.execute(sql, *args, **kwds)
+        try:
+            while True:
+                rows = result.fetchmany(batchSize)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            result.close()
+
+    streamBatchSize: int = 1000
+    """Number of rows fetched from the database at a time by `streamQuery`
+    (`int`).
+    """
+
     origin: int
     """An integer ID that should be used as the default for any datasets,
     quanta, or other entities that use a (autoincrement, origin) compound
@@ -26,9 +26,11 @@ __all__ = ("DatasetRecordStorageManager", "DatasetRecordStorage")
 from abc import ABC, abstractmethod
 from typing import (
     Any,
+    Dict,
     Iterable,
     Iterator,
     Optional,
+    Sequence,
     Tuple,
     TYPE_CHECKING,
 )
@@ -109,6 +111,82 @@ class DatasetRecordStorage(ABC):
         """
         raise NotImplementedError()
 
+    def findFirst(self, collections: Sequence[CollectionRecord], dataId: DataCoordinate,
+                  timespan: Optional[Timespan] = None) -> Optional[DatasetRef]:
+        """Search an ordered sequence of collections for a dataset with the
+        given data ID, returning the first one found.
+
+        Parameters
+        ----------
+        collections : `Sequence` [ `CollectionRecord` ]
+            Records for the collections to search, in order.  Must not
+            include `~CollectionType.CHAINED` collections (these should be
+            flattened by the caller).
+        dataId: `DataCoordinate`
+            Complete (but not necessarily expanded) data ID to search with,
+            with ``dataId.graph == self.datasetType.dimensions``.
+        timespan : `Timespan`, optional
+            A timespan that the validity range of the dataset must overlap.
+            Required if any of ``collections`` is a
+            `~CollectionType.CALIBRATION` collection, and ignored otherwise.
+
+        Returns
+        -------
+        ref : `DatasetRef`
+            A resolved `DatasetRef` (without components populated), or `None`
+            if no matching dataset was found.
+
+        Notes
+        -----
+        The default implementation simply calls `find` on each collection in
+        turn; subclasses are encouraged to override this to search all
+        collections in a single query.
+        """
+        for collection in collections:
+            result = self.find(collection, dataId, timespan=timespan)
+            if result is not None:
+                return result
+        return None
+
+    def findFirstMany(self, collections: Sequence[CollectionRecord], dataIds: Iterable[DataCoordinate],
+                      timespan: Optional[Timespan] = None) -> Dict[DataCoordinate, DatasetRef]:
+        """Search an ordered sequence of collections for datasets with any of
+        the given data IDs, returning the first one found for each.
+
+        Parameters
+        ----------
+        collections : `Sequence` [ `CollectionRecord` ]
+            Records for the collections to search, in order.  Must not
+            include `~CollectionType.CHAINED` collections (these should be
+            flattened by the caller).
+        dataIds : `Iterable` [ `DataCoordinate` ]
+            Complete (but not necessarily expanded) data IDs to search with,
+            with ``dataId.graph == self.datasetType.dimensions``.
+        timespan : `Timespan`, optional
+            A timespan that the validity range of the datasets must overlap.
+            Required if any of ``collections`` is a
+            `~CollectionType.CALIBRATION` collection, and ignored otherwise.
+
+        Returns
+        -------
+        refs : `dict` [ `DataCoordinate`, `DatasetRef` ]
+            Resolved `DatasetRef` instances (without components populated),
+            keyed by data ID.  Data IDs for which no dataset was found are
+            not included.
+
+        Notes
+        -----
+        The default implementation simply calls `findFirst` on each data ID
+        in turn; subclasses are encouraged to override this to search for
+        all data IDs in a single query.
+        """
+        result = {}
+        for dataId in dataIds:
+            ref = self.findFirst(collections, dataId, timespan=timespan)
+            if ref is not None:
+                result[dataId] = ref
+        return result
+
     @abstractmethod
     def delete(self, datasets: Iterable[DatasetRef]) -> None:
         """Fully delete the given datasets from the registry.
@@ -370,13 +448,70 @@ class DatasetRecordStorageManager(VersionedExtension):
         raise NotImplementedError()
 
     @abstractmethod
-    def refresh(self) -> None:
+    def refresh(self, *, lazy: Optional[bool] = None) -> None:
         """Ensure all other operations on this manager are aware of any
         dataset types that may have been registered by other clients since
         it was initialized or last refreshed.
+
+        Parameters
+        ----------
+        lazy : `bool`, optional
+            If `True`, discard all cached dataset types instead of reloading
+            them, and load each dataset type from the database when it is
+            first needed.  If `False`, load all dataset types now.  If `None`
+            (default), keep the mode used by the previous call.
         """
         raise NotImplementedError()
 
+    def prefetch(self, names: Iterable[str]) -> None:
+        """Load the given dataset types in bulk.
+
+        Parameters
+        ----------
+        names : `~collections.abc.Iterable` [ `str` ]
+            Names of the dataset types that are about to be used.  Names that
+            do not correspond to any registered dataset type are ignored.
+
+        Notes
+        -----
+        This is an optimization for managers that load dataset types on
+        demand (see `refresh`); the default implementation does nothing.
+        """
+        pass
+
+    def setCalibrationCaching(self, enabled: bool) -> None:
+        """Enable or disable in-memory caching of the validity ranges of
+        datasets in `~CollectionType.CALIBRATION` collections.
+
+        Parameters
+        ----------
+        enabled : `bool`
+            Whether to cache validity ranges.  Anything already cached is
+            discarded either way.
+
+        Notes
+        -----
+        Caching makes repeated temporal lookups of calibration datasets (e.g.
+        via `Registry.findDataset`) much faster, at the cost of not seeing
+        changes made by other clients until `refresh` is called.  The default
+        implementation does nothing.
+        """
+        pass
+
+    def clearCalibrationCaches(self) -> None:
+        """Discard any cached validity ranges of datasets in
+        `~CollectionType.CALIBRATION` collections (see
+        `setCalibrationCaching`).
+
+        Notes
+        -----
+        This must be called after operations that can remove calibration
+        associations other than through `DatasetRecordStorage`, such as
+        removing a `~CollectionType.RUN` collection.  The default
+        implementation does nothing.
+        """
+        pass
+
     def __getitem__(self, name: str) -> DatasetRecordStorage:
         """Return the object that provides access to the records associated
         with the given `DatasetType` name.
@@ -23,6 +23,7 @@ from __future__ import annotations
 __all__ = (
     "DatabaseDimensionOverlapStorage",
     "DatabaseDimensionRecordStorage",
+    "DimensionRecordCacheStatistics",
     "DimensionRecordStorage",
     "DimensionRecordStorageManager",
     "GovernorDimensionRecordStorage",
@@ -30,11 +31,13 @@ __all__ = (
 )
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import (
     AbstractSet, Any,
     Callable,
     Iterable, Mapping,
     Optional,
+    Sequence,
     Tuple,
     TYPE_CHECKING,
     Union,
@@ -46,6 +49,7 @@ from ...core import DatabaseDimensionElement, DimensionGraph, GovernorDimension,
 from ._versioning import VersionedExtension
 
 if TYPE_CHECKING:
+    from lsst.sphgeom import Region
     from ...core import (
         DataCoordinateIterable,
         DimensionElement,
@@ -62,6 +66,36 @@ if TYPE_CHECKING:
 OverlapSide = Union[SkyPixDimension, Tuple[DatabaseDimensionElement, str]]
 
 
+@dataclass
+class DimensionRecordCacheStatistics:
+    """Counters describing the behavior of an in-memory cache of dimension
+    records.
+    """
+
+    hits: int = 0
+    """Number of lookups satisfied by the cache (`int`)."""
+
+    misses: int = 0
+    """Number of lookups that had to be delegated to the database (`int`).
+    This includes lookups for cached negative results that had expired.
+    """
+
+    evictions: int = 0
+    """Number of entries removed from the cache to keep it within its size
+    limit (`int`).
+    """
+
+    size: int = 0
+    """Number of entries (including negative results) currently held in the
+    cache (`int`).
+    """
+
+    maxSize: Optional[int] = None
+    """Maximum number of entries the cache may hold, or `None` if it is
+    unbounded (`int` or `None`).
+    """
+
+
 class DimensionRecordStorage(ABC):
     """An abstract base class that represents a way of storing the records
     associated with a single `DimensionElement`.
@@ -70,11 +104,12 @@ class DimensionRecordStorage(ABC):
     via a call to `setupDimensionStorage`, which selects the appropriate
     subclass for each element according to its configuration.
 
-    All `DimensionRecordStorage` methods are pure abstract, even though in some
-    cases a reasonable default implementation might be possible, in order to
-    better guarantee all methods are correctly overridden.  All of these
-    potentially-defaultable implementations are extremely trivial, so asking
-    subclasses to provide them is not a significant burden.
+    All `DimensionRecordStorage` methods other than `getCacheStatistics` are
+    pure abstract, even though in some cases a reasonable default
+    implementation might be possible, in order to better guarantee all methods
+    are correctly overridden.  All of these potentially-defaultable
+    implementations are extremely trivial, so asking subclasses to provide
+    them is not a significant burden.
     """
 
     @property
@@ -94,6 +129,23 @@ class DimensionRecordStorage(ABC):
         """
         raise NotImplementedError()
 
+    def getCacheStatistics(self) -> Optional[DimensionRecordCacheStatistics]:
+        """Return counters describing the behavior of the storage instance's
+        in-memory cache of records.
+
+        Returns
+        -------
+        statistics : `DimensionRecordCacheStatistics` or `None`
+            A snapshot of the cache statistics, or `None` if this storage
+            does not cache records.
+
+        Notes
+        -----
+        The default implementation returns `None`; storage classes with a
+        record cache should override it.
+        """
+        return None
+
     @abstractmethod
     def join(
         self,
@@ -363,9 +415,10 @@ class DatabaseDimensionRecordStorage(DimensionRecordStorage):
 
         This will only be called if ``self.element.spatial is not None``,
         and will be called immediately after construction (before any other
-        methods).  In the future, implementations will be required to call a
-        method on any connected overlap storage objects any time new records
-        for the element are inserted.
+        methods).  Implementations must call
+        `DatabaseDimensionOverlapStorage.insert` on all connected overlap
+        storage objects any time new records for the element are inserted,
+        within the same transaction.
 
         Parameters
         ----------
@@ -375,6 +428,30 @@ class DatabaseDimensionRecordStorage(DimensionRecordStorage):
         """
         raise NotImplementedError(f"{type(self).__name__} does not support spatial elements.")
 
+    def fetchOverlapCandidates(self, regions: Iterable[Region],
+                               governorValues: AbstractSet[str]) -> Iterable[DimensionRecord]:
+        """Retrieve records whose regions may overlap any of the given
+        regions.
+
+        This will only be called if ``self.element.spatial is not None``.
+
+        Parameters
+        ----------
+        regions : `Iterable` [ `lsst.sphgeom.Region` ]
+            Regions to search for overlaps with.
+        governorValues : `AbstractSet` [ `str` ]
+            Values of this element's governor dimension to restrict the
+            search to.
+
+        Returns
+        -------
+        records : `Iterable` [ `DimensionRecord` ]
+            Records whose regions may overlap at least one of ``regions``.
+            This is a superset of the records whose regions actually overlap
+            them; callers are responsible for testing the regions directly.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support spatial elements.")
+
 
 class DatabaseDimensionOverlapStorage(ABC):
     """A base class for objects that manage overlaps between a pair of
@@ -422,6 +499,62 @@ class DatabaseDimensionOverlapStorage(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def insert(self, records: Sequence[DimensionRecord]) -> None:
+        """Insert overlaps for a sequence of records that have just been
+        inserted.
+
+        This must be called by any method that inserts records for either of
+        `elements`, within the same transaction.
+
+        Parameters
+        ----------
+        records : `Sequence` [ `DimensionRecord` ]
+            Records for one of the elements this object relates.  Records
+            with `None` regions are ignored.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def materialize(self) -> int:
+        """Materialize overlaps for all combinations of governor dimension
+        values whose overlaps have not already been materialized.
+
+        This computes overlaps for records that already exist, and is
+        intended for use as a one-time backfill in data repositories that
+        were populated before overlaps were materialized automatically.
+
+        Returns
+        -------
+        count : `int`
+            Number of combinations of governor values newly materialized.
+        """
+        raise NotImplementedError()
+
+    def refresh(self) -> None:
+        """Ensure `select` is aware of overlaps materialized by other clients
+        since this object was initialized or last refreshed.
+
+        The default implementation does nothing.
+        """
+        pass
+
+    @abstractmethod
+    def select(self) -> Optional[sqlalchemy.sql.FromClause]:
+        """Return the materialized overlaps, for use in a query.
+
+        Returns
+        -------
+        overlaps : `sqlalchemy.sql.FromClause` or `None`
+            A table or subquery with a column for each of the required
+            dimensions of both `elements`, with rows for exactly the pairs
+            of records whose regions overlap.  `None` if overlaps have not
+            been materialized for all combinations of governor values in the
+            data repository, in which case the query system must compute
+            overlaps itself.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def digestTables(self) -> Iterable[sqlalchemy.schema.Table]:
         """Return tables used for schema digest.
@@ -546,6 +679,46 @@ class DimensionRecordStorageManager(VersionedExtension):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def getOverlapStorage(self, element1: DatabaseDimensionElement, element2: DatabaseDimensionElement
+                          ) -> Optional[DatabaseDimensionOverlapStorage]:
+        """Return the object that manages materialized overlaps between two
+        database-backed dimension elements.
+
+        Parameters
+        ----------
+        element1 : `DatabaseDimensionElement`
+            First element of the pair, in any order.
+        element2 : `DatabaseDimensionElement`
+            Second element of the pair, in any order.
+
+        Returns
+        -------
+        overlaps : `DatabaseDimensionOverlapStorage` or `None`
+            The object managing overlaps between these elements, or `None`
+            if their overlaps are not materialized in this layer.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def materializeOverlaps(self) -> int:
+        """Materialize overlaps between database-backed dimension elements
+        for all records that have been inserted without them.
+
+        Returns
+        -------
+        count : `int`
+            Number of combinations of elements and governor values newly
+            materialized.
+
+        Notes
+        -----
+        Overlaps are materialized automatically as new records are inserted,
+        so this is only needed to backfill data repositories that were
+        populated before that was the case.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def saveDimensionGraph(self, graph: DimensionGraph) -> int:
         """Save a `DimensionGraph` definition to the database, allowing it to
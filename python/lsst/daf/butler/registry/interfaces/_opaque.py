@@ -71,7 +71,9 @@ class OpaqueTableStorage(ABC):
             Additional keyword arguments are interpreted as equality
             constraints that restrict the returned rows (combined with AND);
             keyword arguments are column names and values are the values they
-            must have.
+            must have.  If a value is a `list`, `tuple`, `set`, or
+            `frozenset`, the column must instead match any of the values it
+            contains (an ``IN`` constraint).
 
         Yields
         ------
@@ -90,7 +92,9 @@ class OpaqueTableStorage(ABC):
             Additional keyword arguments are interpreted as equality
             constraints that restrict the deleted rows (combined with AND);
             keyword arguments are column names and values are the values they
-            must have.
+            must have.  If a value is a `list`, `tuple`, `set`, or
+            `frozenset`, rows matching any of the values it contains are
+            deleted.
         """
         raise NotImplementedError()
 
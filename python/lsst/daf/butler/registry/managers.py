@@ -28,7 +28,7 @@ __all__ = (
 
 import dataclasses
 import logging
-from typing import Any, Dict, Generic, Type, TypeVar
+from typing import Any, Dict, Generic, Optional, Type, TypeVar
 
 from lsst.utils import doImport
 
@@ -165,7 +165,7 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             raise RuntimeError("Unexpectedly failed to serialize DimensionConfig to JSON")
         return instances
 
-    def loadRepo(self, database: Database) -> RegistryManagerInstances:
+    def loadRepo(self, database: Database, *, lazy: bool = False) -> RegistryManagerInstances:
         """Construct manager instances that point to an existing data
         repository.
 
@@ -175,6 +175,9 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             Object that represents a connection to the SQL database that backs
             the data repository.  Must point to a namespace that already holds
             all tables and other persistent entities used by butler.
+        lazy : `bool`, optional
+            If `True`, collections and dataset types are loaded from the
+            database only when they are first used, instead of all at once.
 
         Returns
         -------
@@ -214,7 +217,7 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             # now.
             _LOG.warning(f"Registry schema digest mismatch: {exc}")
         # Load content from database that we try to keep in-memory.
-        instances.refresh()
+        instances.refresh(lazy=lazy)
         return instances
 
 
@@ -301,10 +304,17 @@ class RegistryManagerInstances(_GenericRegistryManagers[
             {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
         )
 
-    def refresh(self) -> None:
+    def refresh(self, *, lazy: Optional[bool] = None) -> None:
         """Refresh all in-memory state by querying the database.
+
+        Parameters
+        ----------
+        lazy : `bool`, optional
+            If `True`, collections and dataset types are only loaded from the
+            database when they are first used.  If `None` (default), keep the
+            mode used by the previous call.
         """
         self.dimensions.clearCaches()
         self.dimensions.refresh()
-        self.collections.refresh()
-        self.datasets.refresh()
+        self.collections.refresh(lazy=lazy)
+        self.datasets.refresh(lazy=lazy)
@@ -25,11 +25,13 @@ opaque tables for `Registry`.
 
 __all__ = ["ByNameOpaqueTableStorage", "ByNameOpaqueTableStorageManager"]
 
+import itertools
 from typing import (
     Any,
     ClassVar,
     Dict,
     Iterator,
+    List,
     Optional,
 )
 
@@ -76,17 +78,42 @@ class ByNameOpaqueTableStorage(OpaqueTableStorage):
         # Docstring inherited from OpaqueTableStorage.
         self._db.insert(self._table, *data)
 
+    _IN_CLAUSE_LIMIT: ClassVar[int] = 1000
+    """Maximum number of values in a single ``IN`` clause; larger collections
+    of values are split into several queries to stay within the bound
+    parameter limits of all supported database engines.
+    """
+
     def fetch(self, **where: Any) -> Iterator[dict]:
         # Docstring inherited from OpaqueTableStorage.
-        sql = self._table.select().where(
-            sqlalchemy.sql.and_(*[self._table.columns[k] == v for k, v in where.items()])
-        )
-        for row in self._db.query(sql):
-            yield dict(row)
+        # Each constraint is expanded to a list of alternative WHERE terms;
+        # scalar values produce a single equality term, while collections of
+        # values produce one IN term per batch.  We run one query for each
+        # combination of alternatives.
+        alternatives: List[List[sqlalchemy.sql.ColumnElement]] = []
+        for name, value in where.items():
+            column = self._table.columns[name]
+            if isinstance(value, (list, tuple, set, frozenset)):
+                values = list(set(value))
+                if not values:
+                    return
+                alternatives.append([column.in_(values[i:i + self._IN_CLAUSE_LIMIT])
+                                     for i in range(0, len(values), self._IN_CLAUSE_LIMIT)])
+            else:
+                alternatives.append([column == value])
+        for terms in itertools.product(*alternatives):
+            sql = self._table.select().where(sqlalchemy.sql.and_(*terms))
+            for row in self._db.query(sql):
+                yield dict(row)
 
     def delete(self, **where: Any) -> None:
         # Docstring inherited from OpaqueTableStorage.
-        self._db.delete(self._table, where.keys(), where)
+        # Expand collections of values into one row of keys per combination,
+        # which are deleted with a single executemany call.
+        alternatives = [list(set(value)) if isinstance(value, (list, tuple, set, frozenset)) else [value]
+                        for value in where.values()]
+        rows = [dict(zip(where.keys(), combination)) for combination in itertools.product(*alternatives)]
+        self._db.delete(self._table, where.keys(), *rows)
 
 
 class ByNameOpaqueTableStorageManager(OpaqueTableStorageManager):
@@ -22,11 +22,13 @@ from __future__ import annotations
 
 __all__ = ("QueryBuilder",)
 
+import itertools
 from typing import AbstractSet, Any, Iterable, List, Optional
 
 import sqlalchemy.sql
 
 from ...core import (
+    DatabaseDimensionElement,
     DimensionElement,
     SkyPixDimension,
     Dimension,
@@ -61,6 +63,9 @@ class QueryBuilder:
         self._elements: NamedKeyDict[DimensionElement, sqlalchemy.sql.FromClause] = NamedKeyDict()
         self._columns = QueryColumns()
         self._managers = managers
+        # Spatial elements whose overlaps are provided by a materialized
+        # overlap table instead of commonSkyPix joins and region columns.
+        self._overlapElements: NamedValueSet[DimensionElement] = NamedValueSet()
 
     def hasDimensionKey(self, dimension: Dimension) -> bool:
         """Return `True` if the given dimension's primary key column has
@@ -90,7 +95,9 @@ class QueryBuilder:
         storage = self._managers.dimensions[element]
         fromClause = storage.join(
             self,
-            regions=self._columns.regions if element in self.summary.spatial else None,
+            regions=(self._columns.regions
+                     if element in self.summary.spatial and element not in self._overlapElements
+                     else None),
             timespans=self._columns.timespans if element in self.summary.temporal else None,
         )
         self._elements[element] = fromClause
@@ -356,6 +363,39 @@ class QueryBuilder:
             onclause = sqlalchemy.sql.and_(*joinOn)
         self._simpleQuery.join(table, onclause=onclause)
 
+    def _joinMaterializedOverlaps(self) -> None:
+        """Join a table of materialized overlaps between the spatial elements
+        in the query, if one is available.
+
+        This replaces joins through the common skypix dimension and the
+        region comparisons in `Query.rows`, so a spatial join can be evaluated
+        entirely by the database.  It is only possible when the spatial join
+        involves exactly two database-backed elements, and the query does not
+        also need to compare their regions to a region given in the data ID.
+
+        For internal use by `QueryBuilder` only; will be called (and should
+        only by called) by `_joinMissingDimensionElements`.
+        """
+        commonSkyPix = self.summary.universe.commonSkyPix
+        if commonSkyPix in self.summary.mustHaveKeysJoined or self.summary.where.dataId.graph.spatial:
+            return
+        elements = [element for element in self.summary.spatial if element != commonSkyPix]
+        if len(elements) != 2:
+            return
+        for element in elements:
+            if not isinstance(element, DatabaseDimensionElement) or element in self._elements:
+                return
+        overlapStorage = self._managers.dimensions.getOverlapStorage(*elements)
+        if overlapStorage is None:
+            return
+        table = overlapStorage.select()
+        if table is None:
+            return
+        dimensions = NamedValueSet(itertools.chain(elements[0].required, elements[1].required))
+        self.joinTable(table, dimensions)
+        self._overlapElements.update(elements)
+        self._overlapElements.add(commonSkyPix)
+
     def _joinMissingDimensionElements(self) -> None:
         """Join all dimension element tables that were identified as necessary
         by `QuerySummary` and have not yet been joined.
@@ -370,7 +410,12 @@ class QueryBuilder:
         # the primary key value for the "instrument" table it depends on, so we
         # don't need to join "instrument" as well unless we had a nontrivial
         # expression on it (and hence included it already above).
+        self._joinMaterializedOverlaps()
         for element in self.summary.universe.sorted(self.summary.mustHaveTableJoined, reverse=True):
+            if isinstance(element, SkyPixDimension) and element in self._overlapElements:
+                # The common skypix dimension is not needed to relate
+                # elements whose overlaps are materialized directly.
+                continue
             self.joinDimensionElement(element)
         # Join in any requested Dimension tables that don't already have their
         # primary keys identified by the query.
@@ -28,8 +28,10 @@ import enum
 import itertools
 from typing import (
     Callable,
+    Dict,
     Iterable,
     Iterator,
+    List,
     Mapping,
     Optional,
     Tuple,
@@ -38,11 +40,12 @@ from typing import (
 
 import sqlalchemy
 
-from lsst.sphgeom import Region
+from lsst.sphgeom import Box, Region
 
 from ...core import (
     addDimensionForeignKey,
     DataCoordinate,
+    DataCoordinateBatch,
     DatasetRef,
     DatasetType,
     ddl,
@@ -230,12 +233,54 @@ class Query(ABC):
             argmument and returns `bool`.
         """
         whereRegion = region if region is not None else self.whereRegion
+        spatial = list(self.spatial)
+        if not spatial:
+            return lambda row: True
+        regionColumns = [self.getRegionColumn(element.name) for element in spatial]
+        keyColumns = [[self.getDimensionColumn(dimension.name) for dimension in element.graph.required]
+                      for element in spatial]
+        whereBox = whereRegion.getBoundingBox() if whereRegion is not None else None
+        # The same regions (and pairs of regions) typically appear in many
+        # result rows, so we decode each region only once per distinct data ID
+        # of its element, and remember the result of every overlap test.  Each
+        # test is first attempted with (much cheaper) bounding boxes, since
+        # disjoint bounding boxes imply disjoint regions.
+        # Per-element mapping from data ID values to (region, bounding box,
+        # overlaps whereRegion).
+        elementCaches: List[Dict[tuple, Tuple[Region, Box, bool]]] = [{} for _ in spatial]
+        # Mapping from pairs of (element index, data ID values) to whether
+        # those two elements' regions overlap.
+        pairCache: Dict[tuple, bool] = {}
 
         def closure(row: sqlalchemy.engine.RowProxy) -> bool:
-            rowRegions = [row[self.getRegionColumn(element.name)] for element in self.spatial]
-            if whereRegion and any(r.isDisjointFrom(whereRegion) for r in rowRegions):
-                return False
-            return not any(a.isDisjointFrom(b) for a, b in itertools.combinations(rowRegions, 2))
+            keys = []
+            entries = []
+            for regionColumn, columns, cache in zip(regionColumns, keyColumns, elementCaches):
+                key = tuple(row[column] for column in columns)
+                entry = cache.get(key)
+                if entry is None:
+                    rowRegion = row[regionColumn]
+                    rowBox = rowRegion.getBoundingBox()
+                    overlapsWhere = (
+                        whereRegion is None
+                        or not (rowBox.isDisjointFrom(whereBox) or rowRegion.isDisjointFrom(whereRegion))
+                    )
+                    entry = (rowRegion, rowBox, overlapsWhere)
+                    cache[key] = entry
+                if not entry[2]:
+                    return False
+                keys.append(key)
+                entries.append(entry)
+            for (i, (regionA, boxA, _)), (j, (regionB, boxB, _)) in itertools.combinations(
+                    enumerate(entries), 2):
+                pairKey = (i, keys[i], j, keys[j])
+                overlaps = pairCache.get(pairKey)
+                if overlaps is None:
+                    overlaps = not (boxA.isDisjointFrom(boxB) or regionA.isDisjointFrom(regionB))
+                    pairCache[pairKey] = overlaps
+                if not overlaps:
+                    return False
+            return True
 
         return closure
 
@@ -257,7 +302,7 @@ class Query(ABC):
             of any real rows to indicate an empty query (see `EmptyQuery`).
         """
         predicate = self.predicate(region)
-        for row in db.query(self.sql):
+        for row in db.streamQuery(self.sql):
             if predicate(row):
                 yield row
 
@@ -331,6 +376,36 @@ class Query(ABC):
         else:
             return dataId
 
+    def extractDataIdBatch(self, rows: Iterable[Optional[sqlalchemy.engine.RowProxy]], *,
+                           graph: Optional[DimensionGraph] = None) -> DataCoordinateBatch:
+        """Extract a columnar batch of data IDs from result rows.
+
+        Parameters
+        ----------
+        rows : `Iterable` [ `sqlalchemy.engine.RowProxy` or `None` ]
+            Result rows from a SQLAlchemy SELECT query, or a single `None` to
+            indicate the row from an `EmptyQuery`.
+        graph : `DimensionGraph`, optional
+            The dimensions the returned data IDs should identify.  If not
+            provided, this will be all dimensions in `QuerySummary.requested`.
+
+        Returns
+        -------
+        batch : `DataCoordinateBatch`
+            Data IDs that identify all required and implied dimensions, with
+            values for each dimension stored in a single array.
+        """
+        if graph is None:
+            graph = self.graph
+        columns = [self.getDimensionColumn(dimension.name)
+                   for dimension in itertools.chain(graph.required, graph.implied)]
+        if not columns:
+            return DataCoordinateBatch.fromRows(rows, graph)
+        return DataCoordinateBatch.fromRows(
+            (tuple(row[column] for column in columns) for row in rows),
+            graph
+        )
+
     def extractDatasetRef(self, row: sqlalchemy.engine.RowProxy,
                           dataId: Optional[DataCoordinate] = None,
                           records: Optional[Mapping[str, Mapping[tuple, DimensionRecord]]] = None,
@@ -46,6 +46,7 @@ import sqlalchemy
 
 from ...core import (
     DataCoordinate,
+    DataCoordinateBatch,
     DataCoordinateIterable,
     DatasetRef,
     DatasetType,
@@ -110,6 +111,24 @@ class DataCoordinateQueryResults(DataCoordinateIterable):
         # Docstring inherited from DataCoordinateIterable.
         return self._records is not None or not self._query.graph
 
+    def toBatch(self) -> DataCoordinateBatch:
+        """Execute the query and return its results as a columnar batch.
+
+        Returns
+        -------
+        batch : `DataCoordinateBatch`
+            Data IDs with values for all required and implied dimensions,
+            stored as one NumPy array per dimension.  Dimension records are
+            never attached, even if `hasRecords` returns `True`.
+
+        Notes
+        -----
+        This is much more memory-efficient than `toSequence` for large result
+        sets, because `DataCoordinate` instances are only created when
+        elements of the batch are accessed.  It requires NumPy.
+        """
+        return self._query.extractDataIdBatch(self._query.rows(self._db))
+
     @contextmanager
     def materialize(self) -> Iterator[DataCoordinateQueryResults]:
         """Insert this query's results into a temporary table.
@@ -253,6 +272,15 @@ class DataCoordinateQueryResults(DataCoordinateIterable):
                 ])
             )
 
+    @contextmanager
+    def constrainInSession(self, query: SimpleQuery, columns: Callable[[str], sqlalchemy.sql.ColumnElement],
+                           db: Database) -> Iterator[None]:
+        # Docstring inherited from DataCoordinateIterable.
+        # Our data IDs are already in the database, so there is never any
+        # need to upload them.
+        self.constrain(query, columns)
+        yield
+
     def findDatasets(self, datasetType: Union[DatasetType, str], collections: Any, *,
                      findFirst: bool = True) -> ParentDatasetQueryResults:
         """Find datasets using the data IDs identified by this query.
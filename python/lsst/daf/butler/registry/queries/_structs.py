@@ -52,7 +52,7 @@ from ..interfaces import (
 from ..summaries import GovernorDimensionRestriction
 # We're not trying to add typing to the lex/yacc parser code, so MyPy
 # doesn't know about some of these imports.
-from .expressions import Node, NormalForm, NormalFormExpression, ParserYacc  # type: ignore
+from .expressions import Node, NormalForm, NormalFormExpression, parseExpression  # type: ignore
 
 
 @immutable
@@ -71,8 +71,7 @@ class QueryWhereExpression:
     def __init__(self, expression: Optional[str] = None, bind: Optional[Mapping[str, Any]] = None):
         if expression:
             try:
-                parser = ParserYacc()
-                self._tree = parser.parse(expression)
+                self._tree = parseExpression(expression)
             except Exception as exc:
                 raise RuntimeError(f"Failed to parse user expression `{expression}'.") from exc
             assert self._tree is not None
@@ -24,12 +24,14 @@
 """Syntax definition for user expression parser.
 """
 
-__all__ = ["ParserYacc", "ParserYaccError", "ParseError", "ParserEOFError"]
+__all__ = ["ParserYacc", "ParserYaccError", "ParseError", "ParserEOFError", "parseExpression"]
 
 # -------------------------------
 #  Imports of standard modules --
 # -------------------------------
+import functools
 import re
+import threading
 import warnings
 
 # -----------------------------
@@ -144,6 +146,33 @@ def _parseTimeString(time_str):
 
     return value
 
+
+# Lexer built on first use and cloned for every parse, cloning is much
+# cheaper than building a new lexer from the token definitions.
+_lexerPrototype = None
+_lexerLock = threading.Lock()
+
+
+def _makeLexer():
+    """Return a new lexer with default options.
+
+    Returns
+    -------
+    lexer : `ply.lex.Lexer`
+        Lexer instance, a clone of the lexer built on first call.
+    """
+    global _lexerPrototype
+    if _lexerPrototype is None:
+        with _lexerLock:
+            if _lexerPrototype is None:
+                _lexerPrototype = ParserLex.make_lexer()
+    return _lexerPrototype.clone()
+
+
+# Per-thread default parsers, LRParser keeps parsing state in the instance
+# so it cannot be shared between threads.
+_threadParsers = threading.local()
+
 # ------------------------
 #  Exported definitions --
 # ------------------------
@@ -218,16 +247,56 @@ class ParserYacc:
         `Identifier` is inserted into parse tree.
     **kwargs
         optional keyword arguments that are passed to `yacc.yacc` constructor.
+
+    Notes
+    -----
+    Parsing tables are generated only once per class, when the first
+    instance is constructed without ``kwargs``, and are shared by all later
+    instances.  Instances themselves are not thread-safe.
     """
 
-    def __init__(self, idMap=None, **kwargs):
+    _tablesLock = threading.Lock()
 
-        kw = dict(write_tables=0, debug=False)
-        kw.update(kwargs)
+    def __init__(self, idMap=None, **kwargs):
 
-        self.parser = yacc.yacc(module=self, **kw)
+        if kwargs:
+            kw = dict(write_tables=0, debug=False)
+            kw.update(kwargs)
+            self.parser = yacc.yacc(module=self, **kw)
+        else:
+            self.parser = self._makeParser()
         self._idMap = idMap or {}
 
+    def _makeParser(self):
+        """Make LR parser bound to this instance, re-using parsing tables
+        generated for this class.
+
+        Returns
+        -------
+        parser : `ply.yacc.LRParser`
+            Parser instance.
+        """
+        cls = type(self)
+        # Look in the class dictionary so that subclasses, which may change
+        # grammar, do not share tables with their base class.
+        tables = cls.__dict__.get("_tables")
+        if tables is None:
+            with cls._tablesLock:
+                tables = cls.__dict__.get("_tables")
+                if tables is None:
+                    parser = yacc.yacc(module=self, write_tables=0, debug=False)
+                    productions = [(p.str, p.name, p.len, p.func, p.file, p.line)
+                                   for p in parser.productions]
+                    cls._tables = (parser.action, parser.goto, productions)
+                    return parser
+        action, goto, productions = tables
+        lrtab = yacc.LRTable()
+        lrtab.lr_action = action
+        lrtab.lr_goto = goto
+        lrtab.lr_productions = [yacc.MiniProduction(*args) for args in productions]
+        lrtab.bind_callables({name: getattr(self, name) for name in dir(self) if name.startswith("p_")})
+        return yacc.LRParser(lrtab, self.p_error)
+
     def parse(self, input, lexer=None, debug=False, tracking=False):
         """Parse input expression ad return parsed tree object.
 
@@ -239,8 +308,8 @@ class ParserYacc:
         input : str
             Expression to parse
         lexer : object, optional
-            Lexer instance, if not given then ParserLex.make_lexer() is
-            called to create one.
+            Lexer instance, if not given then a copy of the lexer made by
+            ParserLex.make_lexer() is used.
         debug : bool, optional
             Set to True for debugging output.
         tracking : bool, optional
@@ -248,7 +317,7 @@ class ParserYacc:
         """
         # make lexer
         if lexer is None:
-            lexer = ParserLex.make_lexer()
+            lexer = _makeLexer()
         tree = self.parser.parse(input=input, lexer=lexer, debug=debug,
                                  tracking=tracking)
         return tree
@@ -442,3 +511,34 @@ class ParserYacc:
             raise ParserEOFError()
         else:
             raise ParseError(p.lexer.lexdata, p.value, p.lexpos, p.lineno)
+
+
+@functools.lru_cache(maxsize=1024)
+def parseExpression(expression):
+    """Parse expression string using default parser.
+
+    Parameters
+    ----------
+    expression : `str`
+        Expression to parse.
+
+    Returns
+    -------
+    tree : `exprTree.Node` or `None`
+        Parsed expression tree, `None` for empty expression.
+
+    Raises
+    ------
+    ParserYaccError
+        Raised on parsing errors.
+
+    Notes
+    -----
+    Results are cached by expression string, so the same tree can be
+    returned to many callers and must not be modified.  Parser instances
+    are reused within each thread.
+    """
+    parser = getattr(_threadParsers, "parser", None)
+    if parser is None:
+        parser = _threadParsers.parser = ParserYacc()
+    return parser.parse(expression)
@@ -417,6 +417,65 @@ class DatabaseTests(ABC):
         self.assertEqual(db.query(count.select_from(tables.a)).scalar(), 0)
         self.assertEqual(db.query(count.select_from(d)).scalar(), 0)
 
+    def testInsertReturnIds(self):
+        """Test that `Database.insert` with ``returnIds=True`` returns IDs
+        that match the inserted rows, in order, for many rows at once.
+        """
+        db = self.makeEmptyDatabase(origin=1)
+        with db.declareStaticTables(create=True) as context:
+            tables = context.addTableTuple(STATIC_TABLE_SPECS)
+        for n in (1, 2, 500):
+            rows = [{"name": f"b{n}_{i}", "value": i} for i in range(n)]
+            ids = db.insert(tables.b, *rows, returnIds=True)
+            self.assertEqual(len(set(ids)), n)
+            sql = tables.b.select().where(tables.b.columns.id.in_(ids))
+            byId = {r["id"]: dict(r) for r in db.query(sql).fetchall()}
+            self.assertEqual([byId[id] for id in ids], [dict(row, id=id) for row, id in zip(rows, ids)])
+            # Same for a table with an autoincrement+origin primary key, in a
+            # transaction that also does other inserts.
+            with db.transaction():
+                db.insert(tables.c, {"origin": db.origin, "b_id": ids[0]})
+                cRows = [{"origin": db.origin, "b_id": id} for id in ids]
+                cIds = db.insert(tables.c, *cRows, returnIds=True)
+                db.insert(tables.c, {"origin": db.origin, "b_id": None})
+            self.assertEqual(len(set(cIds)), n)
+            sql = tables.c.select().where(tables.c.columns.id.in_(cIds))
+            byId = {r["id"]: dict(r) for r in db.query(sql).fetchall()}
+            self.assertEqual([byId[id] for id in cIds],
+                             [dict(row, id=id) for row, id in zip(cRows, cIds)])
+            # Identical rows, as inserted into the dataset table by
+            # Registry.insertDatasets, must still get distinct IDs.
+            same = {"origin": db.origin, "b_id": ids[-1]}
+            sameIds = db.insert(tables.c, *([same]*n), returnIds=True)
+            self.assertEqual(len(set(sameIds)), n)
+            sql = tables.c.select().where(tables.c.columns.id.in_(sameIds)).order_by(tables.c.columns.id)
+            self.assertEqual([dict(r) for r in db.query(sql).fetchall()],
+                             [dict(same, id=id) for id in sorted(sameIds)])
+
+    def testStreamQuery(self):
+        """Test that `Database.streamQuery` returns the same rows as
+        `Database.query`, both inside and outside sessions and transactions.
+        """
+        db = self.makeEmptyDatabase(origin=1)
+        with db.declareStaticTables(create=True) as context:
+            tables = context.addTableTuple(STATIC_TABLE_SPECS)
+        db.insert(tables.b, *[{"name": f"b{i}", "value": i} for i in range(25)])
+        sql = tables.b.select().order_by("id")
+        expected = [dict(r) for r in db.query(sql).fetchall()]
+        self.assertEqual(len(expected), 25)
+        for batchSize in (None, 1, 7, 25, 100):
+            self.assertEqual([dict(r) for r in db.streamQuery(sql, batchSize=batchSize)], expected)
+            with db.session():
+                self.assertEqual([dict(r) for r in db.streamQuery(sql, batchSize=batchSize)], expected)
+            with db.transaction():
+                self.assertEqual([dict(r) for r in db.streamQuery(sql, batchSize=batchSize)], expected)
+        # Abandoning an iterator part of the way through should be harmless.
+        with db.transaction():
+            rows = db.streamQuery(sql, batchSize=3)
+            self.assertEqual(dict(next(rows)), expected[0])
+            rows.close()
+            self.assertEqual([dict(r) for r in db.streamQuery(sql)], expected)
+
     def testUpdate(self):
         """Tests for `Database.update`.
         """
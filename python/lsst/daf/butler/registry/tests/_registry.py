@@ -29,6 +29,7 @@ import logging
 import os
 import re
 import unittest
+import unittest.mock
 
 import astropy.time
 import sqlalchemy
@@ -39,6 +40,7 @@ try:
 except ImportError:
     np = None
 
+from ...core.dimensions import _dataCoordinateIterable
 from ...core import (
     DataCoordinate,
     DataCoordinateSequence,
@@ -61,6 +63,7 @@ from .._registry import (
     RegistryConfig,
 )
 from .._exceptions import MissingCollectionError
+from ..dimensions.caching import CachingDimensionRecordStorage
 from ..interfaces import ButlerAttributeExistsError
 
 
@@ -139,6 +142,9 @@ class RegistryTests(ABC):
         self.assertEqual(rows[0:1], list(registry.fetchOpaqueData(table, id=1)))
         self.assertEqual(rows[1:2], list(registry.fetchOpaqueData(table, name="two")))
         self.assertEqual([], list(registry.fetchOpaqueData(table, id=1, name="two")))
+        self.assertCountEqual(rows[0:2], list(registry.fetchOpaqueData(table, id=[1, 2])))
+        self.assertEqual(rows[1:2], list(registry.fetchOpaqueData(table, id={1, 2}, name="two")))
+        self.assertEqual([], list(registry.fetchOpaqueData(table, id=[])))
         registry.deleteOpaqueData(table, id=3)
         self.assertCountEqual(rows[:2], list(registry.fetchOpaqueData(table)))
         registry.deleteOpaqueData(table)
@@ -955,9 +961,16 @@ class RegistryTests(ABC):
         # useful.
         self.assertEqual(len(families), 2)
 
+        # Overlaps between families are materialized as records are inserted,
+        # so there should be nothing left to backfill, and the queries below
+        # should be able to use them.
+        self.assertEqual(registry.materializeDimensionOverlaps(), 0)
+
         # Overlap DatabaseDimensionElements with each other.
         for family1, family2 in itertools.combinations(families, 2):
             for element1, element2 in itertools.product(families[family1], families[family2]):
+                overlapStorage = registry._managers.dimensions.getOverlapStorage(element1, element2)
+                self.assertIsNotNone(overlapStorage.select())
                 graph = DimensionGraph.union(element1.graph, element2.graph)
                 # Construct expected set of overlapping data IDs via a
                 # brute-force comparison of the regions we've already fetched.
@@ -992,6 +1005,61 @@ class RegistryTests(ABC):
             queried = set(registry.queryDataIds(graph))
             self.assertEqual(expected, queried)
 
+    def testSpatialPredicateCache(self):
+        """Test that the Python-side spatial filtering of query rows decodes
+        each region only once and agrees with a brute-force evaluation.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "hsc-rc2-subset.yaml")
+        # Constraining on a tract forces the region comparisons to be done
+        # in Python, with a region to test each row against.
+        dataId = registry.expandDataId(skymap="hsc_rings_v1", tract=9813)
+        query = registry.queryDataIds(["visit", "detector", "patch"], dataId=dataId)._query
+        spatial = list(query.spatial)
+        self.assertEqual(len(spatial), 2)
+        self.assertIsNotNone(query.whereRegion)
+        regionColumns = [query.getRegionColumn(element.name) for element in spatial]
+        # getRegionColumn returns a new label each time, so the rows given to
+        # the predicate must recognize region columns by name.
+        elementsByRegionColumn = {column.name: element for column, element in zip(regionColumns, spatial)}
+        keyColumns = {
+            element.name: [query.getDimensionColumn(dimension.name) for dimension in element.graph.required]
+            for element in spatial
+        }
+        rows = list(registry._db.query(query.sql))
+
+        # Brute-force evaluation, with no caching.
+        expected = []
+        for row in rows:
+            regions = [row[column] for column in regionColumns]
+            if (all(not region.isDisjointFrom(query.whereRegion) for region in regions)
+                    and all(not a.isDisjointFrom(b) for a, b in itertools.combinations(regions, 2))):
+                expected.append(row)
+
+        # Rows that count how many times the region of each data ID of each
+        # element is read.
+        accesses = defaultdict(int)
+
+        class CountingRow:
+            def __init__(self, row):
+                self._row = row
+
+            def __getitem__(self, column):
+                element = elementsByRegionColumn.get(getattr(column, "name", None))
+                if element is not None:
+                    key = tuple(self._row[c] for c in keyColumns[element.name])
+                    accesses[element.name, key] += 1
+                return self._row[column]
+
+        predicate = query.predicate()
+        self.assertEqual([row for row in rows if predicate(CountingRow(row))], expected)
+        self.assertGreater(len(expected), 0)
+        # The same regions appear in many rows, but each is only decoded once.
+        distinct = {element.name: {tuple(row[c] for c in keyColumns[element.name]) for row in rows}
+                    for element in spatial}
+        self.assertLess(max(len(keys) for keys in distinct.values()), len(rows))
+        self.assertEqual(set(accesses.values()), {1})
+
     def testAbstractQuery(self):
         """Test that we can run a query that just lists the known
         bands.  This is tricky because band is
@@ -1012,6 +1080,40 @@ class RegistryTests(ABC):
              DataCoordinate.standardize(band="r", universe=registry.dimensions)]
         )
 
+    def testDimensionRecordCache(self):
+        """Test the in-memory cache of dimension records and its statistics.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        before = registry.getDimensionRecordCacheStatistics()["detector"]
+        registry.expandDataId(instrument="Cam1", detector=1)
+        registry.expandDataId(instrument="Cam1", detector=1)
+        after = registry.getDimensionRecordCacheStatistics()["detector"]
+        self.assertGreaterEqual(after.hits, before.hits + 2)
+        self.assertEqual(after.misses, before.misses)
+        # Make a new, bounded cache in front of the same storage.
+        nested = registry._managers.dimensions["detector"]._nested
+        storage = CachingDimensionRecordStorage(nested, maxSize=2, negativeTTL=0.0)
+        graph = storage.element.graph
+        dataIds = [DataCoordinate.standardize(instrument="Cam1", detector=d, graph=graph)
+                   for d in (1, 2, 3, 5)]
+        records = list(storage.fetch(DataCoordinateSet(set(dataIds[:3]), graph=graph)))
+        self.assertEqual(len(records), 3)
+        statistics = storage.getCacheStatistics()
+        self.assertEqual(statistics.misses, 3)
+        self.assertEqual(statistics.evictions, 1)
+        self.assertEqual(statistics.size, 2)
+        self.assertEqual(statistics.maxSize, 2)
+        # Detector 5 does not exist; with a TTL of zero that negative result
+        # expires immediately, so the second lookup is a miss, too.
+        for _ in range(2):
+            self.assertEqual(list(storage.fetch(DataCoordinateSet({dataIds[3]}, graph=graph))), [])
+        statistics = storage.getCacheStatistics()
+        self.assertEqual(statistics.misses, 5)
+        self.assertEqual(statistics.hits, 0)
+        storage.clearCaches()
+        self.assertEqual(storage.getCacheStatistics().size, 0)
+
     def testAttributeManager(self):
         """Test basic functionality of attribute manager.
         """
@@ -1105,6 +1207,48 @@ class RegistryTests(ABC):
             ]
         )
 
+    def testFindDatasets(self):
+        """Test that `Registry.findDatasets` searches collections in order
+        and agrees with `Registry.findDataset`.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        self.loadData(registry, "datasets.yaml")
+        dataIds = [{"instrument": "Cam1", "detector": d} for d in (1, 2, 3, 4, 5)]
+        for collections in (["imported_g", "imported_r"], ["imported_r", "imported_g"]):
+            found = registry.findDatasets("bias", dataIds, collections=collections)
+            expected = [registry.findDataset("bias", dataId, collections=collections) for dataId in dataIds]
+            self.assertCountEqual(found.values(), [ref for ref in expected if ref is not None])
+            for dataId, ref in found.items():
+                self.assertEqual(ref.dataId, dataId)
+        # A chained collection should behave just like its children.
+        registry.registerCollection("chain", type=CollectionType.CHAINED)
+        registry.setCollectionChain("chain", ["imported_r", "imported_g"])
+        self.assertEqual(registry.findDatasets("bias", dataIds, collections="chain"),
+                         registry.findDatasets("bias", dataIds, collections=["imported_r", "imported_g"]))
+        # Single and empty data ID lists should work, too.
+        ref = registry.findDataset("bias", dataIds[0], collections="chain")
+        self.assertEqual(list(registry.findDatasets("bias", dataIds[:1], collections="chain").values()),
+                         [ref])
+        self.assertEqual(registry.findDatasets("bias", [], collections="chain"), {})
+        # Calibration collections are searched only if a timespan is given.
+        t1 = astropy.time.Time('2020-01-01T01:00:00', format="isot", scale="tai")
+        t2 = astropy.time.Time('2020-01-01T02:00:00', format="isot", scale="tai")
+        bias2r = registry.findDataset("bias", instrument="Cam1", detector=2, collections="imported_r")
+        registry.registerCollection("calibs", type=CollectionType.CALIBRATION)
+        registry.certify("calibs", [bias2r], Timespan(t1, None))
+        collections = ["calibs", "imported_g"]
+        found = registry.findDatasets("bias", dataIds[:3], collections=collections)
+        self.assertEqual(found, registry.findDatasets("bias", dataIds[:3], collections="imported_g"))
+        timespan = Timespan(t2, None)
+        found = registry.findDatasets("bias", dataIds[:3], collections=collections, timespan=timespan)
+        self.assertIn(bias2r, found.values())
+        self.assertCountEqual(
+            found.values(),
+            [registry.findDataset("bias", dataId, collections=collections, timespan=timespan)
+             for dataId in dataIds[:3]]
+        )
+
     def testQueryResults(self):
         """Test querying for data IDs and then manipulating the QueryResults
         object returned to perform other queries.
@@ -1686,6 +1830,89 @@ class RegistryTests(ABC):
                 expected = None
             assertLookup(detector=2, timespan=timespan, expected=expected)
 
+    def testCalibrationCache(self):
+        """Test that lookups in `~CollectionType.CALIBRATION` collections give
+        the same results with in-memory caching of validity ranges, including
+        after certify and decertify.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        self.loadData(registry, "datasets.yaml")
+        t1 = astropy.time.Time('2020-01-01T01:00:00', format="isot", scale="tai")
+        t2 = astropy.time.Time('2020-01-01T02:00:00', format="isot", scale="tai")
+        t3 = astropy.time.Time('2020-01-01T03:00:00', format="isot", scale="tai")
+        t4 = astropy.time.Time('2020-01-01T04:00:00', format="isot", scale="tai")
+        t5 = astropy.time.Time('2020-01-01T05:00:00', format="isot", scale="tai")
+        allTimespans = [
+            Timespan(a, b) for a, b in itertools.combinations([None, t1, t2, t3, t4, t5, None], r=2)
+        ]
+        bias2a = registry.findDataset("bias", instrument="Cam1", detector=2, collections="imported_g")
+        bias3a = registry.findDataset("bias", instrument="Cam1", detector=3, collections="imported_g")
+        bias2b = registry.findDataset("bias", instrument="Cam1", detector=2, collections="imported_r")
+        bias3b = registry.findDataset("bias", instrument="Cam1", detector=3, collections="imported_r")
+        collection = "Cam1/calibs/default"
+        registry.registerCollection(collection, type=CollectionType.CALIBRATION)
+        registry.certify(collection, [bias2a], Timespan(begin=t2, end=t4))
+        registry.certify(collection, [bias3a], Timespan(begin=t1, end=t3))
+        dataIds = [registry.expandDataId(instrument="Cam1", detector=d) for d in (1, 2, 3, 4)]
+
+        def lookupAll():
+            """Look up all biases with all timespans, in the calibration
+            collection alone and ahead of a RUN collection, one at a time and
+            all at once.
+            """
+            result = {}
+            for timespan in allTimespans:
+                for collections in ([collection], [collection, "imported_r"]):
+                    key = (timespan, tuple(collections))
+                    for dataId in dataIds:
+                        try:
+                            result[key + (dataId,)] = registry.findDataset(
+                                "bias", dataId, collections=collections, timespan=timespan
+                            )
+                        except RuntimeError:
+                            result[key + (dataId,)] = RuntimeError
+                    try:
+                        result[key] = registry.findDatasets("bias", dataIds, collections=collections,
+                                                            timespan=timespan)
+                    except RuntimeError:
+                        result[key] = RuntimeError
+            return result
+
+        expected = lookupAll()
+        registry._managers.datasets.setCalibrationCaching(True)
+        self.assertEqual(lookupAll(), expected)
+        # Changes made through this registry invalidate the cache.
+        registry.certify(collection, [bias2b, bias3b], Timespan(begin=t4, end=None))
+        cached = lookupAll()
+        self.assertNotEqual(cached, expected)
+        registry.decertify(collection, "bias", Timespan(begin=t2, end=t3),
+                           dataIds=[dict(instrument="Cam1", detector=2)])
+        cachedAfterDecertify = lookupAll()
+        self.assertNotEqual(cachedAfterDecertify, cached)
+
+        def findBias2(timespan):
+            return registry.findDataset("bias", instrument="Cam1", detector=2, collections=collection,
+                                        timespan=timespan)
+
+        # Validity ranges seen inside a transaction that is rolled back do
+        # not stay in the cache.
+        with self.assertRaises(RuntimeError):
+            with registry.transaction():
+                registry.certify(collection, [bias2b], Timespan(begin=None, end=t2))
+                self.assertEqual(findBias2(Timespan(begin=None, end=t1)), bias2b)
+                raise RuntimeError("Roll back certification.")
+        self.assertIsNone(findBias2(Timespan(begin=None, end=t1)))
+        self.assertEqual(lookupAll(), cachedAfterDecertify)
+        registry._managers.datasets.setCalibrationCaching(False)
+        self.assertEqual(lookupAll(), cachedAfterDecertify)
+        # Removing a RUN collection removes the calibration associations of
+        # its datasets without going through the cached storage.
+        registry._managers.datasets.setCalibrationCaching(True)
+        self.assertEqual(findBias2(Timespan(begin=t4, end=None)), bias2b)
+        registry.removeCollection("imported_r")
+        self.assertIsNone(findBias2(Timespan(begin=t4, end=None)))
+
     def testIngestTimeQuery(self):
 
         registry = self.makeRegistry()
@@ -1830,6 +2057,65 @@ class RegistryTests(ABC):
         self.assertEqual(registry.getCollectionSummary(tag), expected2)
         self.assertEqual(registry.getCollectionSummary(calibs), expected2)
 
+    def testLazyLoading(self):
+        """Test that dataset types, collections and collection summaries are
+        loaded on demand after a lazy refresh.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        self.loadData(registry, "datasets.yaml")
+        registry.registerCollection("chain", CollectionType.CHAINED)
+        registry.setCollectionChain("chain", ["imported_r", "imported_g"])
+        bias = registry.getDatasetType("bias")
+        expected = registry.getCollectionSummary("chain")
+        expectedRefs = set(registry.queryDatasets(bias, collections="chain"))
+        self.assertTrue(expectedRefs)
+        registry._managers.refresh(lazy=True)
+        self.assertEqual(registry.getDatasetType("bias"), bias)
+        self.assertEqual(registry.getCollectionType("chain"), CollectionType.CHAINED)
+        self.assertEqual(list(registry.getCollectionChain("chain")), ["imported_r", "imported_g"])
+        self.assertEqual(registry.getCollectionSummary("chain"), expected)
+        self.assertEqual(set(registry.queryDatasets(bias, collections="chain")), expectedRefs)
+        ref = expectedRefs.pop()
+        registry.refresh()
+        self.assertEqual(registry.getDataset(ref.id), ref)
+        # Prefetching ignores unknown names.
+        registry.prefetch(datasetTypes=[bias, "flat", "not_here"], collections=["imported_g", "not_here"])
+        self.assertEqual(registry.getDatasetType("flat").name, "flat")
+        with self.assertRaises(KeyError):
+            registry.getDatasetType("not_here")
+        with self.assertRaises(MissingCollectionError):
+            registry.getCollectionType("not_here")
+        # Iteration loads everything.
+        self.assertIn("flat", {datasetType.name for datasetType in registry.queryDatasetTypes()})
+        self.assertIn("imported_g", set(registry.queryCollections()))
+        # New registrations work without having loaded anything.
+        registry.refresh()
+        registry.registerRun("imported_g")
+        registry.registerDatasetType(bias)
+        registry.registerRun("new_run")
+        self.assertEqual(registry.getCollectionType("new_run"), CollectionType.RUN)
+        registry._managers.refresh(lazy=False)
+        self.assertEqual(registry.getCollectionType("new_run"), CollectionType.RUN)
+
+    def testDataIdConstraintStrategies(self):
+        """Test that constraining queries to data IDs in the WHERE clause and
+        via a temporary table give the same results.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "hsc-rc2-subset.yaml")
+        storage = registry._managers.dimensions["visit"]
+        graph = storage.element.graph
+        dataIds = registry.queryDataIds(graph).toSet()
+        self.assertGreater(len(dataIds), 1)
+        expected = {record.dataId: record for record in storage.fetch(dataIds)}
+        self.assertEqual(set(expected.keys()), set(dataIds))
+        subset = DataCoordinateSet(set(list(dataIds)[1:]), graph=graph)
+        with unittest.mock.patch.object(_dataCoordinateIterable, "_TEMPORARY_TABLE_THRESHOLD", 1):
+            self.assertEqual({record.dataId: record for record in storage.fetch(dataIds)}, expected)
+            self.assertEqual({record.dataId for record in storage.fetch(subset)}, set(subset))
+        self.assertEqual(list(storage.fetch(DataCoordinateSet(set(), graph=graph))), [])
+
     def testUnrelatedDimensionQueries(self):
         """Test that WHERE expressions in queries can reference dimensions that
         are not in the result set.
@@ -1841,3 +2127,35 @@ class RegistryTests(ABC):
             set(registry.queryDataIds(["visit", "detector"],
                                       where="instrument='Cam1' AND skymap='not_here' AND tract=0")),
         )
+
+    @unittest.skipIf(np is None, "numpy not available.")
+    def testQueryDataIdBatch(self):
+        """Test that data ID query results are the same when returned as a
+        columnar batch as when returned as a sequence.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        self.loadData(registry, "datasets.yaml")
+        queries = [
+            # Implied dimensions (band) as well as required ones.
+            registry.queryDataIds(["detector", "physical_filter"]),
+            registry.queryDataIds(["detector"], datasets="flat", collections="imported_r"),
+            registry.queryDataIds(["detector", "physical_filter"]).expanded(),
+            # No rows.
+            registry.queryDataIds(["detector"], where="instrument='Cam1' AND detector > 100"),
+            # One row with no dimensions.
+            registry.queryDataIds([]),
+        ]
+        for results in queries:
+            with self.subTest(graph=results.graph, hasRecords=results.hasRecords()):
+                sequence = results.toSequence()
+                batch = results.toBatch()
+                self.assertEqual(batch.graph, sequence.graph)
+                self.assertEqual(len(batch), len(sequence))
+                self.assertTrue(batch.hasFull())
+                self.assertFalse(batch.hasRecords())
+                self.assertEqual(sorted(batch), sorted(sequence))
+                for dataId in batch:
+                    self.assertEqual(dataId.full, sequence[sequence.index(dataId)].full)
+        self.assertEqual(len(queries[3].toBatch()), 0)
+        self.assertEqual(list(queries[4].toBatch()), [DataCoordinate.makeEmpty(registry.dimensions)])
@@ -24,6 +24,7 @@ from .certifyCalibrations import certifyCalibrations
 from .createRepo import createRepo
 from .configDump import configDump
 from .configValidate import configValidate
+from .materializeDimensionOverlaps import materializeDimensionOverlaps
 from .pruneCollection import pruneCollection
 from .queryCollections import queryCollections
 from .queryDataIds import queryDataIds
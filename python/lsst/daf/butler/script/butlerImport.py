@@ -22,7 +22,7 @@
 from .. import Butler
 
 
-def butlerImport(repo, directory, export_file, transfer, skip_dimensions):
+def butlerImport(repo, directory, export_file, transfer, skip_dimensions, format="yaml"):
     """Import data into a butler repository.
 
     Parameters
@@ -42,6 +42,9 @@ def butlerImport(repo, directory, export_file, transfer, skip_dimensions):
         The external data transfer type.
     skip_dimensions : `list`, or `None`
         Dimensions that should be skipped.
+    format : `str`, optional
+        Format of the export file, as a key in the ``repo_transfer_formats``
+        section of the butler configuration (e.g. "yaml" or "jsonl").
     """
     butler = Butler(repo, writeable=True)
 
@@ -51,5 +54,5 @@ def butlerImport(repo, directory, export_file, transfer, skip_dimensions):
     butler.import_(directory=directory,
                    filename=export_file,
                    transfer=transfer,
-                   format="yaml",
+                   format=format,
                    skip_dimensions=skip_dimensions)
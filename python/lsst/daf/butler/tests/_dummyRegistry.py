@@ -60,14 +60,16 @@ class DummyOpaqueTableStorage(OpaqueTableStorage):
     def fetch(self, **where: Any) -> Iterator[dict]:
         # Docstring inherited from OpaqueTableStorage.
         for d in self._rows:
-            if all(d[k] == v for k, v in where.items()):
+            if all(d[k] in v if isinstance(v, (list, tuple, set, frozenset)) else d[k] == v
+                   for k, v in where.items()):
                 yield d
 
     def delete(self, **where: Any):
         # Docstring inherited from OpaqueTableStorage.
         kept = []
         for d in self._rows:
-            if not all(d[k] == v for k, v in where.items()):
+            if not all(d[k] in v if isinstance(v, (list, tuple, set, frozenset)) else d[k] == v
+                       for k, v in where.items()):
                 kept.append(d)
         self._rows = kept
 
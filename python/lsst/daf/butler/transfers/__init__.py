@@ -23,4 +23,5 @@ from ._context import *
 from ._interfaces import *
 
 from ._yaml import *
+from ._jsonl import *
 
@@ -0,0 +1,497 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+__all__ = ["JsonLinesRepoExportBackend", "JsonLinesRepoImportBackend"]
+
+import itertools
+import json
+import logging
+import os
+from collections import defaultdict
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from lsst.sphgeom import Region
+from lsst.utils import doImport
+from ..core import (
+    DatasetAssociation,
+    DatasetRef,
+    DatasetType,
+    DataCoordinate,
+    Datastore,
+    DimensionElement,
+    DimensionRecord,
+    FileDataset,
+    Timespan,
+)
+from ..registry import CollectionType, Registry
+from ..registry.interfaces import (
+    ChainedCollectionRecord,
+    CollectionRecord,
+    RunRecord,
+    VersionTuple,
+)
+from ..registry.versions import IncompatibleVersionError
+from ._interfaces import RepoExportBackend, RepoImportBackend
+
+
+_LOG = logging.getLogger(__name__)
+
+
+JSONL_FORMAT_VERSION = VersionTuple(1, 0, 0)
+"""Export format version for line-delimited JSON exports.
+
+Files with a different major version or a newer minor version cannot be read by
+this version of the code.
+"""
+
+_IDS_PER_LINE = 10000
+"""Maximum number of dataset IDs written in a single association line.
+"""
+
+
+def _encode(obj: Any) -> Any:
+    """Convert objects the `json` module does not support into tagged
+    dictionaries; for use as the ``default`` argument to `json.dumps`.
+    """
+    if isinstance(obj, bytes):
+        return {"$bytes": obj.hex()}
+    if isinstance(obj, Region):
+        return {"$region": obj.encode().hex()}
+    if isinstance(obj, Timespan):
+        return {"$timespan": obj.to_simple()}
+    raise TypeError(f"Object of type {type(obj).__name__} cannot be exported.")
+
+
+def _decode(data: Dict[str, Any]) -> Any:
+    """Invert `_encode`; for use as the ``object_hook`` argument to
+    `json.loads`.
+    """
+    if len(data) == 1:
+        if "$bytes" in data:
+            return bytes.fromhex(data["$bytes"])
+        if "$region" in data:
+            return Region.decode(bytes.fromhex(data["$region"]))
+        if "$timespan" in data:
+            return Timespan.from_simple(data["$timespan"])
+    return data
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Format a dictionary as a single line of JSON, including the trailing
+    newline.
+
+    The ``type`` key must be first, so import can recognize lines it does not
+    need to parse without parsing them.
+    """
+    return json.dumps(data, separators=(",", ":"), default=_encode) + "\n"
+
+
+def _loads(line: str) -> Dict[str, Any]:
+    """Parse a line written by `_dumps`."""
+    return json.loads(line, object_hook=_decode)
+
+
+def _chunks(iterable: Iterable[int], size: int) -> Iterator[List[int]]:
+    """Split an iterable into lists with at most ``size`` elements."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _typePrefix(type: str) -> str:
+    """Return the string every line with the given ``type`` starts with."""
+    return '{"type":' + json.dumps(type) + ","
+
+
+_DIMENSION_PREFIX = _typePrefix("dimension")
+_DATASET_PREFIX = _typePrefix("dataset")
+_ASSOCIATIONS_PREFIX = _typePrefix("associations")
+
+
+class JsonLinesRepoExportBackend(RepoExportBackend):
+    """A repository export implementation that saves to a line-delimited JSON
+    file.
+
+    Each dimension record, dataset, and (bounded-size) group of collection
+    associations is written as a separate line as soon as it is saved, so the
+    export can be read back incrementally by `JsonLinesRepoImportBackend`.
+
+    Parameters
+    ----------
+    stream
+        A writeable file-like object.
+    """
+
+    def __init__(self, stream: IO):
+        self.stream = stream
+        self.stream.write(json.dumps({
+            "description": "Butler Data Repository Export",
+            "version": str(JSONL_FORMAT_VERSION),
+        }) + "\n")
+
+    def saveDimensionData(self, element: DimensionElement, *data: DimensionRecord) -> None:
+        # Docstring inherited from RepoExportBackend.saveDimensionData.
+        for record in data:
+            self.stream.write(_dumps({"type": "dimension", "element": element.name,
+                                      "record": record.toDict()}))
+
+    def saveCollection(self, record: CollectionRecord, doc: Optional[str]) -> None:
+        # Docstring inherited from RepoExportBackend.saveCollections.
+        data: Dict[str, Any] = {
+            "type": "collection",
+            "collection_type": record.type.name,
+            "name": record.name,
+        }
+        if doc is not None:
+            data["doc"] = doc
+        if isinstance(record, RunRecord):
+            data["host"] = record.host
+            data["timespan"] = record.timespan
+        elif isinstance(record, ChainedCollectionRecord):
+            data["children"] = list(record.children)
+        self.stream.write(_dumps(data))
+
+    def saveDatasets(self, datasetType: DatasetType, run: str, *datasets: FileDataset) -> None:
+        # Docstring inherited from RepoExportBackend.saveDatasets.
+        self.stream.write(_dumps({"type": "dataset_type", "dataset_type": datasetType.to_simple()}))
+        for dataset in datasets:
+            refs = sorted(dataset.refs)
+            data = {
+                "type": "dataset",
+                "dataset_type": datasetType.name,
+                "run": run,
+                "dataset_id": [ref.id for ref in refs],
+                "data_id": [ref.dataId.byName() for ref in refs],
+                "path": dataset.path,
+            }
+            if dataset.formatter is not None:
+                data["formatter"] = dataset.formatter
+            self.stream.write(_dumps(data))
+
+    def saveDatasetAssociations(self, collection: str, collectionType: CollectionType,
+                                associations: Iterable[DatasetAssociation]) -> None:
+        # Docstring inherited from RepoExportBackend.saveDatasetAssociations.
+        if collectionType is CollectionType.TAGGED:
+            for chunk in _chunks((assoc.ref.id for assoc in associations), _IDS_PER_LINE):
+                self.stream.write(_dumps({
+                    "type": "associations",
+                    "collection": collection,
+                    "collection_type": collectionType.name,
+                    "dataset_ids": chunk,
+                }))
+        elif collectionType is CollectionType.CALIBRATION:
+            idsByTimespan: Dict[Timespan, List[int]] = defaultdict(list)
+            for association in associations:
+                assert association.timespan is not None
+                assert association.ref.id is not None
+                idsByTimespan[association.timespan].append(association.ref.id)
+            for timespan, dataset_ids in idsByTimespan.items():
+                for chunk in _chunks(dataset_ids, _IDS_PER_LINE):
+                    self.stream.write(_dumps({
+                        "type": "associations",
+                        "collection": collection,
+                        "collection_type": collectionType.name,
+                        "timespan": timespan,
+                        "dataset_ids": chunk,
+                    }))
+
+    def finish(self) -> None:
+        # Docstring inherited from RepoExportBackend.
+        self.stream.flush()
+
+
+class JsonLinesRepoImportBackend(RepoImportBackend):
+    """A repository import implementation that reads from a line-delimited
+    JSON file written by `JsonLinesRepoExportBackend`.
+
+    Unlike `YamlRepoImportBackend`, this reads the file incrementally: only
+    dataset types, collections, and the IDs of datasets in TAGGED and
+    CALIBRATION collections are held in memory, while dimension records and
+    datasets are inserted in bounded-size batches as they are read.
+
+    Parameters
+    ----------
+    stream
+        A readable, seekable file-like object.  It is read once by `register`
+        and again by `load`.
+    registry : `Registry`
+        The registry datasets will be imported into.
+    chunkSize : `int`, optional
+        Maximum number of dimension records or datasets inserted at once.
+    """
+
+    def __init__(self, stream: IO, registry: Registry, chunkSize: int = 10000):
+        self.stream = stream
+        self.registry = registry
+        self.chunkSize = chunkSize
+        header = json.loads(self.stream.readline())
+        fileVersion = VersionTuple.fromString(header["version"])
+        if fileVersion.major != JSONL_FORMAT_VERSION.major:
+            raise IncompatibleVersionError(
+                f"Cannot read repository export file with version={fileVersion} "
+                f"({JSONL_FORMAT_VERSION.major}.x.x required)."
+            )
+        if fileVersion.minor > JSONL_FORMAT_VERSION.minor:
+            raise IncompatibleVersionError(
+                f"Cannot read repository export file with version={fileVersion} "
+                f"< {JSONL_FORMAT_VERSION.major}.{JSONL_FORMAT_VERSION.minor}.x required."
+            )
+        self._start = self.stream.tell()
+        # IDs (from the file) of datasets that need to be associated with
+        # collections after they are inserted; populated by `register`.
+        self._associatedIds: Set[int] = set()
+
+    def _lines(self) -> Iterator[str]:
+        """Iterate over the lines of the file after the header."""
+        self.stream.seek(self._start)
+        for line in self.stream:
+            if line.strip():
+                yield line
+
+    def register(self) -> None:
+        # Docstring inherited from RepoImportBackend.register.
+        datasetTypes: List[DatasetType] = []
+        runs: List[Tuple[str, Optional[str]]] = []
+        collections: List[Tuple[str, CollectionType, Optional[str]]] = []
+        chains: List[Tuple[str, List[str], Optional[str]]] = []
+        for line in self._lines():
+            if line.startswith((_DIMENSION_PREFIX, _DATASET_PREFIX)):
+                # Only processed by `load`; don't bother parsing these.
+                continue
+            data = _loads(line)
+            if data["type"] == "dataset_type":
+                datasetTypes.append(DatasetType.from_simple(data["dataset_type"],
+                                                            universe=self.registry.dimensions))
+            elif data["type"] == "collection":
+                collectionType = CollectionType.__members__[data["collection_type"].upper()]
+                if collectionType is CollectionType.RUN:
+                    # No way to add extra run info to registry yet.
+                    runs.append((data["name"], data.get("doc")))
+                elif collectionType is CollectionType.CHAINED:
+                    chains.append((data["name"], data["children"], data.get("doc")))
+                else:
+                    collections.append((data["name"], collectionType, data.get("doc")))
+            elif data["type"] == "associations":
+                self._associatedIds.update(data["dataset_ids"])
+            else:
+                raise ValueError(f"Unexpected line type: {data['type']}.")
+        for datasetType in datasetTypes:
+            self.registry.registerDatasetType(datasetType)
+        for run, doc in runs:
+            self.registry.registerRun(run, doc=doc)
+        for collection, collectionType, doc in collections:
+            self.registry.registerCollection(collection, collectionType, doc=doc)
+        for chain, children, doc in chains:
+            self.registry.registerCollection(chain, CollectionType.CHAINED, doc=doc)
+            self.registry.setCollectionChain(chain, children)
+
+    def load(self, datastore: Optional[Datastore], *,
+             directory: Optional[str] = None, transfer: Optional[str] = None,
+             skip_dimensions: Optional[Set] = None) -> None:
+        # Docstring inherited from RepoImportBackend.load.
+        loader = _JsonLinesLoader(self.registry, datastore, directory=directory, transfer=transfer,
+                                  associatedIds=self._associatedIds, chunkSize=self.chunkSize)
+        for line in self._lines():
+            if line.startswith(_DIMENSION_PREFIX):
+                data = _loads(line)
+                element = self.registry.dimensions[data["element"]]
+                if skip_dimensions and element in skip_dimensions:
+                    continue
+                loader.addDimensionRecord(element, data["record"])
+            elif line.startswith(_DATASET_PREFIX):
+                loader.addDataset(_loads(line))
+            elif line.startswith(_ASSOCIATIONS_PREFIX):
+                loader.addAssociations(_loads(line))
+        loader.flush()
+        _LOG.info("Imported %d dimension records and %d datasets.",
+                  loader.nDimensionRecords, loader.nDatasets)
+
+
+class _JsonLinesLoader:
+    """Helper class for `JsonLinesRepoImportBackend.load` that accumulates
+    and inserts batches of dimension records and datasets.
+
+    Parameters
+    ----------
+    registry : `Registry`
+        Registry to insert into.
+    datastore : `Datastore`, optional
+        Datastore to ingest datasets into.
+    directory : `str`, optional
+        File all dataset paths are relative to.
+    transfer : `str`, optional
+        Transfer mode forwarded to `Datastore.ingest`.
+    associatedIds : `set` [ `int` ]
+        IDs (from the export file) of datasets that will be associated with
+        collections later in the file.
+    chunkSize : `int`
+        Maximum number of dimension records or datasets inserted at once.
+
+    Notes
+    -----
+    Batches are flushed whenever the kind of object being read changes, to
+    preserve the dependency ordering of the export file.
+    """
+
+    def __init__(self, registry: Registry, datastore: Optional[Datastore], *,
+                 directory: Optional[str], transfer: Optional[str],
+                 associatedIds: Set[int], chunkSize: int):
+        self.registry = registry
+        self.datastore = datastore
+        self.directory = directory
+        self.transfer = transfer
+        self.associatedIds = associatedIds
+        self.chunkSize = chunkSize
+        self.nDimensionRecords = 0
+        self.nDatasets = 0
+        self._element: Optional[DimensionElement] = None
+        self._records: List[DimensionRecord] = []
+        self._datasetKey: Optional[Tuple[str, str]] = None
+        self._datasets: List[Tuple[List[int], List[Dict[str, Any]], FileDataset]] = []
+        self._datasetTypes: Dict[str, DatasetType] = {}
+        # New refs for datasets that will be associated with collections,
+        # keyed by the dataset ID in the file.
+        self._refsByFileId: Dict[int, DatasetRef] = {}
+
+    def addDimensionRecord(self, element: DimensionElement, values: Dict[str, Any]) -> None:
+        """Add a dimension record to the current batch.
+
+        Parameters
+        ----------
+        element : `DimensionElement`
+            Element the record belongs to.
+        values : `dict`
+            Record values as written by `JsonLinesRepoExportBackend`.
+        """
+        if element != self._element:
+            self.flush()
+            self._element = element
+        self._records.append(element.RecordClass(**values))
+        if len(self._records) >= self.chunkSize:
+            self._flushDimensionRecords()
+
+    def addDataset(self, data: Dict[str, Any]) -> None:
+        """Add a dataset (i.e. a file and all refs it holds) to the current
+        batch.
+
+        Parameters
+        ----------
+        data : `dict`
+            Dataset line as written by `JsonLinesRepoExportBackend`.
+        """
+        key = (data["dataset_type"], data["run"])
+        if key != self._datasetKey:
+            self.flush()
+            self._datasetKey = key
+        path = data["path"]
+        if self.directory is not None:
+            path = os.path.join(self.directory, path)
+        formatter = doImport(data["formatter"]) if "formatter" in data else None
+        fileDataset = FileDataset(path, [], formatter=formatter)
+        self._datasets.append((data["dataset_id"], data["data_id"], fileDataset))
+        if len(self._datasets) >= self.chunkSize:
+            self._flushDatasets()
+
+    def addAssociations(self, data: Dict[str, Any]) -> None:
+        """Associate datasets with a TAGGED or CALIBRATION collection.
+
+        Parameters
+        ----------
+        data : `dict`
+            Associations line as written by `JsonLinesRepoExportBackend`.
+        """
+        self.flush()
+        refs = [self._refsByFileId[i] for i in data["dataset_ids"]]
+        collectionType = CollectionType.__members__[data["collection_type"].upper()]
+        if collectionType is CollectionType.TAGGED:
+            self.registry.associate(data["collection"], refs)
+        elif collectionType is CollectionType.CALIBRATION:
+            self.registry.certify(data["collection"], refs, data["timespan"])
+        else:
+            raise ValueError(f"Unexpected collection type for association: {collectionType.name}.")
+
+    def flush(self) -> None:
+        """Insert all pending dimension records and datasets."""
+        self._flushDimensionRecords()
+        self._flushDatasets()
+
+    def _flushDimensionRecords(self) -> None:
+        if not self._records:
+            return
+        assert self._element is not None
+        self.registry.insertDimensionData(self._element, *self._records)
+        self.nDimensionRecords += len(self._records)
+        _LOG.info("Imported %d dimension records (%d %s).", self.nDimensionRecords,
+                  len(self._records), self._element.name)
+        self._records = []
+
+    def _flushDatasets(self) -> None:
+        if not self._datasets:
+            return
+        assert self._datasetKey is not None
+        datasetTypeName, run = self._datasetKey
+        datasetType = self._datasetTypes.get(datasetTypeName)
+        if datasetType is None:
+            datasetType = self.registry.getDatasetType(datasetTypeName)
+            self._datasetTypes[datasetTypeName] = datasetType
+        # Make a big flattened list of all data IDs and dataset_ids, while
+        # remembering slices that associate them with the FileDataset
+        # instances they came from.
+        dataIds: List[DataCoordinate] = []
+        fileIds: List[int] = []
+        slices = []
+        for datasetIds, datasetDataIds, _ in self._datasets:
+            start = len(dataIds)
+            dataIds.extend(DataCoordinate.standardize(dataId, graph=datasetType.dimensions)
+                           for dataId in datasetDataIds)
+            fileIds.extend(datasetIds)
+            slices.append(slice(start, len(dataIds)))
+        # As in YamlRepoImportBackend, we ignore the dataset IDs in the file
+        # and let the registry assign new ones.
+        resolvedRefs = self.registry.insertDatasets(datasetType, dataIds=dataIds, run=run)
+        for fileId, ref in zip(fileIds, resolvedRefs):
+            if fileId in self.associatedIds:
+                self._refsByFileId[fileId] = ref
+        fileDatasets = []
+        for sliceForFileDataset, (_, _, fileDataset) in zip(slices, self._datasets):
+            fileDataset.refs = resolvedRefs[sliceForFileDataset]
+            fileDatasets.append(fileDataset)
+        if self.datastore is not None:
+            self.datastore.ingest(*fileDatasets, transfer=self.transfer)
+        self.nDatasets += len(fileDatasets)
+        _LOG.info("Imported %d datasets (%d %s in %s).", self.nDatasets, len(fileDatasets),
+                  datasetTypeName, run)
+        self._datasets = []
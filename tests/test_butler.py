@@ -25,6 +25,7 @@
 import os
 import posixpath
 import unittest
+import unittest.mock
 import tempfile
 import shutil
 import pickle
@@ -110,6 +111,41 @@ class ButlerConfigTests(unittest.TestCase):
         self.assertNotEqual(config1[key], config2[key])
         self.assertEqual(config2[key], "override_record")
 
+    def testCache(self):
+        root = makeTestTempDir(TESTDIR)
+        try:
+            configDir = os.path.join(root, "config")
+            cacheDir = os.path.join(root, "cache")
+            shutil.copytree(os.path.join(TESTDIR, "config", "basic"), configDir)
+            configFile = os.path.join(configDir, "butler.yaml")
+            with unittest.mock.patch.dict(os.environ, {"DAF_BUTLER_CONFIG_CACHE_DIR": cacheDir}):
+                config1 = ButlerConfig(configFile)
+                self.assertEqual(len(os.listdir(cacheDir)), 1)
+                with self.assertLogs("lsst.daf.butler", level="DEBUG") as cm:
+                    config2 = ButlerConfig(configFile)
+                self.assertIn("Using cached configuration", "\n".join(cm.output))
+                self.assertEqual(config1, config2)
+                self.assertEqual(config1.configDir, config2.configDir)
+
+                # Changing a file pulled in with !include invalidates the
+                # cached copy.
+                with open(os.path.join(configDir, "posixDatastore.yaml"), "a") as fd:
+                    print("  records:\n    table: changed_record", file=fd)
+                config3 = ButlerConfig(configFile)
+                self.assertEqual(config3["datastore", "records", "table"], "changed_record")
+
+                # As does a new override in the search path.
+                overrideDirectory = os.path.join(root, "overrides")
+                os.makedirs(overrideDirectory)
+                with unittest.mock.patch.dict(os.environ, {"DAF_BUTLER_CONFIG_PATH": overrideDirectory}):
+                    ButlerConfig(configFile)
+                    with open(os.path.join(overrideDirectory, "registry.yaml"), "w") as fd:
+                        print("registry:\n  db: sqlite:///changed.sqlite3", file=fd)
+                    config4 = ButlerConfig(configFile)
+                self.assertEqual(config4["registry", "db"], "sqlite:///changed.sqlite3")
+        finally:
+            removeTestTempDir(root)
+
 
 class ButlerPutGetTests:
     """Helper method for running a suite of put/get tests from different
@@ -471,6 +507,56 @@ class ButlerTests(ButlerPutGetTests):
                 self.assertIn("424", str(compuri), f"Checking visit is in URI {compuri}")
                 self.assertEqual(compuri.fragment, "predicted", f"Checking for fragment in {compuri}")
 
+    def testPutManyGetMany(self):
+        butler = Butler(self.tmpConfigFile, run="ingest")
+        butler.registry.insertDimensionData("instrument", {"name": "DummyCamComp"})
+        butler.registry.insertDimensionData("physical_filter", {"instrument": "DummyCamComp",
+                                                                "name": "d-r",
+                                                                "band": "R"})
+        butler.registry.insertDimensionData("visit_system", {"instrument": "DummyCamComp",
+                                                             "id": 1,
+                                                             "name": "default"})
+        visits = (423, 424, 425)
+        for visit in visits:
+            butler.registry.insertDimensionData("visit", {"instrument": "DummyCamComp", "id": visit,
+                                                          "name": f"v{visit}", "physical_filter": "d-r",
+                                                          "visit_system": 1})
+        dimensions = butler.registry.dimensions.extract(["instrument", "visit"])
+        datasetTypes = [
+            self.addDatasetType(name, dimensions, self.storageClassFactory.getStorageClass(storageClass),
+                                butler.registry)
+            for name, storageClass in (("test_metric", "StructuredDataNoComponents"),
+                                       ("test_metric_comp", "StructuredCompositeReadComp"))
+        ]
+        metrics = []
+        refsIn = []
+        for datasetType in datasetTypes:
+            for visit in visits:
+                metric = makeExampleMetrics()
+                metric.summary["visit"] = visit
+                metrics.append(metric)
+                refsIn.append(DatasetRef(datasetType, {"instrument": "DummyCamComp", "visit": visit}))
+
+        refs = butler.putMany(zip(metrics, refsIn))
+        self.assertEqual(len(refs), len(refsIn))
+        for refIn, ref in zip(refsIn, refs):
+            self.assertIsNotNone(ref.id)
+            self.assertEqual(ref.datasetType, refIn.datasetType)
+            self.assertEqual(ref.dataId, refIn.dataId)
+
+        # Read back with resolved and unresolved refs, in a different order.
+        self.assertEqual(butler.getMany(refs[::-1]), metrics[::-1])
+        self.assertEqual(butler.getMany(refsIn), metrics)
+        sliced = butler.getMany(refs, parameters={"slice": slice(2)})
+        self.assertEqual([m.data for m in sliced], [m.data[:2] for m in metrics])
+
+        # Resolved refs can not be put again.
+        with self.assertRaises(ValueError):
+            butler.putMany([(metrics[0], refs[0])])
+        # Unknown data IDs can not be found.
+        with self.assertRaises(LookupError):
+            butler.getMany([DatasetRef(datasetTypes[0], {"instrument": "DummyCamComp", "visit": 426})])
+
     def testIngest(self):
         butler = Butler(self.tmpConfigFile, run="ingest")
 
@@ -935,13 +1021,18 @@ class FileDatastoreButlerTests(ButlerTests):
         storageClass = self.storageClassFactory.getStorageClass("StructuredDataNoComponents")
         self.runImportExportTest(storageClass)
 
+    def testImportExportJsonLines(self):
+        # Run put/get tests just to create and populate a repo.
+        storageClass = self.storageClassFactory.getStorageClass("StructuredDataNoComponents")
+        self.runImportExportTest(storageClass, format="jsonl")
+
     @unittest.expectedFailure
     def testImportExportVirtualComposite(self):
         # Run put/get tests just to create and populate a repo.
         storageClass = self.storageClassFactory.getStorageClass("StructuredComposite")
         self.runImportExportTest(storageClass)
 
-    def runImportExportTest(self, storageClass):
+    def runImportExportTest(self, storageClass, format="yaml"):
         """This test does an export to a temp directory and an import back
         into a new temp directory repo. It does not assume a posix datastore"""
         exportButler = self.runPutGetTest(storageClass, "test_metric")
@@ -954,7 +1045,7 @@ class FileDatastoreButlerTests(ButlerTests):
         exportButler.registry.insertDimensionData("skymap", skymapRecord)
         # Export and then import datasets.
         with safeTestTempDir(TESTDIR) as exportDir:
-            exportFile = os.path.join(exportDir, "exports.yaml")
+            exportFile = os.path.join(exportDir, f"exports.{format}")
             with exportButler.export(filename=exportFile, directory=exportDir, transfer="auto") as export:
                 export.saveDatasets(datasets)
                 # Export the same datasets again. This should quietly do
@@ -976,8 +1067,8 @@ class FileDatastoreButlerTests(ButlerTests):
                 # in the script folder are generally considered protected and
                 # should not be used as public api.
                 with open(exportFile, "r") as f:
-                    script.butlerImport(importDir, export_file=f,
-                                        directory=exportDir, transfer="auto", skip_dimensions=None)
+                    script.butlerImport(importDir, export_file=f, directory=exportDir, transfer="auto",
+                                        skip_dimensions=None, format=format)
                 importButler = Butler(importDir, run="ingest")
                 for ref in datasets:
                     with self.subTest(ref=ref):
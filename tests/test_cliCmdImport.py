@@ -40,7 +40,8 @@ class ImportTestCase(CliCmdTestBase, unittest.TestCase):
                     transfer="auto",
                     directory=None,
                     skip_dimensions=(),
-                    export_file=None)
+                    export_file=None,
+                    format="yaml")
 
     @staticmethod
     def command():
@@ -57,9 +58,9 @@ class ImportTestCase(CliCmdTestBase, unittest.TestCase):
         case below.
         """
         self.run_test(["import", "here", "foo",
-                       "--transfer", "symlink"],
+                       "--transfer", "symlink", "--format", "jsonl"],
                       self.makeExpected(repo="here", directory="foo",
-                                        transfer="symlink"))
+                                        transfer="symlink", format="jsonl"))
 
     def test_missingArgument(self):
         """Verify the command fails if either of the positional arguments,
@@ -83,7 +84,8 @@ class ExportFileCase(CliCmdTestBase, unittest.TestCase):
         return dict(repo=None,
                     transfer="auto",
                     directory=None,
-                    export_file=None)
+                    export_file=None,
+                    format="yaml")
 
     @staticmethod
     def command():
@@ -0,0 +1,97 @@
+
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for daf_butler CLI materialize-dimension-overlaps command.
+"""
+
+import os
+import unittest
+
+from lsst.daf.butler import Butler
+from lsst.daf.butler.cli import butler
+from lsst.daf.butler.cli.utils import clickResultMsg, LogCliRunner
+from lsst.daf.butler.registry.dimensions.static import StaticDimensionRecordStorageManager
+from lsst.daf.butler.registry.interfaces import VersionTuple
+
+TESTDIR = os.path.abspath(os.path.dirname(__file__))
+
+
+class MaterializeDimensionOverlapsTest(unittest.TestCase):
+    """Test executing the command."""
+
+    def setUp(self):
+        self.runner = LogCliRunner()
+
+    def testMaterializeDimensionOverlaps(self):
+        """Test backfilling overlaps in a new repository, which should have
+        nothing to backfill.
+        """
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(butler.cli, ["create", "here"])
+            self.assertEqual(result.exit_code, 0, clickResultMsg(result))
+            result = self.runner.invoke(butler.cli, ["materialize-dimension-overlaps", "here"])
+            self.assertEqual(result.exit_code, 0, clickResultMsg(result))
+            self.assertIn("Materialized overlaps for 0 new combinations", result.stdout)
+
+    def testBackfillExistingRepo(self):
+        """Test opening and backfilling a repository that was populated by a
+        client that did not materialize overlaps.
+        """
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(butler.cli, ["create", "here"])
+            self.assertEqual(result.exit_code, 0, clickResultMsg(result))
+            writer = Butler("here", writeable=True)
+            writer.import_(filename=os.path.join(TESTDIR, "data", "registry", "hsc-rc2-subset.yaml"))
+            # Remove everything the overlap storage wrote, leaving the
+            # repository as an older client would have.
+            dimensions = writer.registry._managers.dimensions
+            element1, element2 = (writer.registry.dimensions[name] for name in ("patch", "visit"))
+            for overlapStorage in dimensions._overlaps.values():
+                for table in reversed(list(overlapStorage.digestTables())):
+                    writer.registry._db.delete(table, [])
+            del writer
+            # The stored schema version is the one that older clients wrote.
+            reader = Butler("here", writeable=True)
+            self.assertEqual(
+                reader.registry._managers.attributes.get(
+                    f"version:{StaticDimensionRecordStorageManager.extensionName()}"
+                ),
+                str(VersionTuple(6, 0, 0)),
+            )
+            overlapStorage = reader.registry._managers.dimensions.getOverlapStorage(element1, element2)
+            self.assertIsNone(overlapStorage.select())
+            graph = element1.graph.union(element2.graph)
+            expected = set(reader.registry.queryDataIds(graph))
+            self.assertGreater(len(expected), 2)
+            result = self.runner.invoke(butler.cli, ["materialize-dimension-overlaps", "here"])
+            self.assertEqual(result.exit_code, 0, clickResultMsg(result))
+            self.assertNotIn("Materialized overlaps for 0 new combinations", result.stdout)
+            # The backfill by another client is seen after a refresh, and
+            # gives the same query results.
+            self.assertIsNone(overlapStorage.select())
+            reader.registry.refresh()
+            self.assertIsNotNone(overlapStorage.select())
+            self.assertEqual(set(reader.registry.queryDataIds(graph)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
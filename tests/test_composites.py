@@ -22,7 +22,8 @@
 import os
 import unittest
 
-from lsst.daf.butler import CompositesConfig, CompositesMap, StorageClass, DatasetType, DimensionUniverse
+from lsst.daf.butler import CompositesConfig, CompositesMap, StorageClass, DatasetRef, DatasetType, \
+    DimensionUniverse
 
 TESTDIR = os.path.dirname(__file__)
 
@@ -93,6 +94,32 @@ class TestCompositesConfig(unittest.TestCase):
         with self.assertRaises(ValueError):
             StorageClass("TestSC", components={"dummy": sccomp})
 
+    def testCachedMatches(self):
+        """Test that cached matches are the same as uncached ones for
+        instrument-qualified lookup keys.
+        """
+        universe = DimensionUniverse()
+        # Instrument overrides are not supported in this configuration, but
+        # refs with an instrument still have instrument-qualified lookup
+        # names.
+        config = {"disassembled": {"dummyTrue": True, "StructuredDataJson": False}}
+        sccomp = StorageClass("Dummy")
+        sc = StorageClass("StructuredDataJson", components={"dummy": sccomp, "dummy2": sccomp})
+        dimensions = universe.extract(["instrument"])
+        refs = [DatasetRef(DatasetType(name, dimensions, sc), {"instrument": instrument}, conform=False)
+                for name in ("dummyTrue", "dummyFred") for instrument in ("A", "B")]
+        uncached = CompositesMap(config, universe=universe)
+        expected = []
+        for ref in refs:
+            uncached._matchCache.clear()
+            expected.append(uncached.shouldBeDisassembled(ref))
+        self.assertEqual(expected, [True, True, False, False])
+        # The results must not depend on the order of the lookups.
+        for ordered in (refs, refs[::-1]):
+            c = CompositesMap(config, universe=universe)
+            results = [c.shouldBeDisassembled(ref) for ref in ordered]
+            self.assertEqual(results, expected if ordered is refs else expected[::-1])
+
 
 if __name__ == "__main__":
     unittest.main()
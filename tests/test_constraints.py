@@ -169,6 +169,23 @@ class ConstraintsTestCase(unittest.TestCase, DatasetTestHelper):
         self.assertTrue(constraints.isAcceptable(self.pviA))
         self.assertFalse(constraints.isAcceptable(self.pviB))
 
+    def testCachedAnswers(self):
+        """Test that cached answers are the same as uncached ones for
+        instrument-qualified lookup keys.
+        """
+        refs = [self.pviA, self.pviB, self.calexpA, self.pviA, self.pviB]
+        for config in ({"accept": ["calexp", {"instrument<B>": ["pvi"]}]},
+                       {"accept": ["all", {"instrument<A>": ["pvi"]}], "reject": ["pvi"]},
+                       {"reject": [{"instrument<A>": ["all"]}]}):
+            with self.subTest(config=config):
+                constraints = Constraints(ConstraintsConfig(config), universe=self.universe)
+                expected = [constraints._isAcceptable(set(ref._lookupNames())) for ref in refs]
+                self.assertNotEqual(expected[0], expected[1])
+                for ordered in (refs, refs[::-1]):
+                    constraints = Constraints(ConstraintsConfig(config), universe=self.universe)
+                    results = [constraints.isAcceptable(ref) for ref in ordered]
+                    self.assertEqual(results, expected if ordered is refs else expected[::-1])
+
     def testEdgeCases(self):
         # Accept everything and reject everything
         config = ConstraintsConfig({"accept": ["all"], "reject": ["all"]})
@@ -437,6 +437,11 @@ class DatasetRefTestCase(unittest.TestCase):
         ref = DatasetRef(self.datasetType, self.dataId, id=1, run="somerun")
         s = pickle.dumps(ref)
         self.assertEqual(pickle.loads(s), ref)
+        # A hash computed before pickling does not leak into the copy.
+        hash(ref)
+        ref2 = pickle.loads(pickle.dumps(ref))
+        self.assertEqual(hash(ref2), hash(ref))
+        self.assertEqual({ref: 1}[ref2], 1)
 
     def testJson(self):
         ref = DatasetRef(self.datasetType, self.dataId, id=1, run="somerun")
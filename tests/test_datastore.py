@@ -28,7 +28,7 @@ import lsst.utils.tests
 
 from lsst.utils import doImport
 
-from lsst.daf.butler import StorageClassFactory, StorageClass, DimensionUniverse, FileDataset
+from lsst.daf.butler import StorageClassFactory, StorageClass, DimensionUniverse, FileDataset, ButlerURI
 from lsst.daf.butler import DatastoreConfig, DatasetTypeNotSupportedError, DatastoreValidationError
 from lsst.daf.butler.formatters.yaml import YamlFormatter
 
@@ -205,6 +205,61 @@ class DatastoreTests(DatastoreTestsBase):
         with self.assertRaises(FileNotFoundError):
             datastore.getURI(ref)
 
+    def testPutGetMany(self):
+        datastore = self.makeDatastore()
+        dimensions = self.universe.extract(("visit", "physical_filter"))
+        metrics = []
+        refs = []
+        for sc in ("StructuredData", "StructuredDataJson", "StructuredComposite"):
+            storageClass = self.storageClassFactory.getStorageClass(sc)
+            for visit in (52, 53):
+                dataId = {"instrument": "dummy", "visit": visit, "physical_filter": "V"}
+                refs.append(self.makeDatasetRef(f"metric_{sc}", dimensions, storageClass, dataId,
+                                                conform=False))
+                metrics.append(makeExampleMetrics())
+        datastore.putMany(zip(metrics, refs))
+        for ref in refs:
+            self.assertTrue(datastore.exists(ref))
+
+        self.assertEqual(datastore.getMany(refs), metrics)
+        self.assertEqual(datastore.getMany(reversed(refs)), metrics[::-1])
+        self.assertEqual(datastore.getMany([]), [])
+
+        # Components can be read alongside whole datasets.
+        compRefs = [ref.makeComponentRef("data") for ref in refs]
+        self.assertEqual(datastore.getMany(compRefs), [m.data for m in metrics])
+
+        # A missing dataset makes the whole call fail.
+        missing = self.makeDatasetRef("metric_StructuredData", dimensions, refs[0].datasetType.storageClass,
+                                      refs[0].dataId, id=10000)
+        with self.assertRaises(FileNotFoundError):
+            datastore.getMany(refs + [missing])
+
+    def testMexistsGetManyURIs(self):
+        datastore = self.makeDatastore()
+        dimensions = self.universe.extract(("visit", "physical_filter"))
+        storageClass = self.storageClassFactory.getStorageClass("StructuredData")
+        # Refs are used as dictionary keys, so their data IDs must be
+        # conformed (and hence hashable).  That drops the implied
+        # physical_filter value, so use a dataset type whose file template
+        # does not need it.
+        refs = [self.makeDatasetRef("metric_mexists", dimensions, storageClass,
+                                    {"instrument": "dummy", "visit": visit})
+                for visit in (61, 62, 63)]
+        datastore.putMany((makeExampleMetrics(), ref) for ref in refs[:2])
+
+        expected = {refs[0]: True, refs[1]: True, refs[2]: False}
+        self.assertEqual(datastore.mexists(refs), expected)
+        self.assertEqual(datastore.mexists(refs, checkArtifacts=False), expected)
+        self.assertEqual(datastore.mexists([]), {})
+
+        uris = datastore.getManyURIs(refs[:2])
+        self.assertEqual(uris, {ref: datastore.getURIs(ref) for ref in refs[:2]})
+        with self.assertRaises(FileNotFoundError):
+            datastore.getManyURIs(refs)
+        uris = datastore.getManyURIs(refs, predict=True)
+        self.assertEqual(uris[refs[2]], datastore.getURIs(refs[2], predict=True))
+
     def testTrustGetRequest(self):
         """Check that we can get datasets that registry knows nothing about.
         """
@@ -719,6 +774,81 @@ class PosixDatastoreTestCase(DatastoreTests, unittest.TestCase):
         self.root = tempfile.mkdtemp(dir=TESTDIR)
         super().setUp()
 
+    def testIngestMany(self):
+        """Test ingesting many files, with their transfers and checksums done
+        concurrently, in a single call.
+        """
+        datastore = self.makeDatastore()
+        storageClass = self.storageClassFactory.getStorageClass("StructuredData")
+        dimensions = self.universe.extract(("visit", "physical_filter"))
+        metrics = makeExampleMetrics()
+        sourceDir = tempfile.mkdtemp(dir=TESTDIR)
+        self.addCleanup(shutil.rmtree, sourceDir, ignore_errors=True)
+        datasets = []
+        for visit in range(10):
+            dataId = {"instrument": "dummy", "visit": visit, "physical_filter": "V"}
+            ref = self.makeDatasetRef("metric", dimensions, storageClass, dataId, conform=False)
+            path = os.path.join(sourceDir, f"metric_{visit}.yaml")
+            with open(path, "w") as fd:
+                yaml.dump(metrics._asdict(), stream=fd)
+            datasets.append(FileDataset(path=path, refs=ref))
+        datastore.ingest(*datasets, transfer="copy")
+        for dataset in datasets:
+            ref = dataset.refs[0]
+            self.assertEqual(metrics, datastore.get(ref))
+            if not hasattr(datastore, "getStoredItemsInfo"):
+                # Chained datastores do not expose their records.
+                continue
+            info, = datastore.getStoredItemsInfo(ref)
+            self.assertEqual(info.file_size, os.path.getsize(dataset.path))
+            if datastore.useChecksum:
+                # A small block size must give the same answer.
+                self.assertEqual(info.checksum,
+                                 datastore.computeChecksum(ButlerURI(dataset.path), block_size=7))
+
+    def testEmptyTrashInChunks(self):
+        """Test that the trash is emptied in chunks, and that artifacts
+        shared with datasets that are not trashed are kept.
+        """
+        datastore = self.makeDatastore()
+        if not hasattr(datastore, "trashChunkSize"):
+            self.skipTest("Only relevant to file datastores.")
+        datastore.trashChunkSize = 2
+        storageClass = self.storageClassFactory.getStorageClass("StructuredData")
+        dimensions = self.universe.extract(("visit", "physical_filter"))
+        metrics = makeExampleMetrics()
+        # Refs are used as dictionary keys by mexists, so their data IDs must
+        # be conformed; see testMexistsGetManyURIs.
+        refs = [self.makeDatasetRef("metric_trash", dimensions, storageClass,
+                                    {"instrument": "dummy", "visit": visit})
+                for visit in range(71, 76)]
+        datastore.putMany((metrics, ref) for ref in refs)
+
+        # Two datasets sharing a single artifact.
+        shared = [self.makeDatasetRef("metric_trash", dimensions, storageClass,
+                                      {"instrument": "dummy", "visit": visit})
+                  for visit in (81, 82)]
+        sourceDir = tempfile.mkdtemp(dir=TESTDIR)
+        self.addCleanup(shutil.rmtree, sourceDir, ignore_errors=True)
+        path = os.path.join(sourceDir, "shared.yaml")
+        with open(path, "w") as fd:
+            yaml.dump(metrics._asdict(), stream=fd)
+        datastore.ingest(FileDataset(path=path, refs=shared), transfer="copy")
+        sharedUri = datastore.getURI(shared[1])
+
+        for ref in refs + shared[:1]:
+            datastore.trash(ref)
+        datastore.emptyTrash(ignore_errors=False)
+        self.assertEqual(datastore.mexists(refs + shared),
+                         {ref: ref is shared[1] for ref in refs + shared})
+        self.assertTrue(sharedUri.exists())
+        self.assertEqual(metrics, datastore.get(shared[1]))
+
+        # Trashing the last dataset using the artifact removes it.
+        datastore.trash(shared[1])
+        datastore.emptyTrash(ignore_errors=False)
+        self.assertFalse(sharedUri.exists())
+
 
 class PosixDatastoreNoChecksumsTestCase(PosixDatastoreTestCase):
     """Posix datastore tests but with checksums disabled."""
@@ -750,6 +880,16 @@ class PosixDatastoreNoChecksumsTestCase(PosixDatastoreTestCase):
         self.assertIsNotNone(infos[0].checksum)
 
 
+class PosixDatastoreSerialIOTestCase(PosixDatastoreTestCase):
+    """Posix datastore tests but with concurrent artifact I/O disabled."""
+    configFile = os.path.join(TESTDIR, "config/basic/posixDatastoreSerialIO.yaml")
+
+    def testIOThreads(self):
+        datastore = self.makeDatastore()
+        self.assertEqual(datastore.ioThreads, 1)
+        self.assertEqual(datastore.ingestThreads, 1)
+
+
 class CleanupPosixDatastoreTestCase(DatastoreTestsBase, unittest.TestCase):
     configFile = os.path.join(TESTDIR, "config/basic/butler.yaml")
 
@@ -0,0 +1,152 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import unittest.mock
+
+from lsst.daf.butler import (
+    ButlerURI,
+    DatastoreCacheManager,
+    DimensionUniverse,
+    StorageClass,
+    StoredFileInfo,
+)
+from lsst.daf.butler.tests import DatasetTestHelper
+
+TESTDIR = os.path.dirname(__file__)
+
+
+class DatastoreCacheManagerTestCase(DatasetTestHelper, unittest.TestCase):
+    """Tests for the local cache of remote datastore artifacts."""
+
+    def setUp(self):
+        self.id = 0
+        self.root = tempfile.mkdtemp(dir=TESTDIR)
+        self.cacheRoot = os.path.join(self.root, "cache")
+        self.universe = DimensionUniverse()
+        self.storageClass = StorageClass("TestCacheStorageClass")
+        self.dimensions = self.universe.extract(("visit", "physical_filter"))
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def makeArtifact(self, visit, content, checksum=None):
+        """Write a file and make the reference and record that describe it.
+        """
+        path = os.path.join(self.root, f"artifact_{visit}.txt")
+        with open(path, "wb") as fh:
+            fh.write(content)
+        dataId = {"instrument": "dummy", "visit": visit, "physical_filter": "V"}
+        ref = self.makeDatasetRef("metric", self.dimensions, self.storageClass, dataId, conform=False)
+        info = StoredFileInfo(formatter="lsst.daf.butler.formatters.yaml.YamlFormatter",
+                              path=path, storageClass=self.storageClass, component=None,
+                              checksum=checksum, file_size=len(content))
+        return ButlerURI(path), ref, info
+
+    def testDisabled(self):
+        cache = DatastoreCacheManager()
+        self.assertFalse(cache.enabled)
+        self.assertFalse(cache.shouldBeCached(ButlerURI("s3://bucket/file.yaml")))
+        cache = DatastoreCacheManager({"root": self.cacheRoot})
+        self.assertTrue(cache.enabled)
+        self.assertTrue(cache.shouldBeCached(ButlerURI("s3://bucket/file.yaml")))
+        self.assertFalse(cache.shouldBeCached(ButlerURI(os.path.join(self.root, "file.yaml"))))
+
+    def testHitsAndMisses(self):
+        cache = DatastoreCacheManager({"root": self.cacheRoot})
+        uri, ref, info = self.makeArtifact(1, b"first")
+        for _ in range(2):
+            with cache.get(uri, ref, info) as local:
+                self.assertNotEqual(local, uri)
+                self.assertEqual(local.read(), b"first")
+            # The private copy handed to the reader has been cleaned up.
+            self.assertFalse(local.exists())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # The original is not needed once cached.
+        uri.remove()
+        with cache.get(uri, ref, info) as local:
+            self.assertEqual(local.read(), b"first")
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        # A record with a different checksum refers to a different artifact.
+        uri, _, info = self.makeArtifact(1, b"second", checksum="abc")
+        with cache.get(uri, ref, info) as local:
+            self.assertEqual(local.read(), b"second")
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        # Another manager with the same root sees the same files.
+        other = DatastoreCacheManager({"root": self.cacheRoot})
+        with other.get(uri, ref, info) as local:
+            self.assertEqual(local.read(), b"second")
+        self.assertEqual((other.hits, other.misses), (1, 0))
+
+    def testEviction(self):
+        cache = DatastoreCacheManager({"root": self.cacheRoot, "max_size": 25})
+        artifacts = [self.makeArtifact(visit, b"0123456789") for visit in range(3)]
+        for uri, ref, info in artifacts:
+            with cache.get(uri, ref, info) as local:
+                self.assertEqual(local.read(), b"0123456789")
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(os.listdir(self.cacheRoot)), 2)
+        # The first artifact is the one that was evicted.
+        uri, ref, info = artifacts[0]
+        with cache.get(uri, ref, info):
+            pass
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+
+    def testCorruptedFile(self):
+        cache = DatastoreCacheManager({"root": self.cacheRoot})
+        uri, ref, info = self.makeArtifact(1, b"complete")
+        with cache.get(uri, ref, info):
+            pass
+        # Truncate the cached copy; it should be replaced, not returned.
+        (cached,) = os.listdir(self.cacheRoot)
+        with open(os.path.join(self.cacheRoot, cached), "wb") as fh:
+            fh.write(b"comp")
+        with self.assertLogs("lsst.daf.butler.core.datastoreCacheManager", level="WARNING"):
+            with cache.get(uri, ref, info) as local:
+                self.assertEqual(local.read(), b"complete")
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        with cache.get(uri, ref, info) as local:
+            self.assertEqual(local.read(), b"complete")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def testStaleFiles(self):
+        os.makedirs(self.cacheRoot)
+        stale = os.path.join(self.cacheRoot, ".reading-stale.txt")
+        recent = os.path.join(self.cacheRoot, ".staging-recent")
+        with open(stale, "wb") as fh:
+            fh.write(b"partial")
+        time.sleep(0.2)
+        with open(recent, "wb") as fh:
+            fh.write(b"partial")
+        # Change times cannot be set directly, so choose the age limit to
+        # fall between those of the two files.
+        middle = (os.stat(stale).st_ctime + os.stat(recent).st_ctime) / 2
+        with unittest.mock.patch.object(DatastoreCacheManager, "staleAge", time.time() - middle):
+            DatastoreCacheManager({"root": self.cacheRoot})
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(recent))
+
+if __name__ == "__main__":
+    unittest.main()
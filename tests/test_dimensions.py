@@ -28,8 +28,14 @@ from random import Random
 import itertools
 from typing import Iterator, Optional
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from lsst.daf.butler import (
     DataCoordinate,
+    DataCoordinateBatch,
     DataCoordinateSequence,
     DataCoordinateSet,
     Dimension,
@@ -462,6 +468,27 @@ class DataCoordinateTestCase(unittest.TestCase):
             self.assertNotEqual(a1, b0.byName())
             self.assertNotEqual(a1.byName(), b0)
 
+    def testHashing(self):
+        """Test that `DataCoordinate` instances with different state flags
+        hash consistently, also after pickling, and work as set members.
+        """
+        dataIds = self.randomDataIds(n=10)
+        split = self.splitByStateFlags(dataIds)
+        for dataId in split.chain():
+            with self.subTest(dataId=dataId):
+                expected = hash((dataId.graph,) + tuple(dataId[d.name] for d in dataId.graph.required))
+                self.assertEqual(hash(dataId), expected)
+                # Twice, to use the cached value.
+                self.assertEqual(hash(dataId), expected)
+                dataId2 = pickle.loads(pickle.dumps(dataId))
+                self.assertEqual(dataId2, dataId)
+                self.assertEqual(hash(dataId2), expected)
+                self.assertEqual(dataId2.hasFull(), dataId.hasFull())
+                self.assertEqual(dataId2.hasRecords(), dataId.hasRecords())
+        self.assertEqual(set(split.minimal), set(split.expanded))
+        self.assertEqual({dataId: n for n, dataId in enumerate(split.complete)},
+                         {dataId: n for n, dataId in enumerate(split.expanded)})
+
     def testStandardize(self):
         """Test constructing a DataCoordinate from many different kinds of
         input via `DataCoordinate.standardize` and `DataCoordinate.subset`.
@@ -673,6 +700,52 @@ class DataCoordinateTestCase(unittest.TestCase):
         self.assertEqual(a ^ b, a.symmetric_difference(b))
         self.assertGreaterEqual(a ^ b, (a | b) - (a & b))
 
+    @unittest.skipIf(np is None, "NumPy is not available.")
+    def testBatch(self):
+        """Test that DataCoordinateBatch operations are consistent with the
+        equivalent operations on DataCoordinate objects.
+        """
+        dataIds = self.randomDataIds(n=20)
+        split = self.splitByStateFlags(dataIds, expanded=False)
+        for original in (split.complete, split.minimal):
+            batch = DataCoordinateBatch.fromDataIds(original, original.graph)
+            self.assertEqual(len(batch), len(original))
+            self.assertEqual(batch.graph, original.graph)
+            self.assertEqual(batch.hasFull(), original.hasFull())
+            self.assertFalse(batch.hasRecords())
+            self.assertEqual(list(batch), list(original))
+            self.assertEqual([batch[i] for i in range(len(batch))], list(original))
+            self.assertEqual(list(batch[2:5]), list(original[2:5]))
+            self.assertEqual(batch.toSet(), original.toSet())
+            for name, column in batch.columns().items():
+                self.assertEqual(column.tolist(), [dataId[name] for dataId in original])
+                self.assertFalse(column.flags.writeable)
+            self.assertEqual(list(pickle.loads(pickle.dumps(batch))), list(original))
+            # unique() keeps the first occurrence of each data ID, in order.
+            doubled = DataCoordinateBatch.fromDataIds(list(original) + list(original), original.graph)
+            self.assertEqual(list(doubled.unique()), list(dict.fromkeys(original)))
+            self.assertEqual(list(batch.sorted()), sorted(original))
+            for _ in range(3):
+                graph = self.randomDimensionSubset(n=2, graph=original.graph)
+                self.assertEqual(list(batch.subset(graph)), list(original.subset(graph)))
+        # Joining two batches on their common dimensions should reproduce the
+        # full data IDs they were subset from.
+        batch = DataCoordinateBatch.fromDataIds(split.complete, dataIds.graph).unique()
+        visits = DimensionGraph(dataIds.universe, names=["visit", "detector"])
+        patches = DimensionGraph(dataIds.universe, names=["tract", "patch", "detector"])
+        joined = batch.subset(visits).unique().join(batch.subset(patches).unique())
+        self.assertEqual(joined.graph, dataIds.graph)
+        self.assertLessEqual(set(batch), set(joined))
+        for dataId in joined:
+            self.assertIn(dataId.subset(visits), set(batch.subset(visits)))
+            self.assertIn(dataId.subset(patches), set(batch.subset(patches)))
+        # Joins with no common dimensions are cartesian products.
+        detectors = batch.subset(DimensionGraph(dataIds.universe, names=["detector"])).unique()
+        tracts = batch.subset(DimensionGraph(dataIds.universe, names=["tract"])).unique()
+        self.assertEqual(len(detectors.join(tracts)), len(detectors)*len(tracts))
+        with self.assertRaises(ValueError):
+            DataCoordinateBatch({}, dataIds.graph)
+
 
 if __name__ == "__main__":
     unittest.main()
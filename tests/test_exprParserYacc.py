@@ -26,7 +26,8 @@ import unittest
 
 import astropy.time
 
-from lsst.daf.butler.registry.queries.expressions import exprTree, TreeVisitor, ParserYacc, ParseError
+from lsst.daf.butler.registry.queries.expressions import (exprTree, TreeVisitor, ParserYacc, ParseError,
+                                                          parseExpression)
 from lsst.daf.butler.registry.queries.expressions.parser.parserYacc import _parseTimeString
 
 
@@ -558,6 +559,30 @@ class ParserLexTestCase(unittest.TestCase):
         result = tree.visit(visitor)
         self.assertEqual(result, "B(ID(time) > T(2020-03-30 00:00:00.000))")
 
+    def testSharedTables(self):
+        """Test that parsers sharing parsing tables are independent.
+        """
+        parser1 = ParserYacc()
+        parser2 = ParserYacc(idMap={"a": exprTree.NumericLiteral("1")})
+        self.assertIs(parser1.parser.action, parser2.parser.action)
+        self.assertIsNot(parser1.parser, parser2.parser)
+
+        self.assertEqual(str(parser1.parse("a + b")), "a + b")
+        self.assertEqual(str(parser2.parse("a + b")), "1 + b")
+        with self.assertRaises(ParseError):
+            parser2.parse("a = = b")
+        self.assertEqual(str(parser1.parse("(a)")), "(a)")
+
+    def testParseExpression(self):
+        """Test for parseExpression function and its cache.
+        """
+        tree = parseExpression("a = 1 AND b IN (1..5)")
+        self.assertEqual(str(tree), "a = 1 AND b IN (1..5)")
+        self.assertIs(parseExpression("a = 1 AND b IN (1..5)"), tree)
+        self.assertIsNone(parseExpression(""))
+        with self.assertRaises(ParseError):
+            parseExpression("a = = 1")
+
     def testParseTimeStr(self):
         """Test for _parseTimeString method"""
 
@@ -168,6 +168,30 @@ class FormatterFactoryTestCase(unittest.TestCase, DatasetTestHelper):
             self.factory.registerFormatter(storageClassName,
                                            "lsst.daf.butler.formatters.json.JsonFormatter")
 
+    def testRegistryCache(self):
+        """Test that cached lookups are invalidated by new registrations.
+        """
+        sc = StorageClass("TestCacheClass", dict, None)
+        datasetType = DatasetType("cached", self.universe.empty, sc)
+        self.factory.registerFormatter(sc, "lsst.daf.butler.formatters.yaml.YamlFormatter")
+        key, fcls = self.factory.getFormatterWithMatch(datasetType, self.fileDescriptor, self.dataId)
+        self.assertEqual(key.name, sc.name)
+        self.assertEqual(fcls.name(), "lsst.daf.butler.formatters.yaml.YamlFormatter")
+        # Repeated lookups give the same answer.
+        self.assertIs(self.factory.getFormatterClass(datasetType), type(fcls))
+
+        # A registration with a higher priority key must take effect.
+        self.factory.registerFormatter(datasetType, "lsst.daf.butler.formatters.json.JsonFormatter")
+        key, fcls = self.factory.getFormatterClassWithMatch(datasetType)[:2]
+        self.assertEqual(key.name, datasetType.name)
+        self.assertEqual(fcls.name(), "lsst.daf.butler.formatters.json.JsonFormatter")
+
+        # As must an overwrite of the entry that was previously matched.
+        self.factory.registerFormatter(datasetType, "lsst.daf.butler.formatters.pickle.PickleFormatter",
+                                       overwrite=True)
+        self.assertEqual(self.factory.getFormatterClass(datasetType).name(),
+                         "lsst.daf.butler.formatters.pickle.PickleFormatter")
+
     def testRegistryConfig(self):
         configFile = os.path.join(TESTDIR, "config", "basic", "posixDatastore.yaml")
         config = Config(configFile)
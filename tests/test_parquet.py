@@ -34,7 +34,19 @@ try:
 except ImportError:
     pyarrow = None
 
-from lsst.daf.butler import Butler, DatasetType
+try:
+    import boto3
+    from moto import mock_s3
+except ImportError:
+    boto3 = None
+
+    def mock_s3(cls):
+        """A no-op decorator in case moto mock_s3 can not be imported.
+        """
+        return cls
+
+from lsst.daf.butler import Butler, ButlerURI, Config, DatasetType
+from lsst.daf.butler.core._butlerUri.s3utils import setAwsEnvCredentials, unsetAwsEnvCredentials
 from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
 
 
@@ -79,6 +91,18 @@ class ParquetFormatterTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.butler.get(self.datasetType, dataId={}, parameters={"columns": ["d"]})
 
+    def testRangedRead(self):
+        columns1 = pd.Index(["a", "b", "c"])
+        df1 = pd.DataFrame(np.random.randn(5, 3), index=np.arange(5, dtype=int), columns=columns1)
+        self.butler.put(df1, self.datasetType, dataId={})
+        uri = self.butler.getURI(self.datasetType, dataId={})
+        # Use the generic ranged reader, as remote datastores would, rather
+        # than the shortcut for local files.
+        from lsst.daf.butler.formatters.parquet import _ParquetLoader
+        with ButlerURI.open_ranged(uri, bufferSize=64) as stream:
+            df2 = _ParquetLoader(stream).read(columns=["a", "c"])
+        self.assertTrue(df1.loc[:, ["a", "c"]].equals(df2))
+
     def testMultiIndexDataFrame(self):
         columns1 = pd.MultiIndex.from_tuples(
             [
@@ -114,5 +138,53 @@ class ParquetFormatterTestCase(unittest.TestCase):
             self.butler.get(self.datasetType, dataId={}, parameters={"columns": ["d"]})
 
 
+@unittest.skipUnless(pyarrow is not None, "Cannot test ParquetFormatter without pyarrow.")
+@unittest.skipIf(not boto3, "Warning: boto3 AWS SDK not found!")
+@mock_s3
+class S3ParquetFormatterTestCase(ParquetFormatterTestCase):
+    """Tests for ParquetFormatter, using an S3 datastore with no local cache,
+    so that both whole and partial reads use remote streams.
+    """
+
+    bucketName = "anybucketname"
+
+    def setUp(self):
+        # Set up some fake credentials if they do not exist.
+        self.usingDummyCredentials = setAwsEnvCredentials()
+        s3 = boto3.resource("s3")
+        s3.create_bucket(Bucket=self.bucketName)
+        # The registry database must be local.
+        self.root = makeTestTempDir(TESTDIR)
+        config = Config()
+        config["registry", "db"] = f"sqlite:///{self.root}/gen3.sqlite3"
+        rooturi = f"s3://{self.bucketName}/butlerRoot/"
+        Butler.makeRepo(rooturi, config=config)
+        self.butler = Butler(rooturi, run="test_run")
+        self.datasetType = DatasetType("data", dimensions=(), storageClass="DataFrame",
+                                       universe=self.butler.registry.dimensions)
+        self.butler.registry.registerDatasetType(self.datasetType)
+
+    def tearDown(self):
+        bucket = boto3.resource("s3").Bucket(self.bucketName)
+        bucket.objects.all().delete()
+        bucket.delete()
+        # Unset any potentially set dummy credentials.
+        if self.usingDummyCredentials:
+            unsetAwsEnvCredentials()
+        removeTestTempDir(self.root)
+
+    def testRemoteRead(self):
+        columns1 = pd.Index(["a", "b", "c"])
+        df1 = pd.DataFrame(np.random.randn(5, 3), index=np.arange(5, dtype=int), columns=columns1)
+        self.butler.put(df1, self.datasetType, dataId={})
+        uri = self.butler.getURI(self.datasetType, dataId={})
+        self.assertEqual(uri.scheme, "s3")
+        self.assertFalse(self.butler.datastore.cacheManager.shouldBeCached(uri))
+        # A whole read needs the footer as well as the data, so must not use
+        # a forward-only stream; it is done with a single download.
+        df2 = self.butler.get(self.datasetType, dataId={})
+        self.assertTrue(df1.equals(df2))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -19,7 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import unittest
+import unittest.mock
 
 try:
     import boto3
@@ -94,6 +96,17 @@ class S3UtilsTestCase(unittest.TestCase):
         self.assertTrue(s3CheckFileExists(uri, client=self.client))
         self.assertTrue(s3CheckFileExists(uri))
 
+    def testClientCache(self):
+        # Clients are reused while the configuration is unchanged.
+        self.assertIs(getS3Client(), self.client)
+        with unittest.mock.patch.dict(os.environ, {"S3_MAX_POOL_CONNECTIONS": "3"}):
+            client = getS3Client()
+            self.assertIsNot(client, self.client)
+            self.assertEqual(client.meta.config.max_pool_connections, 3)
+            self.assertIs(getS3Client(), client)
+            self.assertTrue(bucketExists(self.bucketName, client=client))
+        self.assertIs(getS3Client(), self.client)
+
 
 if __name__ == "__main__":
     unittest.main()
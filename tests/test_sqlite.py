@@ -134,6 +134,91 @@ class SqliteFileDatabaseTestCase(unittest.TestCase, DatabaseTests):
         # aggressive locking strategy there.
         pass
 
+    def testEngineOptions(self):
+        """Test PRAGMA settings, connection pooling, and concurrent read-only
+        transactions.
+        """
+        _, filename = tempfile.mkstemp(dir=self.root, suffix=".sqlite3")
+        pragmas = {"journal_mode": "WAL", "synchronous": "NORMAL", "cache_size": -4096,
+                   "temp_store": "MEMORY", "mmap_size": None}
+
+        def getPragma(engine, name):
+            with engine.connect() as connection:
+                return connection.execute(f"PRAGMA {name}").scalar()
+
+        rwEngine = SqliteDatabase.makeEngine(filename=filename, pragmas=pragmas, poolSize=2)
+        self.assertIsInstance(rwEngine.pool, sqlalchemy.pool.QueuePool)
+        self.assertEqual(getPragma(rwEngine, "journal_mode"), "wal")
+        self.assertEqual(getPragma(rwEngine, "synchronous"), 1)
+        self.assertEqual(getPragma(rwEngine, "cache_size"), -4096)
+        self.assertEqual(getPragma(rwEngine, "temp_store"), 2)
+        db = SqliteDatabase.fromEngine(rwEngine, origin=0)
+        with db.declareStaticTables(create=True) as context:
+            table = context.addTable(
+                "a",
+                ddl.TableSpec(fields=[ddl.FieldSpec("b", dtype=sqlalchemy.Integer, primaryKey=True)])
+            )
+        db.insert(table, {"b": 1})
+
+        # journal_mode can't be set on a read-only connection, but is
+        # persistent, and the other settings still apply.
+        roEngine = SqliteDatabase.makeEngine(filename=filename, writeable=False, pragmas=pragmas)
+        self.assertEqual(getPragma(roEngine, "journal_mode"), "wal")
+        self.assertEqual(getPragma(roEngine, "cache_size"), -4096)
+
+        # Transactions on read-only connections must not block each other, or
+        # a writer.
+        ro1 = SqliteDatabase.fromEngine(roEngine, origin=0, writeable=False)
+        ro2 = SqliteDatabase.fromEngine(
+            SqliteDatabase.makeEngine(filename=filename, writeable=False), origin=0, writeable=False
+        )
+        with ro1.transaction():
+            with ro2.transaction():
+                for ro in (ro1, ro2):
+                    self.assertEqual(ro.query(sqlalchemy.sql.select([table.columns.b])).scalar(), 1)
+                db.insert(table, {"b": 2})
+
+        with self.assertRaises(ValueError):
+            SqliteDatabase.makeEngine(filename=filename, pragmas={"foreign_keys": "OFF"})
+        with self.assertRaises(ValueError):
+            SqliteDatabase.makeEngine(filename=filename, pragmas={"journal_mode": "WAL; DROP TABLE a"})
+
+    def testPooledConnections(self):
+        """Test that pooled connections do not leak temporary tables between
+        sessions, and that unfinished query iterators do not exhaust the pool.
+        """
+        _, filename = tempfile.mkstemp(dir=self.root, suffix=".sqlite3")
+        # Without a poolSize, connections are not reused.
+        self.assertNotIsInstance(SqliteDatabase.makeEngine(filename=filename).pool, sqlalchemy.pool.QueuePool)
+        db = SqliteDatabase.fromEngine(SqliteDatabase.makeEngine(filename=filename, poolSize=1), origin=0)
+        spec = ddl.TableSpec(fields=[ddl.FieldSpec("b", dtype=sqlalchemy.Integer, primaryKey=True)])
+        with db.declareStaticTables(create=True) as context:
+            table = context.addTable("a", spec)
+        db.insert(table, *[{"b": b} for b in range(5)])
+
+        def countTempTables(connection):
+            return connection.execute("SELECT COUNT(*) FROM sqlite_temp_master WHERE type = 'table'").scalar()
+
+        with db.session() as session:
+            session.makeTemporaryTable(spec, name="tmp_a")
+            connection = db._session_connection.connection.connection
+            self.assertEqual(countTempTables(connection), 1)
+        # The same DBAPI connection is handed out again, without the table.
+        with db.session() as session:
+            self.assertIs(db._session_connection.connection.connection, connection)
+            self.assertEqual(countTempTables(connection), 0)
+            # The name can be reused now that the table is gone.
+            session.makeTemporaryTable(spec, name="tmp_a")
+
+        # Iterators that are never exhausted keep their connections checked
+        # out; that must not block later queries.
+        iterators = [db.streamQuery(table.select(), batchSize=1) for _ in range(3)]
+        for iterator in iterators:
+            next(iterator)
+        self.assertEqual(len(list(db.streamQuery(table.select()))), 5)
+        for iterator in iterators:
+            iterator.close()
+
 
 class SqliteMemoryDatabaseTestCase(unittest.TestCase, DatabaseTests):
     """Tests for `SqliteDatabase` using an in-memory database.
@@ -266,6 +266,29 @@ class TestFileTemplates(unittest.TestCase):
         tmpl = templates.getTemplate(ref2)
         self.assertEqual(tmpl.template, default)
 
+    def testCachedMatches(self):
+        """Test that cached template matches are the same as uncached ones
+        for instrument-qualified lookup keys.
+        """
+        config = FileTemplatesConfig(os.path.join(TESTDIR, "config", "templates",
+                                                  "templates-nodefault.yaml"))
+        refs = [self.makeDatasetRef(name, dataId={"instrument": instrument, "physical_filter": "z"},
+                                    storageClassName=storageClassName)
+                for name, storageClassName in (("pvi", "DefaultStorageClass"), ("pvix", "StorageClassX"))
+                for instrument in ("HSC", "LSST", "HSC")]
+        uncached = FileTemplates(config, universe=self.universe)
+        expected = []
+        for ref in refs:
+            uncached._matchCache.clear()
+            expected.append(uncached.getTemplateWithMatch(ref))
+        self.assertNotEqual(expected[0], expected[1])
+        self.assertEqual(expected[0], expected[2])
+        # The results must not depend on the order of the lookups.
+        for ordered in (refs, refs[::-1]):
+            templates = FileTemplates(config, universe=self.universe)
+            results = [templates.getTemplateWithMatch(ref) for ref in ordered]
+            self.assertEqual(results, expected if ordered is refs else expected[::-1])
+
     def testValidation(self):
         configRoot = os.path.join(TESTDIR, "config", "templates")
         config1 = FileTemplatesConfig(os.path.join(configRoot, "templates-nodefault.yaml"))
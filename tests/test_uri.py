@@ -68,6 +68,45 @@ class FileURITestCase(unittest.TestCase):
         self.assertTrue(uri.exists(), f"{uri} should now exist")
         self.assertEqual(uri.read().decode(), content)
 
+    def testOpen(self):
+        uri = ButlerURI(os.path.join(self.tmpdir, "subdir", "test.txt"))
+        content = b"abcdefghijklmnopqrstuv\n" * 10
+        with uri.open("wb", bufferSize=7) as stream:
+            stream.write(content)
+        self.assertEqual(uri.read(), content)
+        with uri.open("rb", bufferSize=7) as stream:
+            self.assertEqual(stream.read(5), content[:5])
+            self.assertEqual(stream.read(), content[5:])
+
+        # A failed write leaves the original contents in place.
+        with self.assertRaises(RuntimeError):
+            with uri.open("wb") as stream:
+                stream.write(b"partial")
+                raise RuntimeError("Failed write")
+        self.assertEqual(uri.read(), content)
+        self.assertEqual(os.listdir(os.path.dirname(uri.ospath)), ["test.txt"])
+
+        with self.assertRaises(ValueError):
+            with uri.open("r"):
+                pass
+
+    def testReadRange(self):
+        uri = ButlerURI(os.path.join(self.tmpdir, "test.txt"))
+        content = bytes(range(256)) * 4
+        uri.write(content)
+        self.assertEqual(uri.read_range(10, 20), content[10:30])
+        self.assertEqual(uri.read_range(1020, 20), content[1020:])
+        self.assertEqual(uri.read_range(2000, 20), b"")
+        self.assertEqual(uri.read_range(10, 0), b"")
+
+        # Use the generic ranged reader rather than the local file shortcut.
+        with ButlerURI.open_ranged(uri, bufferSize=16) as stream:
+            stream.seek(-4, os.SEEK_END)
+            self.assertEqual(stream.read(), content[-4:])
+            stream.seek(100)
+            self.assertEqual(stream.read(50), content[100:150])
+            self.assertEqual(stream.tell(), 150)
+
     def testRelative(self):
         """Check that we can get subpaths back from two URIs"""
         parent = ButlerURI(self.tmpdir, forceDirectory=True, forceAbsolute=True)
@@ -349,6 +388,39 @@ class S3URITestCase(unittest.TestCase):
         s3write.write(content.encode())
         self.assertEqual(s3write.read().decode(), content)
 
+    def testOpen(self):
+        uri = ButlerURI(self.makeS3Uri("streamed.txt"))
+        content = b"abcdefghijklmnopqrstuv\n" * 10
+        with uri.open("wb") as stream:
+            stream.write(content)
+        self.assertEqual(uri.read(), content)
+        with uri.open("rb", bufferSize=7) as stream:
+            self.assertEqual(stream.read(5), content[:5])
+            self.assertEqual(stream.read(), content[5:])
+
+        # Nothing is uploaded if the write fails.
+        failed = ButlerURI(self.makeS3Uri("failed.txt"))
+        with self.assertRaises(RuntimeError):
+            with failed.open("wb") as stream:
+                stream.write(content)
+                raise RuntimeError("Failed write")
+        self.assertFalse(failed.exists())
+        with self.assertRaises(FileNotFoundError):
+            with failed.open("rb"):
+                pass
+
+    def testReadRange(self):
+        uri = ButlerURI(self.makeS3Uri("ranged.bin"))
+        content = bytes(range(256)) * 4
+        uri.write(content)
+        self.assertEqual(uri.read_range(10, 20), content[10:30])
+        self.assertEqual(uri.read_range(1020, 20), content[1020:])
+        with uri.open_ranged(bufferSize=16) as stream:
+            stream.seek(500)
+            self.assertEqual(stream.read(10), content[500:510])
+            stream.seek(0)
+            self.assertEqual(stream.read(), content)
+
     def testRelative(self):
         """Check that we can get subpaths back from two URIs"""
         parent = ButlerURI(self.makeS3Uri("rootdir"), forceDirectory=True)
@@ -498,6 +570,39 @@ class WebdavURITestCase(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             self.notExistingFileButlerURI.read()
 
+    @responses.activate
+    def testOpen(self):
+
+        with self.existingFileButlerURI.open("rb", bufferSize=4) as stream:
+            self.assertEqual(stream.read().decode(), "It works!")
+        with self.assertRaises(FileNotFoundError):
+            with self.notExistingFileButlerURI.open("rb"):
+                pass
+        with self.existingFileButlerURI.open("wb") as stream:
+            stream.write(str.encode("Some content."))
+
+    @responses.activate
+    def testReadRange(self):
+
+        # The mock server ignores the Range header.
+        self.assertEqual(self.existingFileButlerURI.read_range(3, 5).decode(), "works")
+        with self.assertRaises(FileNotFoundError):
+            self.notExistingFileButlerURI.read_range(0, 5)
+
+        # A ranged stream on such a server downloads the resource only once.
+        content = b"abcdefghijklmnopqrstuv"
+        ranged = self.existingFolderButlerURI.join("ranged")
+        responses.add(responses.HEAD, ranged.geturl(), status=200,
+                      headers={"Content-Length": str(len(content))})
+        responses.add(responses.GET, ranged.geturl(), status=200, body=content)
+        with ranged.open_ranged(bufferSize=4) as stream:
+            stream.seek(10)
+            self.assertEqual(stream.read(5), content[10:15])
+            stream.seek(0)
+            self.assertEqual(stream.read(), content)
+        self.assertEqual(len([call for call in responses.calls
+                              if call.request.method == "GET" and call.request.url == ranged.geturl()]), 1)
+
     @responses.activate
     def testWrite(self):
 